@@ -0,0 +1,89 @@
+"""Compare :class:`mazely.analytics.Analytics` against counting dead ends,
+junctions and straight corridors with Python loops over the cells.
+
+Run from the repository root:
+
+    $ python benchmarks/bench_analytics.py
+    $ python benchmarks/bench_analytics.py 256 2048
+
+The loops are only timed up to `LOOP_LIMIT` rows and columns. A batch of
+`BATCH` 64x64 mazes is also measured in one stacked array.
+"""
+
+import sys
+import time
+from collections import Counter
+
+import numpy as np
+
+from mazely import Maze, generate_batch
+from mazely.analytics import Analytics
+
+LOOP_LIMIT = 512
+BATCH = 1000
+
+
+def loop_analytics(grid: np.ndarray) -> tuple[int, int, Counter]:
+    """Count dead ends, junctions and straight corridors cell by cell."""
+    rows, columns = len(grid), len(grid[0])
+    east = [[column + 1 < columns and not grid[row][column][2]
+             and not grid[row][column + 1][3] for column in range(columns)]
+            for row in range(rows)]
+    south = [[row + 1 < rows and not grid[row][column][1]
+              and not grid[row + 1][column][0] for column in range(columns)]
+             for row in range(rows)]
+    dead_ends = junctions = 0
+    for row in range(rows):
+        for column in range(columns):
+            sides = (east[row][column] + south[row][column]
+                     + (column > 0 and east[row][column - 1])
+                     + (row > 0 and south[row - 1][column]))
+            dead_ends += sides == 1
+            junctions += sides >= 3
+
+    corridors = Counter()
+    lines = east + [[south[row][column] for row in range(rows)]
+                    for column in range(columns)]
+    for line in lines:
+        run = 0
+        for passage in line + [False]:
+            if passage:
+                run += 1
+            elif run:
+                corridors[run + 1] += 1
+                run = 0
+    return dead_ends, junctions, corridors
+
+
+def measure(analytics: Analytics) -> float:
+    """Get the time to compute every measure of fresh analytics."""
+    began = time.perf_counter()
+    analytics.dead_ends()
+    analytics.junctions()
+    analytics.corridor_lengths()
+    return time.perf_counter() - began
+
+
+def main(sizes: list[int]):
+    for size in sizes:
+        grid = Maze(size, size, seed=0).grid
+        if size <= LOOP_LIMIT:
+            began = time.perf_counter()
+            loop_analytics(grid)
+            elapsed = time.perf_counter() - began
+            print(f"{size}x{size}: loops     {elapsed * 1e3:10.1f} ms")
+
+        began = time.perf_counter()
+        analytics = Analytics(grid)
+        elapsed = time.perf_counter() - began + measure(analytics)
+        print(f"{size}x{size}: Analytics {elapsed * 1e3:10.1f} ms")
+
+    grids = generate_batch(64, 64, range(BATCH), packed=True)
+    began = time.perf_counter()
+    analytics = Analytics(grids)
+    elapsed = time.perf_counter() - began + measure(analytics)
+    print(f"{BATCH} x 64x64: Analytics {elapsed * 1e3:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [64, 256, 1024])
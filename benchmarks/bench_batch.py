@@ -0,0 +1,38 @@
+"""Measure how the throughput of :func:`mazely.generate_batch` scales with
+the number of worker processes.
+
+Run from the repository root:
+
+    $ python benchmarks/bench_batch.py
+    $ python benchmarks/bench_batch.py 32 10000
+
+The arguments are the size of each maze and the number of mazes. The mazes
+are timed with 1 worker, then with each power of 2 up to the number of CPUs,
+and with the number of CPUs itself.
+"""
+
+import os
+import sys
+import time
+
+from mazely import generate_batch
+
+
+def main(size: int, count: int):
+    cpus = os.cpu_count() or 1
+    counts = sorted({cpus} | {2 ** power
+                              for power in range(cpus.bit_length())})
+    serial = None
+    for workers in counts:
+        began = time.perf_counter()
+        generate_batch(size, size, range(count), workers=workers, packed=True)
+        elapsed = time.perf_counter() - began
+        serial = serial or elapsed
+        print(f"{count} mazes of {size}x{size}, {workers:>3} workers: "
+              f"{elapsed:8.2f} s ({count / elapsed:,.0f} mazes/s, "
+              f"{serial / elapsed:.2f}x)")
+
+
+if __name__ == "__main__":
+    arguments = [int(argument) for argument in sys.argv[1:]]
+    main(*arguments or [32, 2000])
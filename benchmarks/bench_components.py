@@ -0,0 +1,58 @@
+"""Compare answering unreachable goals with :meth:`mazely.Maze.solve`, which
+labels the groups of connected cells after the first failed search, against
+searching for every goal with :class:`mazely.algorithms.ShortestPath`.
+
+Run from the repository root:
+
+    $ python benchmarks/bench_components.py
+    $ python benchmarks/bench_components.py 256 2048
+
+Each maze has every wall of one cell closed, and `QUERIES` start cells try to
+reach it.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from mazely import Maze
+from mazely.algorithms import ShortestPath
+from mazely.components import Components
+
+QUERIES = 10
+
+
+def main(sizes: list[int]):
+    solver = ShortestPath()
+    for size in sizes:
+        maze = Maze(size, size, seed=0, packed=True)
+        goal = (size // 2, size // 2)
+        for neighbor in ((goal[0] - 1, goal[1]), (goal[0] + 1, goal[1]),
+                         (goal[0], goal[1] - 1), (goal[0], goal[1] + 1)):
+            maze.add_wall(goal, neighbor)
+        maze.set_goal_cell(*goal)
+        starts = np.random.default_rng(0).integers(0, size, (QUERIES, 2))
+
+        began = time.perf_counter()
+        for start in starts.tolist():
+            assert solver.solve(maze.grid, tuple(start), {goal}) is None
+        elapsed = time.perf_counter() - began
+        print(f"{size}x{size}: search every query {elapsed:8.3f} s")
+
+        began = time.perf_counter()
+        for start in starts.tolist():
+            maze.set_start_cell(*start)
+            assert maze.solve() is None
+        elapsed = time.perf_counter() - began
+        print(f"{size}x{size}: Maze.solve         {elapsed:8.3f} s")
+
+        began = time.perf_counter()
+        components = Components(maze.grid)
+        elapsed = time.perf_counter() - began
+        print(f"{size}x{size}: labeling alone     {elapsed:8.3f} s "
+              f"({len(components.sizes)} groups)")
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [256, 1024, 2048])
@@ -0,0 +1,51 @@
+"""Compare the throughput of the maze generators in
+:mod:`mazely.algorithms`.
+
+Eller's algorithm is also timed streaming its rows straight to a binary file,
+without ever holding the whole grid.
+
+Run from the repository root:
+
+    $ python benchmarks/bench_generation.py
+    $ python benchmarks/bench_generation.py 256 1024
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from mazely.algorithms import Eller, Kruskal, RecursiveBacktracking
+from mazely.maze_file import write_binary_rows
+
+
+def report(size: int, name: str, elapsed: float):
+    print(f"{size}x{size}: {name:<28} {size * size:>10} cells in "
+          f"{elapsed:8.2f} s ({size * size / elapsed:,.0f} cells/s)")
+
+
+def main(sizes: list[int]):
+    generators = [RecursiveBacktracking(packed=True), Kruskal(packed=True),
+                  Eller(packed=True)]
+    recursion_limit = sys.getrecursionlimit()
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "maze.bin")
+        for size in sizes:
+            for generator in generators:
+                start = time.perf_counter()
+                generator.generate(size, size, seed=0)
+                report(size, type(generator).__name__,
+                       time.perf_counter() - start)
+
+            start = time.perf_counter()
+            write_binary_rows(file_path, size, size,
+                              Eller().iter_rows(size, size, seed=0), (0, 0),
+                              {(size - 1, size - 1)}, 0, "Eller")
+            report(size, "Eller streamed to a file",
+                   time.perf_counter() - start)
+    assert sys.getrecursionlimit() == recursion_limit
+
+
+if __name__ == "__main__":
+    # 62.5K, 1M and 16M cells by default.
+    main([int(size) for size in sys.argv[1:]] or [250, 1000, 4000])
@@ -0,0 +1,68 @@
+"""Measure the time and memory it takes to import :mod:`mazely`.
+
+Run from the repository root:
+
+    $ python benchmarks/bench_import.py
+    $ python benchmarks/bench_import.py 150
+
+Each import runs in a fresh interpreter. Importing NumPy alone and importing
+Matplotlib's pyplot along with mazely are measured for comparison. If a limit
+in milliseconds is given, the script fails when the median import time of
+mazely exceeds it. It always fails if importing mazely imports Matplotlib.
+"""
+
+import statistics
+import subprocess
+import sys
+
+RUNS = 10
+
+# Printed by each interpreter: its import time in seconds, its peak resident
+# memory in kibibytes and whether Matplotlib was imported.
+PROBE = """
+import resource, sys, time
+began = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - began
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+      "matplotlib" in sys.modules)
+"""
+
+
+def measure(statement: str) -> tuple[float, float, bool]:
+    """Get the median import time and memory of a statement over fresh
+    interpreters."""
+    times = []
+    memory = []
+    for _ in range(RUNS):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(statement=statement)],
+            capture_output=True, text=True, check=True
+        ).stdout.split()
+        times.append(float(output[0]))
+        memory.append(int(output[1]))
+    return (statistics.median(times), statistics.median(memory),
+            output[2] == "True")
+
+
+def main(limit: float | None):
+    results = {}
+    for label, statement in (
+        ("numpy", "import numpy"),
+        ("mazely", "import mazely"),
+        ("mazely + pyplot", "import mazely, matplotlib.pyplot"),
+    ):
+        elapsed, memory, matplotlib = measure(statement)
+        results[label] = (elapsed, matplotlib)
+        print(f"{label:<16} {elapsed * 1e3:8.1f} ms {memory / 1024:8.1f} MiB"
+              f"{'  (imports Matplotlib)' if matplotlib else ''}")
+
+    elapsed, matplotlib = results["mazely"]
+    if matplotlib:
+        sys.exit("Importing mazely imports Matplotlib.")
+    if limit is not None and elapsed * 1e3 > limit:
+        sys.exit(f"Importing mazely takes more than {limit} ms.")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else None)
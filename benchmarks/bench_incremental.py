@@ -0,0 +1,91 @@
+"""Compare re-solving with :class:`mazely.algorithms.IncrementalShortestPath`
+against solving from scratch with :class:`mazely.algorithms.ShortestPath`
+after random wall edits.
+
+Run from the repository root:
+
+    $ python benchmarks/bench_incremental.py
+    $ python benchmarks/bench_incremental.py 1024 10000
+
+Each edit either removes the wall between a random cell and a random neighbor,
+or adds back a wall removed earlier, so that the goal stays reachable. After
+each edit the maze is re-solved from the top-left to the bottom-right corner.
+Full recomputation is only timed for the first `FULL_LIMIT` edits and
+extrapolated to the rest.
+"""
+
+import random
+import sys
+import time
+
+from mazely import Maze
+from mazely.algorithms import IncrementalShortestPath, ShortestPath
+
+FULL_LIMIT = 200
+
+
+def random_edits(maze: Maze, count: int, seed: int = 0):
+    """Make random wall edits, yielding after each one."""
+    rng = random.Random(seed)
+    deltas = ((-1, 0), (1, 0), (0, 1), (0, -1))
+    removed = []
+    while count:
+        if removed and rng.random() < 0.5:
+            index = rng.randrange(len(removed))
+            removed[index], removed[-1] = removed[-1], removed[index]
+            maze.add_wall(*removed.pop())
+            count -= 1
+            yield
+            continue
+
+        cell = (rng.randrange(maze.rows), rng.randrange(maze.columns))
+        row_delta, column_delta = rng.choice(deltas)
+        neighbor = (cell[0] + row_delta, cell[1] + column_delta)
+        if not (0 <= neighbor[0] < maze.rows
+                and 0 <= neighbor[1] < maze.columns):
+            continue
+        if maze.grid[cell] >> deltas.index((row_delta, column_delta)) & 1:
+            maze.remove_wall(cell, neighbor)
+            removed.append((cell, neighbor))
+        count -= 1
+        yield
+
+
+def time_edits(maze: Maze, count: int, seed: int = 0) -> list[float]:
+    """Time re-solving the maze after each of a number of random edits."""
+    times = []
+    for _ in random_edits(maze, count, seed):
+        began = time.perf_counter()
+        maze.solve()
+        times.append(time.perf_counter() - began)
+    return times
+
+
+def report(label: str, times: list[float], edits: int):
+    """Print the total, median and 90th percentile time of the edits,
+    extrapolating the total to a number of edits."""
+    ordered = sorted(times)
+    total = sum(times) / len(times) * edits
+    print(f"{label:<28} {total:10.2f} s total, "
+          f"{ordered[len(ordered) // 2] * 1e3:8.3f} ms median, "
+          f"{ordered[len(ordered) * 9 // 10] * 1e3:8.3f} ms 90th percentile")
+
+
+def main(size: int, edits: int):
+    for solver, count in ((IncrementalShortestPath(), edits),
+                          (ShortestPath(), min(edits, FULL_LIMIT))):
+        maze = Maze(size, size, seed=0, solver=solver, packed=True)
+        maze.set_start_cell(0, 0)
+        maze.set_goal_cell(size - 1, size - 1)
+
+        began = time.perf_counter()
+        maze.solve()
+        print(f"{size}x{size}: {type(solver).__name__} first solve "
+              f"{time.perf_counter() - began:.2f} s")
+        report(f"{size}x{size}: {edits} edits", time_edits(maze, count, 0),
+               edits)
+
+
+if __name__ == "__main__":
+    arguments = [int(argument) for argument in sys.argv[1:]]
+    main(*arguments or [1024, 10000])
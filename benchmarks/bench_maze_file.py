@@ -0,0 +1,78 @@
+"""Compare :meth:`mazely.Maze.save_maze` against a writer that concatenates
+strings cell by cell, and time reading the file back with
+:meth:`mazely.Maze.load_maze`.
+
+Run from the repository root:
+
+    $ python benchmarks/bench_maze_file.py
+    $ python benchmarks/bench_maze_file.py 256 2048
+
+The per-cell writer is only timed up to 1024x1024, as it takes minutes beyond
+that.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from mazely import Maze
+
+PER_CELL_LIMIT = 1024
+
+
+def per_cell_save_maze(maze: Maze, path: str):
+    """Write a maze file one cell at a time."""
+    grid = maze.grid
+    text = "+"
+    for column in range(maze.columns):
+        text += ("---" if grid[0][column][0] else "   ") + "+"
+    text += "\n"
+    for row in range(maze.rows):
+        line = "|" if grid[row][0][3] else " "
+        border = "+"
+        for column in range(maze.columns):
+            if (row, column) == maze.start:
+                line += " S "
+            elif (row, column) in maze.goal:
+                line += " G "
+            else:
+                line += "   "
+            line += "|" if grid[row][column][2] else " "
+            border += ("---" if grid[row][column][1] else "   ") + "+"
+        text += line + "\n" + border + "\n"
+    with open(path, "w") as file:
+        file.write(text)
+
+
+def main(sizes: list[int]):
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "maze.maze")
+        for size in sizes:
+            maze = Maze(size, size, seed=0)
+
+            if size <= PER_CELL_LIMIT:
+                began = time.perf_counter()
+                per_cell_save_maze(maze, file_path)
+                elapsed = time.perf_counter() - began
+                print(f"{size}x{size}: per-cell writer  {elapsed:8.2f} s")
+
+            began = time.perf_counter()
+            maze.save_maze(file_path)
+            elapsed = time.perf_counter() - began
+            megabytes = os.path.getsize(file_path) / 2 ** 20
+            print(f"{size}x{size}: save_maze        {elapsed:8.2f} s "
+                  f"({megabytes:.1f} MiB, {megabytes / elapsed:.0f} MiB/s)")
+
+            began = time.perf_counter()
+            loaded = Maze(path=file_path)
+            elapsed = time.perf_counter() - began
+            print(f"{size}x{size}: load_maze        {elapsed:8.2f} s")
+            assert np.array_equal(loaded.grid, maze.grid)
+            assert loaded.start == maze.start and loaded.goal == maze.goal
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [256, 1024, 4096])
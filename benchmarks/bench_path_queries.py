@@ -0,0 +1,68 @@
+"""Compare answering many shortest-path queries on one perfect maze with
+:class:`mazely.PathQueries` against solving each query with
+:class:`mazely.algorithms.ShortestPath`.
+
+Run from the repository root:
+
+    $ python benchmarks/bench_path_queries.py
+    $ python benchmarks/bench_path_queries.py 256 2048
+
+Solving each query is only timed for the first `SOLVE_LIMIT` queries and
+extrapolated to the rest.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from mazely import Maze
+from mazely.algorithms import ShortestPath
+
+QUERIES = 10000
+PATHS = 100
+SOLVE_LIMIT = 20
+
+
+def main(sizes: list[int]):
+    solver = ShortestPath()
+    for size in sizes:
+        maze = Maze(size, size, seed=0, packed=True)
+        rng = np.random.default_rng(0)
+        starts = rng.integers(0, size, (QUERIES, 2))
+        goals = rng.integers(0, size, (QUERIES, 2))
+        pairs = list(zip(map(tuple, starts.tolist()),
+                         map(tuple, goals.tolist())))
+
+        began = time.perf_counter()
+        queries = maze.path_queries()
+        built = time.perf_counter() - began
+
+        began = time.perf_counter()
+        for start, goal in pairs:
+            queries.distance(start, goal)
+        one_by_one = time.perf_counter() - began
+
+        began = time.perf_counter()
+        queries.distances(starts, goals)
+        batched = time.perf_counter() - began
+
+        began = time.perf_counter()
+        for start, goal in pairs[:PATHS]:
+            queries.path(start, goal)
+        paths = (time.perf_counter() - began) / PATHS
+
+        began = time.perf_counter()
+        for start, goal in pairs[:SOLVE_LIMIT]:
+            solver.solve(maze.grid, start, {goal})
+        solved = (time.perf_counter() - began) / SOLVE_LIMIT
+
+        print(f"{size}x{size}: build {built:.2f} s; {QUERIES} distances "
+              f"{one_by_one:.3f} s one by one, {batched:.3f} s batched; "
+              f"path {paths * 1e3:.2f} ms; "
+              f"ShortestPath {solved * 1e3:.2f} ms per query "
+              f"({solved * QUERIES:.0f} s estimated for all)")
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [64, 256, 1024])
@@ -0,0 +1,83 @@
+"""Compare :class:`mazely.algorithms.ShortestPath` against the previous
+deque-and-set implementation of breadth-first search.
+
+Run from the repository root:
+
+    $ python benchmarks/bench_shortest_path.py
+    $ python benchmarks/bench_shortest_path.py 256 2048 8192
+
+The previous implementation is only timed up to 2048x2048, as it takes
+several gigabytes of memory beyond that.
+"""
+
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+from mazely.algorithms import RecursiveBacktracking, ShortestPath
+
+LEGACY_LIMIT = 2048
+
+
+def legacy_solve(grid, start, goal):
+    """The breadth-first search that `ShortestPath` used to run."""
+    queue = deque([start])
+    visited = set()
+    path = {}
+    index_delta = ((-1, 0), (1, 0), (0, 1), (0, -1))
+    while queue:
+        current = queue.popleft()
+        if current in goal:
+            solution_path = []
+            while current is not start:
+                solution_path.append(current)
+                current = path[current]
+            else:
+                solution_path.append(start)
+            solution_path.reverse()
+            return solution_path
+        visited.add(current)
+        for direction, wall in enumerate(grid[current[0]][current[1]]):
+            if not wall:
+                neighbor = (
+                    current[0] + index_delta[direction][0],
+                    current[1] + index_delta[direction][1],
+                )
+                if neighbor not in visited:
+                    queue.append(neighbor)
+                    path[neighbor] = current
+
+
+def measure(solve, grid, start, goal):
+    """Time a solve and trace its peak memory in a second run."""
+    began = time.perf_counter()
+    solution_path = solve(grid, start, goal)
+    elapsed = time.perf_counter() - began
+    tracemalloc.start()
+    solve(grid, start, goal)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return solution_path, elapsed, peak
+
+
+def main(sizes: list[int]):
+    solver = ShortestPath()
+    for size in sizes:
+        grid = RecursiveBacktracking().generate(size, size, seed=0)
+        start, goal = (0, 0), {(size - 1, size - 1)}
+
+        solution_path, elapsed, peak = measure(solver.solve, grid, start,
+                                               goal)
+        print(f"{size}x{size}: array BFS   {elapsed:8.2f} s "
+              f"{peak / 2 ** 20:8.1f} MiB")
+        if size <= LEGACY_LIMIT:
+            legacy_path, elapsed, peak = measure(legacy_solve, grid, start,
+                                                 goal)
+            assert legacy_path == solution_path
+            print(f"{size}x{size}: legacy BFS  {elapsed:8.2f} s "
+                  f"{peak / 2 ** 20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [256, 2048, 8192])
@@ -0,0 +1,62 @@
+"""Compare the memory held by a :class:`mazely.SolutionPath` against the
+same path as a list of tuples, and the time to turn each into an array of
+cell locations, as the image and SVG writers do.
+
+Run from the repository root:
+
+    $ python benchmarks/bench_solution_path.py
+    $ python benchmarks/bench_solution_path.py 256 2048
+
+Each maze is solved from one corner to the opposite corner.
+"""
+
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from mazely import Maze
+
+
+def retained(function) -> tuple[object, int]:
+    """Call a function and get its result and the memory the result
+    holds."""
+    tracemalloc.start()
+    try:
+        result = function()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, size
+
+
+def main(sizes: list[int]):
+    for size in sizes:
+        maze = Maze(size, size, seed=0, packed=True)
+        maze.set_start_cell(0, 0)
+        maze.set_goal_cell(size - 1, size - 1)
+
+        began = time.perf_counter()
+        solution_path = maze.solve()
+        elapsed = time.perf_counter() - began
+        print(f"{size}x{size}: solve {elapsed:.2f} s, "
+              f"{len(solution_path):,} cells")
+
+        solution_path, path_bytes = retained(lambda: maze.solver.solve(
+            maze.grid, maze.start, maze.goal))
+        tuples, list_bytes = retained(solution_path.tolist)
+        print(f"{size}x{size}: SolutionPath {path_bytes / 2 ** 20:8.2f} MiB, "
+              f"list of tuples {list_bytes / 2 ** 20:8.2f} MiB")
+
+        for name, path in (("SolutionPath", solution_path),
+                           ("list of tuples", tuples)):
+            began = time.perf_counter()
+            np.asarray(path, dtype=float)
+            elapsed = time.perf_counter() - began
+            print(f"{size}x{size}: {name:<14} to array "
+                  f"{elapsed * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [256, 1024, 2048])
@@ -0,0 +1,68 @@
+"""Compare solving a maze for many agents that share the goal cells with
+:meth:`mazely.algorithms.MazeSolver.solve_many` against calling
+:meth:`mazely.algorithms.ShortestPath.solve` for each agent.
+
+Run from the repository root:
+
+    $ python benchmarks/bench_solve_many.py
+    $ python benchmarks/bench_solve_many.py 256 1024
+
+Solving each agent is only timed for the first `SOLVE_LIMIT` agents and
+extrapolated to the rest. Whole paths are only found for up to `PATHS_LIMIT`
+agents, as they take gigabytes beyond that. The peak memory of finding the
+next step of every agent barely grows with the number of agents.
+"""
+
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from mazely import Maze
+from mazely.algorithms import ShortestPath
+
+AGENTS = [100, 1000, 10000]
+SOLVE_LIMIT = 20
+PATHS_LIMIT = 1000
+
+
+def measure(function) -> tuple[float, int]:
+    """Time a function and get its peak traced memory."""
+    began = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - began
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main(sizes: list[int]):
+    solver = ShortestPath()
+    for size in sizes:
+        maze = Maze(size, size, seed=0, packed=True)
+        rng = np.random.default_rng(0)
+        for agents in AGENTS:
+            starts = rng.integers(0, size, (agents, 2))
+            steps, steps_peak = measure(lambda: solver.solve_many(
+                maze.grid, starts, maze.goal, next_step_only=True))
+            paths = paths_peak = float("nan")
+            if agents <= PATHS_LIMIT:
+                paths, paths_peak = measure(lambda: solver.solve_many(
+                    maze.grid, starts, maze.goal))
+
+            began = time.perf_counter()
+            for start in starts[:SOLVE_LIMIT].tolist():
+                solver.solve(maze.grid, tuple(start), maze.goal)
+            solved = ((time.perf_counter() - began)
+                      / min(agents, SOLVE_LIMIT) * agents)
+            print(f"{size}x{size}, {agents:>5} agents: next steps "
+                  f"{steps:7.2f} s {steps_peak / 2 ** 20:7.1f} MiB; paths "
+                  f"{paths:7.2f} s {paths_peak / 2 ** 20:8.1f} MiB; "
+                  f"ShortestPath {solved:8.2f} s (estimated)")
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [256, 1024])
@@ -0,0 +1,79 @@
+"""Compare :meth:`mazely.Utilities.save_grid` against the previous writer,
+which wrote one line element per wall.
+
+Run from the repository root:
+
+    $ python benchmarks/bench_svg.py
+    $ python benchmarks/bench_svg.py 256 2048
+
+The previous writer is only timed up to 1024x1024, as it takes minutes beyond
+that.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from mazely import Utilities
+from mazely.algorithms import RecursiveBacktracking
+
+LEGACY_LIMIT = 1024
+
+
+def legacy_save_grid(grid, file_path, cell_size=15, line_width=2):
+    """The SVG writer that `Utilities.save_grid` used to run."""
+    is_whole = Utilities._is_whole
+    with open(file_path, "w") as file:
+        file.write(
+            '<svg xmlns="http://www.w3.org/2000/svg" '
+            f'width="{cell_size * len(grid[0]) + line_width}" '
+            f'height="{cell_size * len(grid) + line_width}" '
+            f'fill="none" stroke="#000" stroke-width="{line_width}" '
+            'stroke-linecap="square" style="background-color: #FFF">\n'
+        )
+        for row in range(len(grid)):
+            for column, walls in enumerate(grid[row]):
+                x1 = is_whole(column * cell_size + line_width / 2)
+                y1 = is_whole(row * cell_size + line_width / 2)
+                x2 = is_whole((column + 1) * cell_size + line_width / 2)
+                y2 = is_whole((row + 1) * cell_size + line_width / 2)
+                if row == 0 and walls[0]:
+                    file.write(f'\t<line x1="{x1}" y1="{y1}" '
+                               f'x2="{x2}" y2="{y1}"/>\n')
+                if walls[1]:
+                    file.write(f'\t<line x1="{x1}" y1="{y2}" '
+                               f'x2="{x2}" y2="{y2}"/>\n')
+                if walls[2]:
+                    file.write(f'\t<line x1="{x2}" y1="{y1}" '
+                               f'x2="{x2}" y2="{y2}"/>\n')
+                if column == 0 and walls[3]:
+                    file.write(f'\t<line x1="{x1}" y1="{y1}" '
+                               f'x2="{x1}" y2="{y2}"/>\n')
+        file.write("</svg>")
+
+
+def measure(save, grid, file_path):
+    """Time writing a file and get its size."""
+    began = time.perf_counter()
+    save(grid, file_path)
+    return time.perf_counter() - began, os.path.getsize(file_path)
+
+
+def main(sizes: list[int]):
+    utilities = Utilities()
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "maze.svg")
+        for size in sizes:
+            grid = RecursiveBacktracking().generate(size, size, seed=0)
+            writers = [("vectorized", utilities.save_grid)]
+            if size <= LEGACY_LIMIT:
+                writers.append(("legacy", legacy_save_grid))
+            for name, save in writers:
+                elapsed, file_size = measure(save, grid, file_path)
+                print(f"{size}x{size}: {name:<10} {elapsed:8.2f} s "
+                      f"{file_size / 2 ** 20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [256, 1024, 2048])
@@ -0,0 +1,42 @@
+"""Time :meth:`mazely.Maze.validate` against loading the same maze from a
+maze file with :meth:`mazely.Maze.load_maze`.
+
+Run from the repository root:
+
+    $ python benchmarks/bench_validation.py
+    $ python benchmarks/bench_validation.py 256 4096
+
+Validation includes labeling the groups of connected cells, which takes most
+of its time.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from mazely import Maze
+
+
+def main(sizes: list[int]):
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "maze.maze")
+        for size in sizes:
+            Maze(size, size, seed=0).save_maze(file_path)
+
+            began = time.perf_counter()
+            maze = Maze(path=file_path, packed=True)
+            elapsed = time.perf_counter() - began
+            print(f"{size}x{size}: load_maze          {elapsed:8.3f} s")
+
+            for perfect in (False, True):
+                began = time.perf_counter()
+                maze.validate(perfect=perfect)
+                elapsed = time.perf_counter() - began
+                label = "validate(perfect)" if perfect else "validate()"
+                print(f"{size}x{size}: {label:<18} {elapsed:8.3f} s "
+                      f"({size * size / elapsed:12,.0f} cells/s)")
+
+
+if __name__ == "__main__":
+    main([int(size) for size in sys.argv[1:]] or [256, 1024, 2048])
@@ -0,0 +1,192 @@
+"""Benchmark generating, solving, parsing and exporting mazes, and importing
+:mod:`mazely`, and compare the results of two runs.
+
+Run from the repository root:
+
+    $ python benchmarks/suite.py run results.json
+    $ python benchmarks/suite.py run results.json --sizes 16 256
+    $ python benchmarks/suite.py compare baseline.json results.json
+
+``run`` measures each case at each size, from 16x16 up to 4096x4096 by
+default, and writes the time, peak memory and cells per second of each to a
+JSON file. Time is the best of as many runs as fit in half a second, and peak
+memory is the most memory traced by :mod:`tracemalloc` during one more run.
+The import time is the median over fresh interpreters.
+
+``compare`` lists the cases that got slower or took more memory by more than
+a threshold between two runs, and fails if there are any.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import numpy as np
+
+import mazely
+from mazely import Maze, Utilities
+from mazely.algorithms import RecursiveBacktracking, ShortestPath
+from mazely.maze_file import write_maze
+
+SIZES = [16, 64, 256, 1024, 4096]
+
+# Each case is run until it has taken this many seconds in total, at most
+# `MAX_REPEATS` times, and its best time is kept.
+MIN_SECONDS = 0.5
+MAX_REPEATS = 100
+
+IMPORT_RUNS = 10
+IMPORT_PROBE = """
+import time
+began = time.perf_counter()
+import mazely
+print(time.perf_counter() - began)
+"""
+
+
+def measure(function: Callable[[], object]) -> tuple[float, int]:
+    """Get the best time of a function and its peak traced memory."""
+    times = []
+    while sum(times) < MIN_SECONDS and len(times) < MAX_REPEATS:
+        began = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - began)
+
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(times), peak
+
+
+def measure_import() -> float:
+    """Get the median time it takes to import mazely in a fresh
+    interpreter."""
+    return statistics.median(
+        float(subprocess.run([sys.executable, "-c", IMPORT_PROBE],
+                             capture_output=True, text=True,
+                             check=True).stdout)
+        for _ in range(IMPORT_RUNS)
+    )
+
+
+def run(sizes: list[int], output: str):
+    results = [{
+        "case": "import",
+        "size": None,
+        "seconds": measure_import(),
+        "peak_bytes": None,
+        "cells_per_second": None,
+    }]
+    print(f"{'import':<14} {results[0]['seconds'] * 1e3:10.1f} ms")
+
+    generator = RecursiveBacktracking()
+    solver = ShortestPath()
+    utilities = Utilities()
+    with tempfile.TemporaryDirectory() as directory:
+        maze_path = os.path.join(directory, "maze.maze")
+        svg_path = os.path.join(directory, "maze.svg")
+        for size in sizes:
+            grid = generator.generate(size, size, seed=0)
+            start, goal = (0, 0), {(size - 1, size - 1)}
+            solution_path = solver.solve(grid, start, goal)
+            write_maze(maze_path, grid, start, goal)
+
+            cases = {
+                "generate": lambda: generator.generate(size, size, seed=0),
+                "solve": lambda: solver.solve(grid, start, goal),
+                "load_maze": lambda: Maze(path=maze_path),
+                "save_maze": lambda: write_maze(maze_path, grid, start, goal),
+                "save_grid": lambda: utilities.save_grid(grid, svg_path),
+                "save_solution": lambda: utilities.save_solution(
+                    grid, solution_path, svg_path),
+            }
+            for case, function in cases.items():
+                seconds, peak = measure(function)
+                results.append({
+                    "case": case,
+                    "size": size,
+                    "seconds": seconds,
+                    "peak_bytes": peak,
+                    "cells_per_second": size * size / seconds,
+                })
+                print(f"{case:<14} {size:>5}x{size:<5} {seconds:10.4f} s "
+                      f"{peak / 2 ** 20:10.1f} MiB "
+                      f"{size * size / seconds:14,.0f} cells/s")
+
+    with open(output, "w") as file:
+        json.dump({
+            "metadata": {
+                "mazely": mazely.__version__,
+                "numpy": np.__version__,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            },
+            "results": results,
+        }, file, indent=2)
+
+
+def compare(baseline: str, current: str, threshold: float):
+    with open(baseline) as file:
+        before = json.load(file)["results"]
+    with open(current) as file:
+        after = {(result["case"], result["size"]): result
+                 for result in json.load(file)["results"]}
+
+    regressions = 0
+    for result in before:
+        key = (result["case"], result["size"])
+        if key not in after:
+            continue
+        for metric in ("seconds", "peak_bytes"):
+            old, new = result[metric], after[key][metric]
+            if not old or new is None:
+                continue
+            ratio = new / old
+            regressed = ratio > 1 + threshold
+            regressions += regressed
+            case, size = key
+            label = case if size is None else f"{case} {size}x{size}"
+            print(f"{label:<24} {metric:<11} {old:14.6g} -> {new:14.6g} "
+                  f"{ratio:6.2f}x{'  REGRESSION' if regressed else ''}")
+
+    if regressions:
+        sys.exit(f"{regressions} regression(s) of more than "
+                 f"{threshold:.0%}.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("output", help="the JSON file to write")
+    run_parser.add_argument("--sizes", type=int, nargs="+", default=SIZES,
+                            help="the numbers of rows and columns")
+    compare_parser = commands.add_parser(
+        "compare", help="compare the results of two runs")
+    compare_parser.add_argument("baseline", help="the earlier JSON file")
+    compare_parser.add_argument("current", help="the later JSON file")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=0.1,
+        help="the relative increase that counts as a regression")
+
+    arguments = parser.parse_args()
+    if arguments.command == "run":
+        run(arguments.sizes, arguments.output)
+    else:
+        compare(arguments.baseline, arguments.current, arguments.threshold)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,25 @@
-from . import algorithms
+from . import algorithms, analytics, instrumentation
+from .batch import generate_batch
+from .components import Components
+from .grid import pack_grid, unpack_grid
 from .maze import Maze
+from .path_queries import PathQueries
+from .solution_path import SolutionPath
 from .utilities import Utilities
 from .__about__ import __version__, __author__, __copyright__, __license__
 
 __all__ = [
     "algorithms",
+    "analytics",
+    "instrumentation",
+    "Components",
     "Maze",
+    "PathQueries",
+    "SolutionPath",
     "Utilities",
+    "generate_batch",
+    "pack_grid",
+    "unpack_grid",
     "__version__",
     "__author__",
     "__copyright__",
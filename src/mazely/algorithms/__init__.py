@@ -1,9 +1,19 @@
+from .a_star import AStar
+from .bidirectional_bfs import BidirectionalBFS
+from .eller import Eller
+from .incremental_shortest_path import IncrementalShortestPath
+from .kruskal import Kruskal
 from .maze_generator import MazeGenerator
 from .maze_solver import MazeSolver
 from .recursive_backtracking import RecursiveBacktracking
 from .shortest_path import ShortestPath
 
 __all__ = [
+    "AStar",
+    "BidirectionalBFS",
+    "Eller",
+    "IncrementalShortestPath",
+    "Kruskal",
     "MazeGenerator",
     "MazeSolver",
     "RecursiveBacktracking",
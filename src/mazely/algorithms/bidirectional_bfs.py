@@ -0,0 +1,155 @@
+from array import array
+
+import numpy as np
+
+from ..grid import EAST, NORTH, SOUTH, WEST, sealed_walls
+from ..instrumentation import current_stats
+from ..solution_path import SolutionPath
+from .maze_solver import MazeSolver
+
+
+class BidirectionalBFS(MazeSolver):
+    """A maze-solving algorithm that finds the shortest path using
+    breadth-first search from both ends.
+
+    One search grows from the start cell and another from all the goal cells
+    at once. The smaller frontier is expanded one whole level at a time, and
+    the path is joined where the two searches first meet. Each search only
+    has to reach about half the length of the path, which cuts the number of
+    expanded cells when the maze has open areas.
+    """
+
+    def __init__(self):
+        super().__init__()
+
+    @staticmethod
+    def _reverse_moves(
+        rows: int,
+        columns: int
+    ) -> tuple[tuple[tuple[tuple[int, int], ...], ...], bytes]:
+        """Get the neighbors that may lead into a cell.
+
+        Parameters
+        ----------
+        rows : int
+            The total number of rows of the maze.
+        columns : int
+            The total number of columns of the maze.
+
+        Returns
+        -------
+        tuple[tuple[tuple[tuple[int, int], ...], ...], bytes]
+            The flat index offset of each neighbor with the wall of the
+            neighbor that faces back, indexed by the sides of a cell on the
+            outer border, and those sides as wall bits by flat index.
+        """
+        facing = ((-columns, SOUTH), (columns, NORTH), (1, WEST), (-1, EAST))
+        reverse_moves = tuple(
+            tuple(move for bit, move in enumerate(facing)
+                  if not border >> bit & 1)
+            for border in range(16)
+        )
+        border = np.zeros((rows, columns), dtype=np.uint8)
+        border[0] |= NORTH
+        border[-1] |= SOUTH
+        border[:, -1] |= EAST
+        border[:, 0] |= WEST
+        return reverse_moves, border.tobytes()
+
+    def solve(
+        self,
+        grid: np.ndarray,
+        start: tuple[int, int],
+        goal: set[tuple[int, int]]
+    ) -> SolutionPath:
+        """Solve the maze.
+
+        Parameters
+        ----------
+        grid : numpy.ndarray
+            A two-dimensional array of cells representing a rectangular maze,
+            in either layout.
+        start : tuple[int, int]
+            The location of the start cell.
+        goal : set[tuple[int, int]]
+            The location(s) of the goal cell(s).
+
+        Returns
+        -------
+        SolutionPath
+            The solution path.
+        """
+        if not goal:
+            return None
+
+        walls = sealed_walls(grid)
+        rows, columns = walls.shape
+        walls = walls.tobytes()
+        # The forward search leaves a cell through its own open walls, and
+        # the backward search enters a cell from a neighbor whose wall facing
+        # it is open, as the walls of neighbors may not match.
+        moves = self._moves(columns)
+        reverse_moves, border = self._reverse_moves(rows, columns)
+
+        # Which search has reached each cell (0 for none, 1 for forward, 2 for
+        # backward), and the parent of each cell within that search.
+        side = bytearray(len(walls))
+        parent = array("i", [-1]) * len(walls)
+
+        source = start[0] * columns + start[1]
+        targets = [row * columns + column for row, column in goal]
+        stats = current_stats()
+        if source in targets:
+            if stats is not None:
+                stats.cells_visited = stats.queue_peak = 1
+            return SolutionPath([source], columns)
+        side[source] = 1
+        for target in targets:
+            side[target] = 2
+        frontiers = {1: [source], 2: targets}
+        expanded = 0
+        queue_peak = 1 + len(targets)
+
+        def finish(solution_path: SolutionPath | None) -> SolutionPath:
+            """Fill in the counts of a measured search."""
+            if stats is not None:
+                stats.nodes_expanded = expanded
+                stats.cells_visited = len(side) - side.count(0)
+                stats.queue_peak = queue_peak
+            return solution_path
+
+        while frontiers[1] and frontiers[2]:
+            # Expand the smaller frontier by one level.
+            current = 1 if len(frontiers[1]) <= len(frontiers[2]) else 2
+            other = 3 - current
+            if stats is not None:
+                expanded += len(frontiers[current])
+            next_frontier = []
+            for cell in frontiers[current]:
+                if current == 1:
+                    neighbors = [cell + offset
+                                 for offset in moves[walls[cell]]]
+                else:
+                    neighbors = [
+                        cell + offset
+                        for offset, wall in reverse_moves[border[cell]]
+                        if not walls[cell + offset] & wall
+                    ]
+                for neighbor in neighbors:
+                    if side[neighbor] == other:
+                        # Both searches have fully expanded every shorter
+                        # meeting point, so the first meeting is optimal.
+                        head, tail = ((cell, neighbor) if current == 1
+                                      else (neighbor, cell))
+                        return finish(
+                            self._trace(parent, head, columns)
+                            + self._trace(parent, tail, columns)[::-1])
+                    if not side[neighbor]:
+                        side[neighbor] = current
+                        parent[neighbor] = cell
+                        next_frontier.append(neighbor)
+            frontiers[current] = next_frontier
+            if stats is not None:
+                queue_peak = max(queue_peak,
+                                 len(frontiers[1]) + len(frontiers[2]))
+        return finish(None)
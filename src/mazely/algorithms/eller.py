@@ -0,0 +1,167 @@
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+
+from ..grid import ALL_WALLS, EAST, NORTH, SOUTH, WEST, unpack_grid
+from .maze_generator import MazeGenerator
+
+
+class Eller(MazeGenerator):
+    """A maze-generating algorithm that creates a perfect maze one row at a
+    time, as in Eller's algorithm.
+
+    Eller's algorithm only remembers which cells of the current row are
+    connected through the rows above it. It randomly joins neighboring cells
+    of the row that are not yet connected, then carves at least one passage
+    down from each connected set of cells. The last row joins every set that
+    remains. As only one row is held at a time, :meth:`iter_rows` can generate
+    mazes of any height, such as to stream them straight to a file with
+    :func:`~mazely.maze_file.write_binary_rows`.
+    """
+
+    @staticmethod
+    def _join(
+        labels: list[int],
+        columns: Iterable[int],
+        parent: list[int]
+    ) -> list[int]:
+        """Join neighboring cells that are in different sets.
+
+        Parameters
+        ----------
+        labels : list[int]
+            The label of the set of each cell of the row.
+        columns : Iterable[int]
+            The columns of the cells to join to their eastern neighbors, in
+            increasing order.
+        parent : list[int]
+            The parent of each label, updated as the sets are joined.
+
+        Returns
+        -------
+        list[int]
+            The columns of the cells that were joined to their eastern
+            neighbors.
+        """
+        joined = []
+        for column in columns:
+            first = labels[column]
+            while parent[first] != first:
+                parent[first] = first = parent[parent[first]]
+            second = labels[column + 1]
+            while parent[second] != second:
+                parent[second] = second = parent[parent[second]]
+            if first != second:
+                parent[second] = first
+                joined.append(column)
+        return joined
+
+    def iter_rows(
+        self,
+        rows: int,
+        columns: int,
+        seed: int | None = None
+    ) -> Iterator[np.ndarray]:
+        """Generate a maze one row at a time.
+
+        Only the current row is held in memory.
+
+        Parameters
+        ----------
+        rows : int
+            The total number of rows of the maze.
+        columns : int
+            The total number of columns of the maze.
+        seed : int, optional
+            The seed value used to initialize the random number generator.
+            Defaults to ``None``.
+
+        Yields
+        ------
+        numpy.ndarray
+            The packed cells of each row, from top to bottom.
+        """
+        random_ = np.random.default_rng(seed)
+        indices = np.arange(columns)
+        # Every cell starts in a set of its own. Labels are kept below the
+        # number of columns.
+        labels = indices
+        north = np.zeros(columns, dtype=bool)
+        for row in range(rows):
+            last = row == rows - 1
+            parent = list(range(columns))
+            if last:
+                candidates = range(columns - 1)
+            else:
+                candidates = np.flatnonzero(
+                    (random_.random(columns - 1) < 0.5)
+                    & (labels[:-1] != labels[1:])
+                ).tolist()
+            east = np.zeros(columns, dtype=bool)
+            east[self._join(labels.tolist(), candidates, parent)] = True
+
+            cells = np.full(columns, ALL_WALLS, dtype=np.uint8)
+            cells[north] &= ALL_WALLS ^ NORTH
+            cells[east] &= ALL_WALLS ^ EAST
+            cells[1:][east[:-1]] &= ALL_WALLS ^ WEST
+            if last:
+                yield cells
+                break
+
+            # The set of each cell after the joins.
+            parent = np.array(parent)
+            while True:
+                grandparent = parent[parent]
+                if np.array_equal(grandparent, parent):
+                    break
+                parent = grandparent
+            sets = parent[labels]
+
+            # Carve down from a random half of the cells, and from a random
+            # cell of each set that would otherwise have no passage down.
+            south = random_.random(columns) < 0.5
+            has_south = np.zeros(columns, dtype=bool)
+            has_south[sets[south]] = True
+            shuffled = random_.permutation(columns)
+            shuffled = shuffled[~has_south[sets[shuffled]]]
+            _, first = np.unique(sets[shuffled], return_index=True)
+            south[shuffled[first]] = True
+            cells[south] &= ALL_WALLS ^ SOUTH
+            yield cells
+
+            # Cells below a passage stay in its set; the others start new
+            # sets. The labels are then renumbered from zero.
+            labels = np.unique(np.where(south, sets, columns + indices),
+                               return_inverse=True)[1]
+            north = south
+
+    def generate(
+        self,
+        rows: int,
+        columns: int,
+        seed: int | None = None
+    ) -> np.ndarray:
+        """Generate a maze.
+
+        Parameters
+        ----------
+        rows : int
+            The total number of rows of the maze.
+        columns : int
+            The total number of columns of the maze.
+        seed : int, optional
+            The seed value used to initialize the random number generator.
+            Defaults to ``None``
+
+        Returns
+        -------
+        numpy.ndarray
+            A two-dimensional array of cells representing a rectangular maze,
+            packed if :attr:`packed` is set.
+        """
+        grid = np.empty((rows, columns), dtype=np.uint8)
+        for row, cells in enumerate(self.iter_rows(rows, columns, seed)):
+            grid[row] = cells
+        if self.packed:
+            return grid
+        return unpack_grid(grid)
@@ -0,0 +1,279 @@
+from array import array
+
+import numpy as np
+
+from ..grid import ALL_WALLS, EAST, NORTH, SOUTH, WEST, pack_grid
+from ..instrumentation import current_stats
+from ..solution_path import SolutionPath
+from .maze_solver import MazeSolver
+
+# A distance larger than any path, for cells that cannot reach a goal cell.
+_UNREACHABLE = 2 ** 31 - 1
+
+
+class IncrementalShortestPath(MazeSolver):
+    """A maze-solving algorithm that finds the shortest path and repairs it
+    after walls change.
+
+    The solver keeps the distance of every cell to the nearest goal cell
+    between calls. The parent of a cell is implied by the distances: it is any
+    open neighbor one step closer to a goal cell. When walls are changed in
+    place and reported with :meth:`update_walls`, the next call to
+    :meth:`solve` only revisits the cells whose distance may have changed, so
+    its cost scales with the size of the change rather than of the maze.
+
+    Solving a different grid object or a different set of goal cells starts
+    over with a full breadth-first search.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._grid = None
+        self._goal = None
+        self._width = 0
+        self._offsets = ()
+        self._facing = ()
+        # Copies of the wall bits and distances of each cell by flat index,
+        # padded with a border of cells that have every wall.
+        self._walls = bytearray()
+        self._distance = array("i")
+        # The padded flat indices of the cells reported by `update_walls`.
+        self._changed = set()
+
+    def update_walls(self, grid: np.ndarray, *cells: tuple[int, int]):
+        """Report that the walls of cells in a grid were changed in place.
+
+        Parameters
+        ----------
+        grid : numpy.ndarray
+            The grid that was changed.
+        cells : tuple[int, int]
+            The location of a cell whose walls were changed.
+        """
+        if grid is self._grid:
+            self._changed.update((row + 1) * self._width + column + 1
+                                 for row, column in cells)
+
+    def reset(self):
+        """Discard the distances, so that the next call to :meth:`solve`
+        starts over."""
+        self._grid = None
+        self._goal = None
+        self._changed.clear()
+
+    def _rebuild(
+        self,
+        grid: np.ndarray,
+        goal: frozenset[tuple[int, int]]
+    ) -> int:
+        """Find the distance of every cell with a breadth-first search from
+        the goal cells, and return the number of cells reached."""
+        rows, columns = grid.shape[:2]
+        width = columns + 2
+        walls = np.full((rows + 2, width), ALL_WALLS, dtype=np.uint8)
+        walls[1:-1, 1:-1] = pack_grid(grid)
+
+        self._grid = grid
+        self._goal = goal
+        self._width = width
+        self._offsets = self._moves(width)
+        self._facing = ((-width, SOUTH), (width, NORTH), (1, WEST), (-1, EAST))
+        self._walls = bytearray(walls.tobytes())
+        self._distance = array("i", [_UNREACHABLE]) * len(self._walls)
+        self._changed.clear()
+
+        walls = self._walls
+        distance = self._distance
+        queue = []
+        for row, column in goal:
+            cell = (row + 1) * width + column + 1
+            if distance[cell]:
+                distance[cell] = 0
+                queue.append(cell)
+        for cell in queue:
+            level = distance[cell] + 1
+            for offset, wall in self._facing:
+                neighbor = cell + offset
+                if (not walls[neighbor] & wall
+                        and distance[neighbor] == _UNREACHABLE):
+                    distance[neighbor] = level
+                    queue.append(neighbor)
+        return len(queue)
+
+    def _invalidate(self, changed: set[int]) -> tuple[set[int], int]:
+        """Find the cells that lost every path of their length and mark
+        them as unreachable.
+
+        These are the changed cells without an open neighbor one step
+        closer, then the cells that relied on them, and so on.
+
+        Parameters
+        ----------
+        changed : set[int]
+            The padded flat indices of the changed cells.
+
+        Returns
+        -------
+        tuple[set[int], int]
+            The padded flat indices of the cells whose distance was
+            discarded, and the number of cells that were checked.
+        """
+        walls = self._walls
+        distance = self._distance
+        moves = self._offsets
+        affected = set()
+        queue = list(changed)
+        for cell in queue:
+            step = distance[cell] - 1
+            if cell in affected or step < 0 or step == _UNREACHABLE - 1:
+                continue
+            for offset in moves[walls[cell]]:
+                neighbor = cell + offset
+                if distance[neighbor] == step and neighbor not in affected:
+                    break
+            else:
+                affected.add(cell)
+                for offset, wall in self._facing:
+                    neighbor = cell + offset
+                    if (not walls[neighbor] & wall
+                            and distance[neighbor] == step + 2):
+                        queue.append(neighbor)
+        for cell in affected:
+            distance[cell] = _UNREACHABLE
+        return affected, len(queue)
+
+    def _propagate(self, reseeded: set[int]) -> tuple[int, int, int]:
+        """Give cells the best distance through their neighbors, then spread
+        any improvement outwards.
+
+        The improvements are spread in order of distance, by merging the
+        reseeded cells, sorted once, with a queue of the cells that they
+        improve.
+
+        Parameters
+        ----------
+        reseeded : set[int]
+            The padded flat indices of the cells to give a distance.
+
+        Returns
+        -------
+        tuple[int, int, int]
+            The number of cells expanded, of cells whose distance improved
+            and of cells held at once for expansion.
+        """
+        walls = self._walls
+        distance = self._distance
+        moves = self._offsets
+        seeds = []
+        for cell in reseeded:
+            for offset in moves[walls[cell]]:
+                if distance[cell + offset] + 1 < distance[cell]:
+                    distance[cell] = distance[cell + offset] + 1
+            if distance[cell] != _UNREACHABLE:
+                seeds.append((distance[cell], cell))
+        seeds.sort()
+
+        expanded = 0
+        queue = []
+        head = 0
+        index = 0
+        while True:
+            if head < len(queue) and (
+                index == len(seeds) or distance[queue[head]] <= seeds[index][0]
+            ):
+                cell = queue[head]
+                level = distance[cell]
+                head += 1
+            elif index < len(seeds):
+                level, cell = seeds[index]
+                index += 1
+                if level != distance[cell]:
+                    continue
+            else:
+                break
+            expanded += 1
+            for offset, wall in self._facing:
+                neighbor = cell + offset
+                if (not walls[neighbor] & wall
+                        and level + 1 < distance[neighbor]):
+                    distance[neighbor] = level + 1
+                    queue.append(neighbor)
+        return expanded, len(queue), len(seeds) + len(queue)
+
+    def _repair(self, grid: np.ndarray) -> tuple[int, int, int]:
+        """Update the distances after the walls of the changed cells, and
+        return the number of cells expanded, of cells visited and of cells
+        queued at once."""
+        changed = self._changed
+        self._changed = set()
+        for cell in changed:
+            row, column = divmod(cell, self._width)
+            self._walls[cell] = int(
+                pack_grid(grid[row - 1:row, column - 1:column])[0, 0])
+
+        affected, checked = self._invalidate(changed)
+        reseeded = affected | changed
+        expanded, improved, queued = self._propagate(reseeded)
+        return (len(affected) + expanded, len(reseeded) + improved,
+                max(checked, queued))
+
+    def solve(
+        self,
+        grid: np.ndarray,
+        start: tuple[int, int],
+        goal: set[tuple[int, int]]
+    ) -> SolutionPath:
+        """Solve the maze.
+
+        Walls changed in place since the last call must be reported with
+        :meth:`update_walls` first; :meth:`.Maze.remove_wall` and
+        :meth:`.Maze.add_wall` do so.
+
+        Parameters
+        ----------
+        grid : numpy.ndarray
+            A two-dimensional array of cells representing a rectangular maze,
+            in either layout.
+        start : tuple[int, int]
+            The location of the start cell.
+        goal : set[tuple[int, int]]
+            The location(s) of the goal cell(s).
+
+        Returns
+        -------
+        SolutionPath
+            The solution path, or :obj:`None` if no goal cell can be reached.
+        """
+        goal = frozenset(goal)
+        if grid is not self._grid or goal != self._goal:
+            counts = (self._rebuild(grid, goal),) * 3
+        elif self._changed:
+            counts = self._repair(grid)
+        else:
+            counts = (0, 0, 0)
+        stats = current_stats()
+        if stats is not None:
+            stats.nodes_expanded, stats.cells_visited, stats.queue_peak = \
+                counts
+
+        walls = self._walls
+        distance = self._distance
+        width = self._width
+        moves = self._offsets
+
+        cell = (start[0] + 1) * width + start[1] + 1
+        level = distance[cell]
+        if level == _UNREACHABLE:
+            return None
+        # Record the padded indices, then map them back to the grid.
+        cells = array("i", [cell])
+        while level:
+            level -= 1
+            for offset in moves[walls[cell]]:
+                if distance[cell + offset] == level:
+                    cell += offset
+                    break
+            cells.append(cell)
+        row, column = np.divmod(np.frombuffer(cells, dtype=np.int32), width)
+        columns = width - 2
+        return SolutionPath((row - 1) * columns + column - 1, columns)
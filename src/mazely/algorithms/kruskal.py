@@ -0,0 +1,134 @@
+import numpy as np
+
+from ..grid import ALL_WALLS, EAST, NORTH, SOUTH, WEST, unpack_grid
+from .maze_generator import MazeGenerator
+
+
+class Kruskal(MazeGenerator):
+    """A maze-generating algorithm that creates a perfect maze from a random
+    spanning tree of the grid, as in Kruskal's algorithm.
+
+    Kruskal's algorithm shuffles the walls between neighboring cells and
+    removes each wall whose cells are not yet connected, using a union-find
+    over the cells. As the shuffled order ranks every wall differently, the
+    walls it removes form the unique minimum spanning tree of the ranks. This
+    implementation finds the same tree with whole-array operations instead of
+    a Python loop over the walls: in each round, every connected set of cells
+    removes its lowest-ranked wall to another set, and the joined sets are
+    then relabeled with pointer jumping. Each round at least halves the
+    number of sets.
+    """
+
+    @staticmethod
+    def _spanning_tree(
+        first: np.ndarray,
+        second: np.ndarray,
+        cells: int
+    ) -> np.ndarray:
+        """Find the minimum spanning tree of a graph whose edges are ranked by
+        their order.
+
+        Parameters
+        ----------
+        first : numpy.ndarray
+            The first cell of each edge, in order of rank.
+        second : numpy.ndarray
+            The second cell of each edge, in order of rank.
+        cells : int
+            The total number of cells.
+
+        Returns
+        -------
+        numpy.ndarray
+            The ranks of the edges in the tree.
+        """
+        # The label of the set of each end of each edge. Labels are kept
+        # consecutive, so the arrays over sets shrink as sets are joined.
+        first_set = first
+        second_set = second
+        sets = cells
+        ranks = np.arange(len(first))
+        tree = []
+        while True:
+            # Drop the edges within a set, which can never join the tree.
+            between = first_set != second_set
+            ranks = ranks[between]
+            if not len(ranks):
+                break
+            first_set = first_set[between]
+            second_set = second_set[between]
+
+            # The lowest-ranked edge leaving each set.
+            positions = np.arange(len(ranks))
+            lowest = np.full(sets, len(ranks))
+            np.minimum.at(lowest, first_set, positions)
+            np.minimum.at(lowest, second_set, positions)
+            chosen = np.zeros(len(ranks), dtype=bool)
+            chosen[lowest] = True
+            tree.append(ranks[chosen])
+
+            # Point each set at the set across its edge. Two sets that chose
+            # the same edge point at each other; the lower one becomes the
+            # root of the joined set.
+            labels = np.arange(sets)
+            parent = np.where(first_set[lowest] == labels,
+                              second_set[lowest], first_set[lowest])
+            roots = (parent[parent] == labels) & (labels < parent)
+            parent[roots] = labels[roots]
+            while True:
+                grandparent = parent[parent]
+                if np.array_equal(grandparent, parent):
+                    break
+                parent = grandparent
+
+            relabel = np.cumsum(roots) - 1
+            first_set = relabel[parent[first_set]]
+            second_set = relabel[parent[second_set]]
+            sets = int(roots.sum())
+        return np.concatenate(tree) if tree else ranks
+
+    def generate(
+        self,
+        rows: int,
+        columns: int,
+        seed: int | None = None
+    ) -> np.ndarray:
+        """Generate a maze.
+
+        Parameters
+        ----------
+        rows : int
+            The total number of rows of the maze.
+        columns : int
+            The total number of columns of the maze.
+        seed : int, optional
+            The seed value used to initialize the random number generator.
+            Defaults to ``None``
+
+        Returns
+        -------
+        numpy.ndarray
+            A two-dimensional array of cells representing a rectangular maze,
+            packed if :attr:`packed` is set.
+        """
+        cells = np.arange(rows * columns).reshape(rows, columns)
+        # The walls between horizontal neighbors, then between vertical
+        # neighbors, by their cells.
+        first = np.concatenate([cells[:, :-1].ravel(), cells[:-1].ravel()])
+        second = np.concatenate([cells[:, 1:].ravel(), cells[1:].ravel()])
+        order = np.random.default_rng(seed).permutation(len(first))
+
+        removed = np.zeros(len(first), dtype=bool)
+        removed[order[self._spanning_tree(first[order], second[order],
+                                          rows * columns)]] = True
+        horizontal = removed[:rows * (columns - 1)].reshape(rows, columns - 1)
+        vertical = removed[rows * (columns - 1):].reshape(rows - 1, columns)
+
+        grid = np.full((rows, columns), ALL_WALLS, dtype=np.uint8)
+        grid[:, :-1] &= ~(horizontal * EAST).astype(np.uint8)
+        grid[:, 1:] &= ~(horizontal * WEST).astype(np.uint8)
+        grid[:-1] &= ~(vertical * SOUTH).astype(np.uint8)
+        grid[1:] &= ~(vertical * NORTH).astype(np.uint8)
+        if self.packed:
+            return grid
+        return unpack_grid(grid)
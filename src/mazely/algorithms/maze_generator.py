@@ -1,12 +1,36 @@
 import numpy as np
 
+from ..grid import ALL_WALLS, set_wall
+from ..instrumentation import Stats, instrumented
+
+
+def _generated(stats: Stats, _, __, arguments: dict):
+    """Collect the number of cells of a generated maze."""
+    stats.cells_visited = arguments["rows"] * arguments["columns"]
+
 
 class MazeGenerator:
-    """A base class for maze-generating algorithms."""
+    """A base class for maze-generating algorithms.
+
+    The :meth:`generate` method of every subclass is instrumented, as
+    described in :mod:`mazely.instrumentation`.
 
-    def __init__(self):
+    Attributes
+    ----------
+    packed : bool
+        Whether generated grids use the packed layout of one ``uint8`` of wall
+        bits per cell. Defaults to ``False``.
+    """
+
+    def __init__(self, packed: bool = False):
+        self.packed = packed
         self._grid = None
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "generate" in cls.__dict__:
+            cls.generate = instrumented(_generated)(cls.generate)
+
     def _remove_wall(self, cell: tuple[int, int], neighbor: tuple[int, int]):
         """Remove the wall between a cell and its neighbor.
 
@@ -19,25 +43,25 @@ class MazeGenerator:
         """
         if cell[1] == neighbor[1]:  # If both cells share the same column.
             if cell[0] < neighbor[0]:
-                self._grid[cell[0]][cell[1]][1] = False
-                self._grid[neighbor[0]][neighbor[1]][0] = False
+                set_wall(self._grid, cell, 1, False)
+                set_wall(self._grid, neighbor, 0, False)
             else:
-                self._grid[cell[0]][cell[1]][0] = False
-                self._grid[neighbor[0]][neighbor[1]][1] = False
+                set_wall(self._grid, cell, 0, False)
+                set_wall(self._grid, neighbor, 1, False)
 
         elif cell[0] == neighbor[0]:  # If both cells share the same row.
             if cell[1] < neighbor[1]:
-                self._grid[cell[0]][cell[1]][2] = False
-                self._grid[neighbor[0]][neighbor[1]][3] = False
+                set_wall(self._grid, cell, 2, False)
+                set_wall(self._grid, neighbor, 3, False)
             else:
-                self._grid[cell[0]][cell[1]][3] = False
-                self._grid[neighbor[0]][neighbor[1]][2] = False
+                set_wall(self._grid, cell, 3, False)
+                set_wall(self._grid, neighbor, 2, False)
 
     def _initiate_grid(self, rows: int, columns: int, walls: bool = False):
         """Initiate a two-dimensional list of each cell's wall data.
 
         The wall data is a list consisting of four Boolean values in NSEW
-        order.
+        order, or a ``uint8`` of wall bits if :attr:`packed` is set.
 
         Parameters
         ----------
@@ -48,8 +72,11 @@ class MazeGenerator:
         walls : bool
             Whether to initiate all the cell with walls. Defaults to ``False``.
         """
-
-        self._grid = np.full((rows, columns, 4), [walls] * 4)
+        if self.packed:
+            self._grid = np.full((rows, columns), ALL_WALLS if walls else 0,
+                                 dtype=np.uint8)
+        else:
+            self._grid = np.full((rows, columns, 4), [walls] * 4)
 
     def generate(
         self,
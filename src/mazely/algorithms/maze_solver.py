@@ -1,26 +1,401 @@
+from array import array
+
 import numpy as np
 
+from ..grid import (ALL_WALLS, EAST, NORTH, SOUTH, WEST, has_wall, pack_grid,
+                    wall_planes)
+from ..instrumentation import Stats, instrumented
+from ..solution_path import SolutionPath
+
+
+def _solved(stats: Stats, _, __, ___):
+    """Count nothing for the searches that returned before starting."""
+    for name in ("cells_visited", "nodes_expanded", "queue_peak"):
+        if getattr(stats, name) is None:
+            setattr(stats, name, 0)
+
 
 class MazeSolver:
-    """A base class for maze-solving algorithms."""
+    """A base class for maze-solving algorithms.
+
+    The :meth:`solve` method of every subclass is instrumented, as described
+    in :mod:`mazely.instrumentation`. While a call is measured, subclasses
+    fill in the cells visited, the nodes expanded and the queue high-water
+    mark of their search, from :func:`.current_stats`, and skip counting
+    otherwise.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "solve" in cls.__dict__:
+            cls.solve = instrumented(_solved)(cls.solve)
+
+    @staticmethod
+    def _moves(columns: int) -> tuple[tuple[int, ...], ...]:
+        """Get the flat index offsets of the open neighbors of a cell.
+
+        Parameters
+        ----------
+        columns : int
+            The total number of columns of the maze.
+
+        Returns
+        -------
+        tuple[tuple[int, ...], ...]
+            The offsets in NSEW order, indexed by the wall bits of a cell.
+        """
+        offsets = (-columns, columns, 1, -1)
+        return tuple(
+            tuple(offset for bit, offset in enumerate(offsets)
+                  if not walls >> bit & 1)
+            for walls in range(16)
+        )
+
+    @staticmethod
+    def _count_levels(stats: Stats, distance: array, expanded: int):
+        """Fill in the counts of a breadth-first search from the distance of
+        each cell it reached.
+
+        Parameters
+        ----------
+        stats : Stats
+            The measurements of the search.
+        distance : array.array
+            The distance of each cell by flat index, ``-1`` for the cells
+            that were not reached.
+        expanded : int
+            The number of levels whose cells had their neighbors explored.
+        """
+        distance = np.frombuffer(distance, dtype=np.int32)
+        levels = np.bincount(distance[distance >= 0])
+        stats.cells_visited = int(levels.sum())
+        stats.nodes_expanded = int(levels[:expanded].sum())
+        stats.queue_peak = int(levels.max())
+
+    @staticmethod
+    def _trace(
+        parent: array,
+        cell: int,
+        columns: int
+    ) -> SolutionPath:
+        """Follow the parents of a cell back to the cell without a parent.
+
+        Parameters
+        ----------
+        parent : array.array
+            The parent of each cell by flat index, ``-1`` for none.
+        cell : int
+            The flat index of the cell to start from.
+        columns : int
+            The total number of columns of the maze.
+
+        Returns
+        -------
+        SolutionPath
+            The path, ending with the cell.
+        """
+        cells = array("i")
+        while cell >= 0:
+            cells.append(cell)
+            cell = parent[cell]
+        cells.reverse()
+        return SolutionPath(np.frombuffer(cells, dtype=np.int32), columns)
+
+    def distance_map(
+        self,
+        grid: np.ndarray,
+        goal: set[tuple[int, int]]
+    ) -> np.ndarray:
+        """Get the distance of every cell to the nearest goal cell.
+
+        The distances are found by a breadth-first search from all the goal
+        cells at once, which expands a whole frontier per step with array
+        operations on the wall planes. A cell is one step away from a
+        frontier cell if its own wall towards that cell is open, as when
+        moving forward.
+
+        Parameters
+        ----------
+        grid : numpy.ndarray
+            A two-dimensional array of cells representing a rectangular maze,
+            in either layout.
+        goal : set[tuple[int, int]]
+            The location(s) of the goal cell(s).
+
+        Returns
+        -------
+        numpy.ndarray
+            A ``(rows, columns)`` array of ``int32`` distances, ``-1`` for the
+            cells from which no goal cell can be reached.
+        """
+        rows, columns = grid.shape[:2]
+
+        # Work on flat arrays padded with a border of cells that have no open
+        # walls, so a neighbor never needs bounds checks.
+        width = columns + 2
+        openings = np.zeros((4, rows + 2, width), dtype=bool)
+        openings[:, 1:-1, 1:-1] = ~wall_planes(grid)
+        openings = openings.reshape(4, -1)
+        # The offset to each neighbor in NSEW order, and the wall planes that
+        # face back from each neighbor.
+        offsets = np.array([[-width], [width], [1], [-1]])
+        facing = openings[[1, 0, 3, 2]]
+        directions = np.arange(4)[:, np.newaxis]
+
+        distances = np.full((rows + 2) * width, -1, dtype=np.int32)
+        frontier = np.unique(np.array(
+            [(row + 1) * width + column + 1 for row, column in goal],
+            dtype=np.intp))
+        distances[frontier] = 0
+
+        level = 0
+        while frontier.size:
+            level += 1
+            neighbors = frontier + offsets
+            neighbors = neighbors[facing[directions, neighbors]]
+            frontier = np.unique(neighbors[distances[neighbors] < 0])
+            distances[frontier] = level
+        return distances.reshape(rows + 2, width)[1:-1, 1:-1].copy()
+
+    def follow_distance_map(
+        self,
+        grid: np.ndarray,
+        distances: np.ndarray,
+        start: tuple[int, int]
+    ) -> SolutionPath:
+        """Follow a distance map downhill from a cell to a goal cell.
+
+        Each step only looks at the neighbors of the current cell, so the
+        cost is proportional to the length of the path.
+
+        Parameters
+        ----------
+        grid : numpy.ndarray
+            A two-dimensional array of cells representing a rectangular maze,
+            in either layout.
+        distances : numpy.ndarray
+            A distance map of the grid from :meth:`distance_map`.
+        start : tuple[int, int]
+            The location of the start cell.
+
+        Returns
+        -------
+        SolutionPath
+            A shortest path, or :obj:`None` if no goal cell can be reached.
+        """
+        distance = int(distances[start])
+        if distance < 0:
+            return None
+
+        rows, columns = distances.shape
+        index_delta = ((-1, 0), (1, 0), (0, 1), (0, -1))
+        cells = array("i", [start[0] * columns + start[1]])
+        row, column = start
+        while distance > 0:
+            for direction, (row_delta, column_delta) in enumerate(index_delta):
+                neighbor = (row + row_delta, column + column_delta)
+                if (
+                    not has_wall(grid, (row, column), direction)
+                    and 0 <= neighbor[0] < rows
+                    and 0 <= neighbor[1] < columns
+                    and distances[neighbor] == distance - 1
+                ):
+                    break
+            row, column = neighbor
+            distance -= 1
+            cells.append(row * columns + column)
+        return SolutionPath(np.frombuffer(cells, dtype=np.int32), columns)
+
+    def _reverse_search(
+        self,
+        grid: np.ndarray,
+        goal: set[tuple[int, int]]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the distance and the next cell towards the nearest goal cell
+        of every cell, with a breadth-first search from all the goal cells.
+
+        Parameters
+        ----------
+        grid : numpy.ndarray
+            A two-dimensional array of cells representing a rectangular maze,
+            in either layout.
+        goal : set[tuple[int, int]]
+            The location(s) of the goal cell(s).
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            The distance and the flat index of the next cell of each cell by
+            flat index, as ``int32``. Both are ``-1`` for the cells from which
+            no goal cell can be reached, and the next cell is ``-1`` for the
+            goal cells.
+        """
+        rows, columns = grid.shape[:2]
+
+        # Work on flat indices padded with a border of cells that have every
+        # wall, so a neighbor never needs bounds checks.
+        width = columns + 2
+        walls = np.full((rows + 2, width), ALL_WALLS, dtype=np.uint8)
+        walls[1:-1, 1:-1] = pack_grid(grid)
+        walls = walls.tobytes()
+        # The offset to each neighbor, and the wall of that neighbor that
+        # faces back.
+        facing = ((-width, SOUTH), (width, NORTH), (1, WEST), (-1, EAST))
+
+        distance = array("i", [-1]) * len(walls)
+        parent = array("i", [-1]) * len(walls)
+        queue = []
+        for row, column in goal:
+            cell = (row + 1) * width + column + 1
+            if distance[cell]:
+                distance[cell] = 0
+                queue.append(cell)
+        for cell in queue:
+            level = distance[cell] + 1
+            for offset, wall in facing:
+                neighbor = cell + offset
+                if distance[neighbor] < 0 and not walls[neighbor] & wall:
+                    distance[neighbor] = level
+                    parent[neighbor] = cell
+                    queue.append(neighbor)
+
+        distance = np.frombuffer(distance, dtype=np.int32).reshape(
+            rows + 2, width)[1:-1, 1:-1].ravel()
+        parent = np.frombuffer(parent, dtype=np.int32).reshape(
+            rows + 2, width)[1:-1, 1:-1].ravel()
+        row, column = np.divmod(parent, width)
+        next_cells = np.where(parent < 0, -1,
+                              (row - 1) * columns + column - 1)
+        return distance, next_cells.astype(np.int32)
+
+    def solve_many(
+        self,
+        grid: np.ndarray,
+        starts: np.ndarray,
+        goal: set[tuple[int, int]],
+        next_step_only: bool = False
+    ) -> list[SolutionPath | None] | np.ndarray:
+        """Solve the maze from many start cells to the same goal cells.
+
+        A single breadth-first search from all the goal cells gives the next
+        cell on a shortest path from every cell, which every start cell then
+        shares. The working memory scales with the size of the maze, not with
+        the number of start cells, and all the paths are traced together one
+        step at a time with array operations.
+
+        Where several paths are equally short, the path taken may differ from
+        that of :meth:`solve`.
+
+        Parameters
+        ----------
+        grid : numpy.ndarray
+            A two-dimensional array of cells representing a rectangular maze,
+            in either layout.
+        starts : numpy.ndarray
+            An ``(n, 2)`` array of the locations of the start cells.
+        goal : set[tuple[int, int]]
+            The location(s) of the goal cell(s).
+        next_step_only : bool
+            Whether to only get the cell that each start cell moves to first.
+            Defaults to ``False``.
+
+        Returns
+        -------
+        list[SolutionPath | None] or numpy.ndarray
+            For each start cell, its solution path, or :obj:`None` if no goal
+            cell can be reached. The cells of the paths are views into one
+            shared array. If
+            `next_step_only` is set, an ``(n, 2)`` ``int32`` array of the
+            second cell of each path instead, which is the start cell itself
+            for a goal cell and ``(-1, -1)`` if no goal cell can be reached.
+
+        Raises
+        ------
+        ValueError
+            If a start cell is outside the maze.
+        """
+        rows, columns = grid.shape[:2]
+        starts = np.asarray(starts, dtype=np.intp).reshape(-1, 2)
+        if ((starts[:, 0] < 0) | (starts[:, 0] >= rows)).any():
+            raise ValueError("Row is out of range.")
+        if ((starts[:, 1] < 0) | (starts[:, 1] >= columns)).any():
+            raise ValueError("Column is out of range.")
+
+        distances, next_cells = self._reverse_search(grid, goal)
+        sources = starts[:, 0] * columns + starts[:, 1]
+
+        if next_step_only:
+            steps = np.where(distances[sources] == 0, sources,
+                             next_cells[sources])
+            locations = np.stack(np.divmod(steps, columns), axis=-1)
+            locations[steps < 0] = -1
+            return locations.astype(np.int32).reshape(-1, 2)
+
+        # Trace the longest paths first, so that the paths still being traced
+        # are always a prefix.
+        lengths = distances[sources] + 1
+        order = np.argsort(-lengths, kind="stable")
+        offsets = np.zeros(len(sources) + 1, dtype=np.intp)
+        np.cumsum(lengths, out=offsets[1:])
+        cells = np.empty(offsets[-1], dtype=np.int32)
+        sorted_lengths = lengths[order]
+        current = sources[order]
+        positions = offsets[:-1][order]
+        for step in range(int(sorted_lengths[0]) if len(order) else 0):
+            active = np.searchsorted(-sorted_lengths, -step, side="left")
+            current = current[:active]
+            cells[positions[:active] + step] = current
+            current = next_cells[current]
+
+        return [SolutionPath(cells[offsets[index]:offsets[index + 1]], columns)
+                if length else None
+                for index, length in enumerate(lengths.tolist())]
+
+    def update_walls(self, grid: np.ndarray, *cells: tuple[int, int]):
+        """Report that the walls of cells in a grid were changed in place.
+
+        Solvers that keep state between calls use this to update it. The
+        base implementation does nothing.
+
+        Parameters
+        ----------
+        grid : numpy.ndarray
+            The grid that was changed.
+        cells : tuple[int, int]
+            The location of a cell whose walls were changed.
+        """
+
+    def reset(self):
+        """Discard any state kept between calls.
+
+        This is called when a grid is replaced or changed in ways that were
+        not reported with :meth:`update_walls`. The base implementation does
+        nothing.
+        """
 
     def solve(
         self,
         grid: np.ndarray,
         start: tuple[int, int],
         goal: set[tuple[int, int]]
-    ) -> list[tuple[int, int]]:
+    ) -> SolutionPath:
         """An abstract method to solve a maze.
 
         Parameters
         ----------
         grid : numpy.ndarray
-            A two-dimensional array of cells representing a rectangular maze.
+            A two-dimensional array of cells representing a rectangular maze,
+            in either layout.
         start : tuple[int, int]
             The location of the start cell.
         goal : set[tuple[int, int]]
             The location(s) of the goal cell(s).
 
+        Returns
+        -------
+        SolutionPath
+            The solution path, or :obj:`None` if no goal cell can be reached.
+
         Raises
         ------
         NotImplementedError
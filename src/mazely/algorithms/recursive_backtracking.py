@@ -1,57 +1,112 @@
 import random
-import sys
+from array import array
+from itertools import permutations
 
 import numpy as np
 
+from ..grid import ALL_WALLS, unpack_grid
 from .maze_generator import MazeGenerator
 
+# Every order in which the four directions (NSEW) can be visited, and the
+# index of each order. A stack frame stores the index instead of the order.
+_ORDERS = tuple(permutations(range(4)))
+_ORDER_INDEX = {order: index for index, order in enumerate(_ORDERS)}
+
 
 class RecursiveBacktracking(MazeGenerator):
     """A maze-generating algorithm that creates a perfect maze using a
-    randomized version of depth-first search."""
+    randomized version of depth-first search.
+
+    The search runs on an explicit stack rather than on the call stack, so the
+    size of a maze is only limited by memory.
+    """
 
-    def __init__(self):
-        super().__init__()
-        self._visited = None
+    @staticmethod
+    def _carve(
+        rows: int,
+        columns: int,
+        random_: random.Random
+    ) -> np.ndarray:
+        """Carve passages with an iterative depth-first search.
 
-    def _visit_cell(self, row, column):
-        """Visit a cell using recursive backtracking.
+        The grid is handled as a flat array of cells padded with a border of
+        cells that count as visited, so a neighbor never needs bounds checks.
+        Each stack frame packs a cell index, the index of its randomized
+        direction order and the position in that order into one integer.
 
         Parameters
         ----------
-        row : int
-            The row of the cell to be visited.
-        column : int
-            The column of the cell to be visited.
+        rows : int
+            The total number of rows of the maze.
+        columns : int
+            The total number of columns of the maze.
+        random_ : random.Random
+            The random number generator, which also picks the first cell to
+            be visited.
+
+        Returns
+        -------
+        numpy.ndarray
+            A packed grid.
         """
-        self._visited.add((row, column))  # Mark current cell as visited
-
-        # Iterate over the four directions in a randomized order
-        for row_delta, column_delta in random.sample(
-            ((-1, 0), (1, 0), (0, 1), (0, -1)), k=4
-        ):
-            # Get a random neighbor's row and column
-            neighbor = (row + row_delta, column + column_delta)
-
-            # See if the neighbor exists
-            if (
-                neighbor[0] < 0
-                or neighbor[0] >= len(self._grid)
-                or neighbor[1] < 0
-                or neighbor[1] >= len(self._grid[0])
-            ):
+        row = random_.randrange(rows)
+        column = random_.randrange(columns)
+        width = columns + 2
+        offsets = (-width, width, 1, -1)
+        # The masks that clear a wall of a cell and the facing wall of its
+        # neighbor, by direction.
+        masks = tuple(ALL_WALLS ^ 1 << direction for direction in range(4))
+        facing_masks = (masks[1], masks[0], masks[3], masks[2])
+        sample = random_.sample
+        directions = range(4)
+
+        def shuffle() -> int:
+            """Draw the index of a random direction order."""
+            return _ORDER_INDEX[tuple(sample(directions, 4))]
+
+        # Mark the padding as visited.
+        visited = bytearray(b"\x01") * (width * (rows + 2))
+        for padded_row in range(1, rows + 1):
+            visited[padded_row * width + 1:padded_row * width + width - 1] = \
+                bytes(columns)
+        walls = bytearray([ALL_WALLS]) * len(visited)
+
+        cell = (row + 1) * width + column + 1
+        visited[cell] = 1
+        stack = array("q", [cell << 7 | shuffle() << 2])
+        while stack:
+            frame = stack[-1]
+            cell = frame >> 7
+            order = _ORDERS[frame >> 2 & 31]
+            position = frame & 3
+
+            # Look for the next unvisited neighbor in the randomized order.
+            while position < 4:
+                direction = order[position]
+                position += 1
+                neighbor = cell + offsets[direction]
+                if not visited[neighbor]:
+                    break
+            else:
+                stack.pop()
                 continue
 
-            # See if the neighbor is already visited
-            if neighbor in self._visited:
-                continue
+            # Drop the frame early once every direction has been tried.
+            if position < 4:
+                stack[-1] = frame & ~3 | position
+            else:
+                stack.pop()
+
+            # Remove the wall between the current cell and the neighbor
+            walls[cell] &= masks[direction]
+            walls[neighbor] &= facing_masks[direction]
 
-            # Remove the wall between the current cell and the selected
-            # neighbor
-            self._remove_wall((row, column), neighbor)
+            # Visit the neighbor.
+            visited[neighbor] = 1
+            stack.append(neighbor << 7 | shuffle() << 2)
 
-            # Visit the neighbor recursively
-            self._visit_cell(neighbor[0], neighbor[1])
+        return np.frombuffer(walls, dtype=np.uint8).reshape(
+            rows + 2, width)[1:-1, 1:-1].copy()
 
     def generate(
         self,
@@ -61,6 +116,9 @@ class RecursiveBacktracking(MazeGenerator):
     ) -> np.ndarray:
         """Generate a maze.
 
+        Each call uses its own random number generator, so one instance can
+        generate mazes from several threads at once.
+
         Parameters
         ----------
         rows : int
@@ -74,12 +132,10 @@ class RecursiveBacktracking(MazeGenerator):
         Returns
         -------
         numpy.ndarray
-            A two-dimensional array of cells representing a rectangular maze.
+            A two-dimensional array of cells representing a rectangular maze,
+            packed if :attr:`packed` is set.
         """
-
-        sys.setrecursionlimit(max(1000, rows * columns))
-        random.seed(seed)
-        self._visited = set()
-        self._initiate_grid(rows, columns, walls=True)
-        self._visit_cell(random.randrange(rows), random.randrange(columns))
-        return self._grid
+        grid = self._carve(rows, columns, random.Random(seed))
+        if self.packed:
+            return grid
+        return unpack_grid(grid)
@@ -1,7 +1,10 @@
-from collections import deque
+from array import array
 
 import numpy as np
 
+from ..grid import sealed_walls
+from ..instrumentation import current_stats
+from ..solution_path import SolutionPath
 from .maze_solver import MazeSolver
 
 
@@ -10,20 +13,31 @@ class ShortestPath(MazeSolver):
     breadth-first search."""
 
     def __init__(self):
-        pass
+        super().__init__()
 
     def solve(
         self,
         grid: np.ndarray,
         start: tuple[int, int],
         goal: set[tuple[int, int]]
-    ) -> list[tuple[int, int]]:
+    ) -> SolutionPath:
         """Solve the maze.
 
+        The search expands the maze one level of distance at a time over flat
+        cell indices, with the distance and parent of each cell in
+        preallocated integer arrays.
+
+        When a cell can be reached from several cells of the previous level,
+        its parent is the one of them that is expanded last, and the first
+        goal cell reached wins. A cell is counted as expanded last by the
+        order of its own last arrival on its level, which is tracked
+        separately from the order of first arrivals once the two differ.
+
         Parameters
         ----------
         grid : numpy.ndarray
-            A two-dimensional array of cells representing a rectangular maze.
+            A two-dimensional array of cells representing a rectangular maze,
+            in either layout.
         start : tuple[int, int]
             The location of the start cell.
         goal : set[tuple[int, int]]
@@ -31,53 +45,73 @@ class ShortestPath(MazeSolver):
 
         Returns
         -------
-        list[tuple[int, int]]
-            An ordered list of cell locations representing the solution path.
+        SolutionPath
+            The solution path.
         """
-        queue = deque([start])
-        visited = set()
-        path = {}
-        index_delta = ((-1, 0), (1, 0), (0, 1), (0, -1))
-
-        # Loop until the queue is empty.
-        while queue:
-            # Get the next cell.
-            current = queue.popleft()
-            # Save the solution path and break the loop if the current cell is
-            # the goal.
-            if current in goal:
-                solution_path = []
-
-                # Loop until the current cell is the start cell.
-                while current is not start:
-                    # Append current cell to the solution path.
-                    solution_path.append(current)
-
-                    # Get the next cell.
-                    current = path[current]
-                else:
-                    solution_path.append(start)
-
-                # Reverse the order of the list to get a proper solution path.
-                solution_path.reverse()
-
-                return solution_path
-
-            # Add the current cell to the visited list.
-            visited.add(current)
-
-            for direction, wall in enumerate(grid[current[0]][current[1]]):
-                if not wall:
-                    neighbor = (
-                        current[0] + index_delta[direction][0],
-                        current[1] + index_delta[direction][1],
-                    )
-
-                    # If the neighbor is not in the visited list.
-                    if neighbor not in visited:
-
-                        # Add the neighbor to the queue.
-                        queue.append(neighbor)
-
-                        # Store the path.
-                        path[neighbor] = current
+        walls = sealed_walls(grid)
+        columns = walls.shape[1]
+        walls = walls.tobytes()
+
+        moves = self._moves(columns)
+
+        source = start[0] * columns + start[1]
+        targets = {row * columns + column for row, column in goal}
+        distance = array("i", [-1]) * len(walls)
+        parent = array("i", [-1]) * len(walls)
+        distance[source] = 0
+        stats = current_stats()
+
+        # The cells of the current level, in the order in which they are
+        # first reached and in the order in which they are last reached.
+        first = last = [source]
+        level = 0
+        target = None
+        while first:
+            if not targets.isdisjoint(first):
+                target = next(cell for cell in first if cell in targets)
+                break
+
+            # Reach the next level in the order of first arrivals.
+            level += 1
+            next_first = []
+            tied = False
+            for cell in first:
+                for offset in moves[walls[cell]]:
+                    neighbor = cell + offset
+                    if distance[neighbor] < 0:
+                        distance[neighbor] = level
+                        parent[neighbor] = cell
+                        next_first.append(neighbor)
+                    elif distance[neighbor] == level:
+                        tied = True
+
+            if not tied and last is first:
+                first = last = next_first
+                continue
+
+            # Replay the level in the order of last arrivals so that each
+            # cell of the next level takes its last parent, and keep the last
+            # arrival of each cell.
+            arrivals = []
+            for cell in last:
+                for offset in moves[walls[cell]]:
+                    neighbor = cell + offset
+                    if distance[neighbor] == level:
+                        parent[neighbor] = cell
+                        arrivals.append(neighbor)
+            next_last = []
+            arrived = set()
+            for cell in reversed(arrivals):
+                if cell not in arrived:
+                    arrived.add(cell)
+                    next_last.append(cell)
+            next_last.reverse()
+
+            first = next_first
+            last = first if next_last == first else next_last
+
+        if stats is not None:
+            self._count_levels(stats, distance, level)
+        if target is None:
+            return None
+        return self._trace(parent, target, columns)
@@ -0,0 +1,214 @@
+"""Structural measures of mazes, such as to rank them by difficulty.
+
+:class:`Analytics` finds the open passages of one maze, or of a stack of
+mazes of the same size, once with array operations, then counts dead ends,
+junctions and straight corridors from them. :func:`tortuosity` and
+:func:`turns` measure how winding a solution path is::
+
+    grids = generate_batch(64, 64, range(1000), packed=True)
+    analytics = Analytics(grids)
+    hardest = np.argsort(analytics.dead_ends())[::-1]
+"""
+
+import numpy as np
+
+from .grid import EAST, NORTH, SOUTH, WEST
+from .solution_path import SolutionPath
+
+
+def _open(grids: np.ndarray, direction: int) -> np.ndarray:
+    """Get whether the wall of every cell in a direction is open."""
+    if grids.dtype == bool:
+        return ~grids[..., direction.bit_length() - 1]
+    return grids & direction == 0
+
+
+def _run_lengths(passages: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Find the runs of consecutive passages along the last axis.
+
+    Parameters
+    ----------
+    passages : numpy.ndarray
+        An ``(n, lines, length)`` Boolean array of passages.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray]
+        The index along the first axis and the number of passages of each
+        run.
+    """
+    count, lines, length = passages.shape
+    # A closed passage at each end of a line keeps runs from crossing lines.
+    padded = np.zeros((count, lines, length + 2), dtype=bool)
+    padded[..., 1:-1] = passages
+    padded = padded.ravel()
+    # The index before the first passage and of the last passage of each
+    # run.
+    starts = np.flatnonzero(padded[1:] > padded[:-1])
+    ends = np.flatnonzero(padded[:-1] > padded[1:])
+    return starts // (lines * (length + 2)), ends - starts
+
+
+class Analytics:
+    """Structural measures of one maze or of a stack of mazes.
+
+    Two neighboring cells are joined by a passage if neither has a wall
+    between them. Walls on the outer border are ignored.
+
+    Each measure is a number for a single grid, or an array with one entry
+    per maze for a stack of grids.
+
+    Parameters
+    ----------
+    grids : numpy.ndarray
+        A two-dimensional array of cells representing a rectangular maze, in
+        either layout, or a stack of such arrays along a new first axis, as
+        from :func:`.generate_batch`. Packed grids are told apart from
+        unpacked grids by their ``uint8`` type.
+
+    Attributes
+    ----------
+    open_sides : numpy.ndarray
+        The number of passages of each cell, as ``int8``, in the shape of the
+        grid or of the stack of grids without the walls.
+    """
+
+    def __init__(self, grids: np.ndarray):
+        self._single = grids.ndim == (3 if grids.dtype == bool else 2)
+        if self._single:
+            grids = grids[np.newaxis]
+
+        # The passage east of each cell but the last of a row, and south of
+        # each cell but the last of a column.
+        self._east = (_open(grids, EAST)[:, :, :-1]
+                      & _open(grids, WEST)[:, :, 1:])
+        self._south = (_open(grids, SOUTH)[:, :-1]
+                       & _open(grids, NORTH)[:, 1:])
+
+        open_sides = np.zeros(grids.shape[:3], dtype=np.int8)
+        open_sides[:, :, :-1] += self._east
+        open_sides[:, :, 1:] += self._east
+        open_sides[:, :-1] += self._south
+        open_sides[:, 1:] += self._south
+        self._open_sides = open_sides
+        self._side_counts_cache = None
+        self.open_sides = open_sides[0] if self._single else open_sides
+
+    def _result(self, values: np.ndarray) -> int | np.ndarray:
+        """Unwrap the result of a single grid."""
+        if not self._single:
+            return values
+        return values[0].item() if values.ndim == 1 else values[0]
+
+    def _side_counts(self) -> np.ndarray:
+        """Count the cells of each maze with each number of passages."""
+        if self._side_counts_cache is None:
+            open_sides = self._open_sides.reshape(len(self._open_sides), -1)
+            self._side_counts_cache = np.stack(
+                [np.count_nonzero(open_sides == sides, axis=1)
+                 for sides in range(5)], axis=1)
+        return self._side_counts_cache
+
+    def side_counts(self) -> np.ndarray:
+        """Count the cells with each number of passages.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of 5 counts, indexed by the number of passages, or an
+            ``(n, 5)`` array for a stack of grids.
+        """
+        return self._result(self._side_counts())
+
+    def dead_ends(self) -> int | np.ndarray:
+        """Count the cells with a single passage.
+
+        Returns
+        -------
+        int or numpy.ndarray
+            The number of dead ends, or an array of them for a stack of
+            grids.
+        """
+        return self._result(self._side_counts()[:, 1])
+
+    def junctions(self) -> int | np.ndarray:
+        """Count the cells with three or four passages, where a path
+        branches.
+
+        Returns
+        -------
+        int or numpy.ndarray
+            The number of junctions, or an array of them for a stack of
+            grids.
+        """
+        return self._result(self._side_counts()[:, 3:].sum(axis=1))
+
+    def corridor_lengths(self) -> np.ndarray:
+        """Count the straight corridors of each length.
+
+        A straight corridor is a row or column of two or more cells joined by
+        passages, which cannot be extended at either end. It is found by
+        run-length encoding the passages of each row and column.
+
+        Returns
+        -------
+        numpy.ndarray
+            The number of straight corridors, indexed by their length in
+            cells, or an ``(n, length)`` array for a stack of grids. The
+            array is as long as the longest corridor of any maze needs.
+        """
+        count = len(self._open_sides)
+        mazes, lengths = (
+            np.concatenate(parts) for parts in zip(
+                _run_lengths(self._east),
+                _run_lengths(self._south.transpose(0, 2, 1)))
+        )
+        width = int(lengths.max()) + 2 if lengths.size else 0
+        return self._result(np.bincount(
+            mazes * width + lengths + 1,
+            minlength=count * width).reshape(count, width))
+
+
+def _locations(solution_path: SolutionPath | list[tuple[int, int]]
+               ) -> np.ndarray:
+    """Get the cell locations of a path as an ``(n, 2)`` array."""
+    return np.asarray(solution_path, dtype=np.intp).reshape(-1, 2)
+
+
+def tortuosity(solution_path: SolutionPath | list[tuple[int, int]]) -> float:
+    """Get how much longer a path is than the shortest route between its
+    ends without walls.
+
+    Parameters
+    ----------
+    solution_path : SolutionPath or list[tuple[int, int]]
+        The solution path, or an ordered list of its cell locations.
+
+    Returns
+    -------
+    float
+        The number of steps of the path divided by the Manhattan distance
+        between its first and last cells, or ``1.0`` if they are the same
+        cell.
+    """
+    locations = _locations(solution_path)
+    steps = len(locations) - 1
+    distance = int(np.abs(locations[-1] - locations[0]).sum())
+    return steps / distance if distance else 1.0
+
+
+def turns(solution_path: SolutionPath | list[tuple[int, int]]) -> int:
+    """Count the changes of direction along a path.
+
+    Parameters
+    ----------
+    solution_path : SolutionPath or list[tuple[int, int]]
+        The solution path, or an ordered list of its cell locations.
+
+    Returns
+    -------
+    int
+        The number of steps that do not go the same way as the step before.
+    """
+    moves = np.diff(_locations(solution_path), axis=0)
+    return int((moves[1:] != moves[:-1]).any(axis=1).sum())
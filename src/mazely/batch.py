@@ -0,0 +1,167 @@
+"""Generation of many mazes at once.
+
+The seeds are split into chunks that run in a pool of processes. Each process
+writes its grids straight into one block of shared memory, so grids are never
+pickled back to the parent.
+"""
+
+import os
+
+import numpy as np
+
+from .algorithms import MazeGenerator, RecursiveBacktracking
+from .maze import Maze
+from .solution_path import SolutionPath
+
+# The number of chunks per worker, so that a slow chunk does not leave the
+# other workers idle.
+_CHUNKS_PER_WORKER = 4
+
+
+def _fill(
+    grids: np.ndarray,
+    first: int,
+    rows: int,
+    columns: int,
+    seeds: list[int],
+    generator: MazeGenerator,
+    solve: bool,
+    packed: bool
+) -> list[SolutionPath]:
+    """Generate the mazes of consecutive seeds into a stack of grids.
+
+    Returns
+    -------
+    list[SolutionPath]
+        The solution path of each maze if `solve` is set, otherwise an empty
+        list.
+    """
+    solution_paths = []
+    for index, seed in enumerate(seeds, first):
+        maze = Maze(rows, columns, seed=seed, generator=generator,
+                    packed=packed)
+        grids[index] = maze.grid
+        if solve:
+            solution_paths.append(maze.solve())
+    return solution_paths
+
+
+def _fill_shared(
+    name: str,
+    shape: tuple[int, ...],
+    dtype: np.dtype,
+    *arguments
+) -> list[SolutionPath]:
+    """Generate mazes into a stack of grids held in shared memory."""
+    from multiprocessing import shared_memory
+
+    memory = shared_memory.SharedMemory(name=name)
+    try:
+        grids = np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+        solution_paths = _fill(grids, *arguments)
+        # The memory cannot be closed while an array uses it.
+        del grids
+    finally:
+        memory.close()
+    return solution_paths
+
+
+def generate_batch(
+    rows: int,
+    columns: int,
+    seeds: list[int],
+    generator: MazeGenerator = RecursiveBacktracking(),
+    solve: bool = False,
+    workers: int | None = None,
+    packed: bool = False
+) -> np.ndarray | tuple[np.ndarray, list[SolutionPath]]:
+    """Generate a maze for each of a sequence of seeds.
+
+    Each maze is the one that ``Maze(rows, columns, seed=seed,
+    generator=generator)`` generates, along with its solution if `solve` is
+    set.
+
+    Parameters
+    ----------
+    rows : int
+        The total number of rows of each maze.
+    columns : int
+        The total number of columns of each maze.
+    seeds : list[int]
+        The seed value of each maze.
+    generator : MazeGenerator
+        An instance of a :class:`.MazeGenerator` subclass used for generating
+        mazes. Defaults to :class:`.RecursiveBacktracking`.
+    solve : bool
+        Whether to also solve each maze between its random start and goal
+        cells. Defaults to ``False``.
+    workers : int, optional
+        The number of processes. Defaults to the number of CPUs. With ``1``,
+        the mazes are generated in the calling process.
+    packed : bool
+        Whether the grids use the packed layout of one ``uint8`` per cell.
+        Defaults to ``False``.
+
+    Returns
+    -------
+    numpy.ndarray or tuple[numpy.ndarray, list[SolutionPath]]
+        The grids of the mazes stacked along a new first axis, in the order
+        of the seeds. If `solve` is set, also the solution path of each maze.
+
+    Raises
+    ------
+    ValueError
+        If the number of workers is not positive.
+
+    Notes
+    -----
+    With more than one worker, the grids are generated into shared memory
+    and then copied out, so the peak memory use is twice the size of the
+    grids. With one worker, they are generated straight into the returned
+    array.
+    """
+    seeds = list(seeds)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("Workers must be positive.")
+
+    shape = (len(seeds), rows, columns) + (() if packed else (4,))
+    dtype = np.dtype(np.uint8 if packed else bool)
+    arguments = (rows, columns, seeds, generator, solve, packed)
+
+    if workers == 1 or len(seeds) <= 1:
+        grids = np.empty(shape, dtype=dtype)
+        solution_paths = _fill(grids, 0, *arguments)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import shared_memory
+
+        size = max(len(seeds) // (workers * _CHUNKS_PER_WORKER), 1)
+        memory = shared_memory.SharedMemory(
+            create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1))
+        try:
+            with ProcessPoolExecutor(workers) as executor:
+                futures = [
+                    executor.submit(
+                        _fill_shared, memory.name, shape, dtype, first,
+                        rows, columns, seeds[first:first + size], generator,
+                        solve, packed
+                    )
+                    for first in range(0, len(seeds), size)
+                ]
+                solution_paths = [solution_path for future in futures
+                                  for solution_path in future.result()]
+            # The shared memory has to be closed and unlinked before
+            # returning, which it refuses while an array still uses it, so
+            # the grids are copied out.
+            shared = np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+            grids = shared.copy()
+            del shared
+        finally:
+            memory.close()
+            memory.unlink()
+
+    if solve:
+        return grids, solution_paths
+    return grids
@@ -0,0 +1,92 @@
+"""Colormaps for drawing solution paths.
+
+A few diverging colormaps from `ColorBrewer <https://colorbrewer2.org/>`_ are
+built in, so that solutions can be colored without importing Matplotlib. They
+are interpolated exactly as Matplotlib interpolates its own copies of them,
+and give the same colors. Any other colormap included with Matplotlib is
+looked up in Matplotlib.
+"""
+
+import numpy as np
+
+# The colors that each built-in colormap interpolates between, evenly spaced.
+_COLORMAPS = {
+    "RdYlGn": (0xa50026, 0xd73027, 0xf46d43, 0xfdae61, 0xfee08b, 0xffffbf,
+               0xd9ef8b, 0xa6d96a, 0x66bd63, 0x1a9850, 0x006837),
+    "RdYlBu": (0xa50026, 0xd73027, 0xf46d43, 0xfdae61, 0xfee090, 0xffffbf,
+               0xe0f3f8, 0xabd9e9, 0x74add1, 0x4575b4, 0x313695),
+    "Spectral": (0x9e0142, 0xd53e4f, 0xf46d43, 0xfdae61, 0xfee08b, 0xffffbf,
+                 0xe6f598, 0xabdda4, 0x66c2a5, 0x3288bd, 0x5e4fa2),
+}
+
+# The number of entries in the lookup table of a colormap, as in Matplotlib.
+_LOOKUP_SIZE = 256
+
+
+def _lookup_table(colors: tuple[int, ...], reverse: bool) -> np.ndarray:
+    """Interpolate a lookup table of RGB values between evenly spaced colors.
+
+    Parameters
+    ----------
+    colors : tuple[int, ...]
+        The colors as ``0xRRGGBB`` integers.
+    reverse : bool
+        Whether to run the colormap from its last color to its first.
+
+    Returns
+    -------
+    numpy.ndarray
+        A ``(256, 3)`` array of RGB values between 0 and 1.
+    """
+    values = np.array(colors)[:, np.newaxis] >> np.array([16, 8, 0]) & 0xff
+    values = values / 255
+    positions = np.linspace(0, 1, len(colors))
+    if reverse:
+        # Matplotlib mirrors the positions rather than the colors.
+        positions = 1 - positions[::-1]
+        values = values[::-1]
+
+    positions = positions * (_LOOKUP_SIZE - 1)
+    steps = (_LOOKUP_SIZE - 1) * np.linspace(0, 1, _LOOKUP_SIZE)
+    index = np.searchsorted(positions, steps)[1:-1]
+    distance = ((steps[1:-1] - positions[index - 1])
+                / (positions[index] - positions[index - 1]))[:, np.newaxis]
+    table = np.concatenate([
+        values[:1],
+        distance * (values[index] - values[index - 1]) + values[index - 1],
+        values[-1:],
+    ])
+    return np.clip(table, 0, 1)
+
+
+def sample_colormap(name: str, count: int) -> np.ndarray:
+    """Sample evenly spaced colors from a colormap.
+
+    Matplotlib is only imported if the colormap is not built in.
+
+    Parameters
+    ----------
+    name : str
+        The name of a colormap included with Matplotlib. The built-in
+        colormaps are ``"RdYlGn"``, ``"RdYlBu"`` and ``"Spectral"``, and their
+        reverses, suffixed with ``"_r"``.
+    count : int
+        The number of colors.
+
+    Returns
+    -------
+    numpy.ndarray
+        A ``(count, 3)`` array of ``uint8`` RGB colors, running from the start
+        to the end of the colormap.
+    """
+    samples = np.linspace(0, 1, count)
+    reverse = name.endswith("_r")
+    colors = _COLORMAPS.get(name[:-2] if reverse else name)
+    if colors is None:
+        import matplotlib as mpl
+        rgb = mpl.colormaps[name](samples)[:, :3]
+    else:
+        index = (samples * _LOOKUP_SIZE).astype(int)
+        rgb = _lookup_table(colors, reverse)[np.minimum(index,
+                                                        _LOOKUP_SIZE - 1)]
+    return np.round(rgb * 255).astype(np.uint8)
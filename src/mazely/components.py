@@ -0,0 +1,253 @@
+"""Labeling of the groups of connected cells of a maze, and reachability
+queries between cells.
+
+Two neighboring cells are connected if the wall between them is open from
+either side, so a search that respects the walls never crosses from one
+group to another. The groups are found with whole-array operations, as in
+:class:`.Kruskal`: in each round, every group joins the lowest-labeled group
+next to it, and the joined groups are relabeled with pointer jumping. Each
+round at least halves the number of groups that can still be joined.
+"""
+
+import numpy as np
+
+from .grid import wall_planes
+
+
+def passages(grid: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Find the open walls between neighboring cells.
+
+    Parameters
+    ----------
+    grid : numpy.ndarray
+        A two-dimensional array of cells representing a rectangular maze, in
+        either layout.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray]
+        A ``(rows, columns - 1)`` Boolean array of whether each cell is
+        connected to its eastern neighbor, and a ``(rows - 1, columns)``
+        array of whether it is connected to its southern neighbor.
+    """
+    north, south, east, west = wall_planes(grid)
+    return ~(east[:, :-1] & west[:, 1:]), ~(south[:-1] & north[1:])
+
+
+def _jump(parent: np.ndarray) -> np.ndarray:
+    """Point every node of a forest at its root."""
+    while True:
+        grandparent = parent[parent]
+        if np.array_equal(grandparent, parent):
+            return parent
+        parent = grandparent
+
+
+def _contract(parent: np.ndarray) -> tuple[np.ndarray, int]:
+    """Join the groups that point at each other or along chains.
+
+    Parameters
+    ----------
+    parent : numpy.ndarray
+        The group each group points at, itself if none. Only two groups
+        that point at each other may form a cycle.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, int]
+        The new label of each group, numbered from zero, and the number of
+        joined groups.
+    """
+    labels = np.arange(len(parent))
+    # Of two groups that point at each other, the lower one becomes the
+    # root of the joined group.
+    roots = (parent[parent] == labels) & (labels <= parent)
+    parent = np.where(roots, labels, parent)
+    relabel = np.cumsum(roots) - 1
+    return relabel[_jump(parent)], int(relabel[-1]) + 1
+
+
+def _join(first: np.ndarray, second: np.ndarray, groups: int) -> np.ndarray:
+    """Label the connected groups of a graph.
+
+    Parameters
+    ----------
+    first : numpy.ndarray
+        The first node of each edge.
+    second : numpy.ndarray
+        The second node of each edge.
+    groups : int
+        The total number of nodes.
+
+    Returns
+    -------
+    numpy.ndarray
+        The label of the group of each node, numbered from zero.
+    """
+    # The relabeling of each round, applied to the nodes at the end.
+    relabelings = []
+    while True:
+        # Drop the edges within a group, which can join nothing.
+        between = first != second
+        first = first[between]
+        second = second[between]
+        if not len(first):
+            break
+
+        # Point each group at the lowest-labeled group next to it.
+        lowest = np.full(groups, groups)
+        np.minimum.at(lowest, first, second)
+        np.minimum.at(lowest, second, first)
+        parent = np.where(lowest < groups, lowest, np.arange(groups))
+        relabeling, groups = _contract(parent)
+        relabelings.append(relabeling)
+        first = relabeling[first]
+        second = relabeling[second]
+
+    # Compose the relabelings from the last, whose arrays are the shortest.
+    labels = np.arange(groups)
+    for relabeling in reversed(relabelings):
+        labels = labels[relabeling]
+    return labels
+
+
+def label_components(grid: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Label the groups of connected cells of a maze.
+
+    Parameters
+    ----------
+    grid : numpy.ndarray
+        A two-dimensional array of cells representing a rectangular maze, in
+        either layout.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, numpy.ndarray]
+        A ``(rows, columns)`` array of the ``int32`` label of the group of
+        each cell, numbered from zero in no particular order, and the number
+        of cells of each group by label.
+    """
+    rows, columns = grid.shape[:2]
+    east, south = passages(grid)
+
+    # In the first round, each cell points at its lowest connected
+    # neighbor, which is found by shifting whole planes rather than edge by
+    # edge: the northern neighbor, else the western, eastern or southern.
+    offsets = np.zeros((rows, columns), dtype=np.intp)
+    offsets[:-1] = south * columns
+    offsets[:, :-1] = np.where(east, 1, offsets[:, :-1])
+    offsets[:, 1:] = np.where(east, -1, offsets[:, 1:])
+    offsets[1:] = np.where(south, -columns, offsets[1:])
+    cells = np.arange(rows * columns).reshape(rows, columns)
+    labels, groups = _contract((cells + offsets).ravel())
+    labels = labels.reshape(rows, columns)
+
+    # Join the groups across the passages that are left.
+    east &= labels[:, :-1] != labels[:, 1:]
+    south &= labels[:-1] != labels[1:]
+    first = np.concatenate([labels[:, :-1][east], labels[:-1][south]])
+    second = np.concatenate([labels[:, 1:][east], labels[1:][south]])
+    labels = _join(first, second, groups)[labels].astype(np.int32)
+    return labels, np.bincount(labels.ravel())
+
+
+class Components:
+    """The groups of connected cells of a maze, for reachability queries.
+
+    Labeling the cells takes a few passes over the whole maze with array
+    operations. Afterwards, whether one cell can be reached from another is
+    a comparison of their labels.
+
+    The labels are read from the grid once, so they have to be found again
+    after the walls change.
+
+    Parameters
+    ----------
+    grid : numpy.ndarray
+        A two-dimensional array of cells representing a rectangular maze, in
+        either layout.
+
+    Attributes
+    ----------
+    labels : numpy.ndarray
+        A ``(rows, columns)`` array of the ``int32`` label of the group of
+        each cell, numbered from zero in no particular order.
+    sizes : numpy.ndarray
+        The number of cells of each group by label.
+    """
+
+    def __init__(self, grid: np.ndarray):
+        self.labels, self.sizes = label_components(grid)
+
+    def label(self, cell: tuple[int, int]) -> int:
+        """Get the label of the group of a cell.
+
+        Parameters
+        ----------
+        cell : tuple[int, int]
+            The location of the cell.
+
+        Returns
+        -------
+        int
+            The label.
+
+        Raises
+        ------
+        ValueError
+            If the cell is outside the maze.
+        """
+        row, column = cell
+        rows, columns = self.labels.shape
+        if row < 0 or row >= rows:
+            raise ValueError("Row is out of range.")
+        if column < 0 or column >= columns:
+            raise ValueError("Column is out of range.")
+        return int(self.labels[row, column])
+
+    def size(self, cell: tuple[int, int]) -> int:
+        """Get the number of cells of the group of a cell.
+
+        Parameters
+        ----------
+        cell : tuple[int, int]
+            The location of the cell.
+
+        Returns
+        -------
+        int
+            The number of cells, including the cell itself.
+
+        Raises
+        ------
+        ValueError
+            If the cell is outside the maze.
+        """
+        return int(self.sizes[self.label(cell)])
+
+    def is_reachable(
+        self,
+        start: tuple[int, int],
+        goal: set[tuple[int, int]]
+    ) -> bool:
+        """Whether any goal cell can be reached from the start cell.
+
+        Parameters
+        ----------
+        start : tuple[int, int]
+            The location of the start cell.
+        goal : set[tuple[int, int]]
+            The location(s) of the goal cell(s).
+
+        Returns
+        -------
+        bool
+            ``True`` if a goal cell is in the same group as the start cell.
+
+        Raises
+        ------
+        ValueError
+            If a cell is outside the maze.
+        """
+        label = self.label(start)
+        return any(self.label(cell) == label for cell in goal)
@@ -0,0 +1,176 @@
+"""Conversions between the two wall layouts of a grid.
+
+A grid is either a ``(rows, columns, 4)`` Boolean array holding the walls of
+each cell in NSEW order, or a packed ``(rows, columns)`` ``uint8`` array in
+which bit ``i`` of a cell holds the wall of direction ``i``. The packed layout
+takes a quarter of the memory and lets walls be queried with bitwise
+operations on whole arrays.
+"""
+
+import numpy as np
+
+NORTH = 1
+SOUTH = 2
+EAST = 4
+WEST = 8
+ALL_WALLS = NORTH | SOUTH | EAST | WEST
+
+
+def is_packed(grid: np.ndarray) -> bool:
+    """Whether a grid uses the packed layout.
+
+    Parameters
+    ----------
+    grid : numpy.ndarray
+        A two-dimensional array of cells representing a rectangular maze.
+
+    Returns
+    -------
+    bool
+        ``True`` if the grid holds one ``uint8`` per cell.
+    """
+    return grid.ndim == 2
+
+
+def pack_grid(grid: np.ndarray) -> np.ndarray:
+    """Convert a grid to the packed layout.
+
+    Parameters
+    ----------
+    grid : numpy.ndarray
+        A two-dimensional array of cells representing a rectangular maze, in
+        either layout.
+
+    Returns
+    -------
+    numpy.ndarray
+        A ``(rows, columns)`` array of ``uint8`` wall bits. A packed grid is
+        returned as is.
+    """
+    if is_packed(grid):
+        return grid
+    return np.packbits(grid, axis=-1, bitorder="little")[..., 0]
+
+
+def unpack_grid(grid: np.ndarray) -> np.ndarray:
+    """Convert a grid to the ``(rows, columns, 4)`` Boolean layout.
+
+    Parameters
+    ----------
+    grid : numpy.ndarray
+        A two-dimensional array of cells representing a rectangular maze, in
+        either layout.
+
+    Returns
+    -------
+    numpy.ndarray
+        A ``(rows, columns, 4)`` array of Boolean walls in NSEW order. An
+        unpacked grid is returned as is.
+    """
+    if not is_packed(grid):
+        return grid
+    return np.unpackbits(
+        grid[..., np.newaxis], axis=-1, count=4, bitorder="little"
+    ).astype(bool)
+
+
+def wall_planes(grid: np.ndarray) -> np.ndarray:
+    """Get the walls of every cell, one plane per direction.
+
+    Parameters
+    ----------
+    grid : numpy.ndarray
+        A two-dimensional array of cells representing a rectangular maze, in
+        either layout.
+
+    Returns
+    -------
+    numpy.ndarray
+        A ``(4, rows, columns)`` Boolean array in NSEW order. For an unpacked
+        grid, this is a view.
+    """
+    if is_packed(grid):
+        return (grid >> np.arange(4, dtype=np.uint8)[:, np.newaxis,
+                                                     np.newaxis]) & 1 == 1
+    return np.moveaxis(grid, -1, 0)
+
+
+def sealed_walls(grid: np.ndarray) -> np.ndarray:
+    """Get the packed walls of a grid with its outer border closed.
+
+    Solvers use this so that no move ever leaves the grid, even if a border
+    wall is missing.
+
+    Parameters
+    ----------
+    grid : numpy.ndarray
+        A two-dimensional array of cells representing a rectangular maze, in
+        either layout.
+
+    Returns
+    -------
+    numpy.ndarray
+        A new ``(rows, columns)`` array of ``uint8`` wall bits.
+    """
+    walls = pack_grid(grid).copy()
+    walls[0] |= NORTH
+    walls[-1] |= SOUTH
+    walls[:, -1] |= EAST
+    walls[:, 0] |= WEST
+    return walls
+
+
+def has_wall(
+    grid: np.ndarray,
+    cell: tuple[int, int],
+    direction: int
+) -> bool:
+    """Whether a cell has a wall in a direction.
+
+    Parameters
+    ----------
+    grid : numpy.ndarray
+        A two-dimensional array of cells representing a rectangular maze, in
+        either layout.
+    cell : tuple[int, int]
+        The location of the cell.
+    direction : int
+        The index of the wall in NSEW order.
+
+    Returns
+    -------
+    bool
+        ``True`` if the wall exists.
+    """
+    if is_packed(grid):
+        return bool(grid[cell] >> direction & 1)
+    return bool(grid[cell][direction])
+
+
+def set_wall(
+    grid: np.ndarray,
+    cell: tuple[int, int],
+    direction: int,
+    wall: bool
+):
+    """Add or remove one wall of a cell, in place.
+
+    Parameters
+    ----------
+    grid : numpy.ndarray
+        A two-dimensional array of cells representing a rectangular maze, in
+        either layout.
+    cell : tuple[int, int]
+        The location of the cell.
+    direction : int
+        The index of the wall in NSEW order.
+    wall : bool
+        Whether the wall exists.
+    """
+    if is_packed(grid):
+        if wall:
+            grid[cell] |= 1 << direction
+        else:
+            grid[cell] &= ~(1 << direction) & ALL_WALLS
+    else:
+        grid[cell][direction] = wall
@@ -0,0 +1,233 @@
+"""Optional measurements of generating, solving, loading and saving mazes.
+
+The instrumented methods are :meth:`.MazeGenerator.generate` and
+:meth:`.MazeSolver.solve` of every subclass, :meth:`.Maze.load_maze`,
+:meth:`.Maze.save_maze`, :meth:`.Maze.save_binary` and the writers of
+:class:`.Utilities`. Each call to one of them is measured only while a hook
+is registered, with :func:`add_hook` or :func:`instrument`. Otherwise the
+only cost is checking whether there are hooks.
+
+Each measured call produces a :class:`Stats` object, which is passed to every
+hook and can also be read back with :func:`last_stats`::
+
+    with instrument() as records:
+        maze = Maze(256, 256)
+        maze.solve()
+    for stats in records:
+        print(stats)
+
+Hooks are shared by all threads. The measurements of each call are kept apart
+from the objects whose methods were called, which may be shared: each thread
+and each :mod:`contextvars` context sees only its own calls.
+"""
+
+import functools
+import inspect
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# The callbacks that receive the measurements of each instrumented call.
+_hooks = []
+# The measurements of the call in progress, and of the last measured call.
+_current = ContextVar("current", default=None)
+_last = ContextVar("last", default=None)
+# The object whose call is being measured. An override that calls the method
+# it overrides on the same object is measured once, as one call.
+_measured = ContextVar("measured", default=None)
+
+
+class Stats:
+    """The measurements of one call to an instrumented method.
+
+    Measurements that do not apply to the method are :obj:`None`.
+
+    Attributes
+    ----------
+    operation : str
+        The qualified name of the method, such as
+        ``"RecursiveBacktracking.generate"``.
+    seconds : float
+        The wall-clock time of the call.
+    cells_visited : int, optional
+        The total number of cells that were generated, reached, parsed or
+        drawn.
+    nodes_expanded : int, optional
+        The total number of cells whose neighbors were explored by a solver.
+    queue_peak : int, optional
+        The most cells held at once in the queue or frontier of a solver.
+    bytes_written : int, optional
+        The size of the file that was written.
+    """
+
+    def __init__(
+        self,
+        operation: str,
+        seconds: float,
+        cells_visited: int | None = None,
+        nodes_expanded: int | None = None,
+        queue_peak: int | None = None,
+        bytes_written: int | None = None
+    ):
+        self.operation = operation
+        self.seconds = seconds
+        self.cells_visited = cells_visited
+        self.nodes_expanded = nodes_expanded
+        self.queue_peak = queue_peak
+        self.bytes_written = bytes_written
+
+    def as_dict(self) -> dict[str, str | float | int | None]:
+        """Get the measurements as a dictionary.
+
+        Returns
+        -------
+        dict[str, str | float | int | None]
+            The attributes by name.
+        """
+        return dict(vars(self))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}"
+                           for name, value in vars(self).items()
+                           if value is not None)
+        return f"{type(self).__name__}({fields})"
+
+
+def current_stats() -> Stats | None:
+    """Get the measurements of the instrumented call in progress.
+
+    Instrumented methods use this to fill in their counts, and skip the
+    bookkeeping when the call is not measured.
+
+    Returns
+    -------
+    Stats or None
+        The measurements of the innermost instrumented call in progress, or
+        :obj:`None` if it is not measured.
+    """
+    return _current.get()
+
+
+def last_stats() -> Stats | None:
+    """Get the measurements of the last measured call.
+
+    Returns
+    -------
+    Stats or None
+        The measurements of the last instrumented call that returned while a
+        hook was registered, in the current thread or context, or
+        :obj:`None` if there was none.
+    """
+    return _last.get()
+
+
+def add_hook(hook: Callable[[Stats], object]):
+    """Register a callback to receive the measurements of every instrumented
+    call.
+
+    Parameters
+    ----------
+    hook : Callable[[Stats], object]
+        A callback taking a :class:`Stats` object.
+    """
+    _hooks.append(hook)
+
+
+def remove_hook(hook: Callable[[Stats], object]):
+    """Unregister a callback registered with :func:`add_hook`.
+
+    Parameters
+    ----------
+    hook : Callable[[Stats], object]
+        The callback.
+
+    Raises
+    ------
+    ValueError
+        If the callback is not registered.
+    """
+    _hooks.remove(hook)
+
+
+@contextmanager
+def instrument(
+    hook: Callable[[Stats], object] | None = None
+) -> Iterator[list[Stats]]:
+    """Measure the instrumented calls made within a ``with`` block.
+
+    Parameters
+    ----------
+    hook : Callable[[Stats], object], optional
+        A callback to also receive each :class:`Stats` object as it is
+        produced. Defaults to :obj:`None`.
+
+    Yields
+    ------
+    list[Stats]
+        The measurements of the calls made so far, in the order in which the
+        calls returned.
+    """
+    records = []
+
+    def record(stats: Stats):
+        records.append(stats)
+        if hook is not None:
+            hook(stats)
+
+    add_hook(record)
+    try:
+        yield records
+    finally:
+        remove_hook(record)
+
+
+def instrumented(
+    collect: Callable[..., object] | None = None
+) -> Callable[[Callable], Callable]:
+    """Make a decorator that measures calls to a method while any hook is
+    registered.
+
+    Parameters
+    ----------
+    collect : Callable[..., object], optional
+        A function called with the :class:`Stats` object, the instance, the
+        result and the arguments by name of each measured call, to fill in
+        the measurements beyond the time and those the method filled in
+        itself through :func:`current_stats`. Defaults to :obj:`None`.
+
+    Returns
+    -------
+    Callable[[Callable], Callable]
+        The decorator.
+    """
+    def decorate(method: Callable) -> Callable:
+        signature = None
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not _hooks or _measured.get() is self:
+                return method(self, *args, **kwargs)
+            stats = Stats(f"{type(self).__name__}.{method.__name__}", 0.0)
+            token = _current.set(stats)
+            measured_token = _measured.set(self)
+            began = time.perf_counter()
+            try:
+                result = method(self, *args, **kwargs)
+            finally:
+                stats.seconds = time.perf_counter() - began
+                _measured.reset(measured_token)
+                _current.reset(token)
+            if collect is not None:
+                nonlocal signature
+                if signature is None:
+                    signature = inspect.signature(method)
+                arguments = signature.bind(self, *args, **kwargs)
+                arguments.apply_defaults()
+                collect(stats, self, result, arguments.arguments)
+            _last.set(stats)
+            for hook in tuple(_hooks):
+                hook(stats)
+            return result
+        return wrapper
+    return decorate
@@ -1,10 +1,34 @@
+import os
 import random
 import sys
 
 import numpy as np
 
+from . import algorithms
 from .algorithms import (MazeGenerator, MazeSolver, RecursiveBacktracking,
                          ShortestPath)
+from .components import Components
+from .grid import pack_grid, set_wall, unpack_grid
+from .instrumentation import Stats, instrumented
+from .maze_file import read_binary, read_maze, write_binary, write_maze
+from .path_queries import PathQueries
+from .solution_path import SolutionPath
+from .validation import validate_grid
+
+# The most solutions kept while the grid is unchanged. The least recently
+# used one is dropped first.
+_SOLUTION_CACHE_SIZE = 8
+
+
+def _loaded(stats: Stats, maze: "Maze", _, __):
+    """Collect the number of cells parsed."""
+    stats.cells_visited = maze.grid_size
+
+
+def _saved(stats: Stats, maze: "Maze", _, arguments: dict):
+    """Collect the number of cells saved and the size of the file written."""
+    stats.cells_visited = maze.grid_size
+    stats.bytes_written = os.path.getsize(arguments["path"])
 
 
 class Maze:
@@ -18,10 +42,17 @@ class Maze:
         The total number of columns in the maze. Defaults to ``3``.
     grid : numpy.ndarray
         A two-dimensional array of cells representing a rectangular maze.
+        Either a ``(rows, columns, 4)`` Boolean array of walls in NSEW order,
+        or a ``(rows, columns)`` ``uint8`` array of wall bits if
+        :attr:`packed` is set. Assigning a grid or changing a wall with
+        :meth:`remove_wall` or :meth:`add_wall` discards cached solutions;
+        other in-place edits should be followed by assigning the grid to
+        itself.
     grid_size : int
         The total number of cells in the maze.
-    solution_path : list[tuple[int, int]]
-        An ordered list of cell locations representing the solution path.
+    solution_path : SolutionPath
+        The solution path, found on first access and cached until the grid,
+        start, goal or solver changes.
     start : tuple[int, int]
         The location of the start cell.
     goal : set[tuple[int, int]]
@@ -29,13 +60,20 @@ class Maze:
     path : str, optional
         A path to a maze file. Defaults to :obj:`None`.
     seed : int
-        The seed value used to initialize the random number generator.
+        The seed value used to initialize the random number generators of
+        :attr:`generator` and :meth:`get_random_cell`. Defaults to a random
+        seed drawn for each maze.
     generator : MazeGenerator
         An instance of a :class:`.MazeGenerator` subclass used for generating
         mazes. Defaults to :class:`.RecursiveBacktracking`.
     solver : MazeSolver
         An instance of a :class:`.MazeSolver` subclass used for solving mazes.
-        Defaults to :class:`.ShortestPath`.
+        Defaults to :class:`.ShortestPath`. Use
+        :class:`.IncrementalShortestPath` to re-solve quickly after editing
+        walls with :meth:`remove_wall` and :meth:`add_wall`.
+    packed : bool
+        Whether :attr:`grid` uses the packed layout of one ``uint8`` per cell.
+        Defaults to ``False``.
     """
 
     def __init__(
@@ -43,13 +81,24 @@ class Maze:
         rows: int = 3,
         columns: int = 3,
         path: str | None = None,
-        seed: int = random.randrange(sys.maxsize),
+        seed: int | None = None,
         generator: MazeGenerator = RecursiveBacktracking(),
         solver: MazeSolver = ShortestPath(),
+        packed: bool = False,
     ):
+        if seed is None:
+            seed = random.randrange(sys.maxsize)
         self.generator = generator
         self.solver = solver
         self.seed = seed
+        self.packed = packed
+        self._random = self._cell_random(seed)
+
+        # Solutions by solver, start and goal, discarded whenever the grid
+        # changes.
+        self._solutions = {}
+        self._path_queries = None
+        self._components = None
 
         if path is not None:
             self.load_maze(path)
@@ -57,12 +106,54 @@ class Maze:
             self.rows = rows
             self.columns = columns
             self.grid_size = rows * columns
-            self.grid = self.generator.generate(rows, columns, seed=seed)
+            self.grid = self._to_layout(
+                self.generator.generate(rows, columns, seed=seed))
             self.start = self.get_random_cell()
             self.goal = {self.get_random_cell()}
 
-        self.solution_path = self.solver.solve(
-            self.grid, self.start, self.goal)
+    @property
+    def grid(self) -> np.ndarray:
+        """The walls of the maze."""
+        return self._grid
+
+    @grid.setter
+    def grid(self, grid: np.ndarray):
+        self._grid = grid
+        self._grid_changed()
+
+    @property
+    def solution_path(self) -> SolutionPath:
+        """The solution path, found on first access and then cached."""
+        return self.solve()
+
+    def _grid_changed(self, *cells: tuple[int, int]):
+        """Discard the solutions and other results cached for the grid.
+
+        The solver is told which cells changed, or is reset if none are
+        given.
+        """
+        if cells:
+            self.solver.update_walls(self.grid, *cells)
+        else:
+            self.solver.reset()
+        self._solutions.clear()
+        self._path_queries = None
+        self._components = None
+
+    @staticmethod
+    def _cell_random(seed: int) -> random.Random:
+        """Get the random number generator that picks random cells.
+
+        It is seeded apart from the generator's, which starts from the same
+        seed, so the cells it picks do not follow the carving order.
+        """
+        return random.Random(f"{seed}:cells")
+
+    def _to_layout(self, grid: np.ndarray) -> np.ndarray:
+        """Convert a grid to the layout selected by :attr:`packed`."""
+        if self.packed:
+            return pack_grid(grid)
+        return unpack_grid(grid)
 
     @staticmethod
     def are_cells_adjacent(*cells: tuple[int, int]) -> bool:
@@ -83,6 +174,7 @@ class Maze:
                 return False
         return True
 
+    @instrumented(_loaded)
     def load_maze(self, path: str):
         """Parse a maze file.
 
@@ -91,66 +183,97 @@ class Maze:
         path : str
             A path to a maze file.
         """
-        with open(path, "r") as file:
-            # Parse the file into a list of strings of lines.
-            lines = [line.strip() for line in file if not line.isspace()]
-
-            # Update the attributes.
-            self.rows = len(lines) // 2
-            self.columns = len(lines[0]) // 4
-            self.grid_size = self.rows * self.columns
-            self.grid = np.full((self.rows, self.columns, 4), [False] * 4)
-
-            # Initiate store-purpose variables
-            goal = []
-            start = []
-
-            # Iterate over each possible cell position and update the wall
-            # details of the current cell.
-            for row in range(self.rows):
-                for column in range(self.columns):
-                    # If the current cell is the start.
-                    if lines[row * 2 + 1][column * 4 + 2] == "S":
-                        start.append((row, column))
-
-                    # If the current cell is the goal.
-                    elif lines[row * 2 + 1][column * 4 + 2] == "G":
-                        goal.append((row, column))
-
-                    # If a north wall exists.
-                    if lines[row * 2][column * 4 + 2] == "-":
-                        self.grid[row][column][0] = True
-
-                    # If a south wall exists.
-                    if lines[row * 2 + 2][column * 4 + 2] == "-":
-                        self.grid[row][column][1] = True
-
-                    # If an east wall exists.
-                    if lines[row * 2 + 1][column * 4 + 4] == "|":
-                        self.grid[row][column][2] = True
-
-                    # If a west wall exists.
-                    if lines[row * 2 + 1][column * 4] == "|":
-                        self.grid[row][column][3] = True
-
-            # Update the start attribute
-            if len(start) > 0:
-                self.start = start[0]
-            else:
-                self.start = self.get_random_cell()
+        grid, start, goal = read_maze(path)
 
-            # Update the goal attribute
-            if len(goal) == 0:
-                self.goal = {self.get_random_cell()}
-            else:
-                self.goal = set()
-                self.add_goal_cells(*goal)
+        # Update the attributes.
+        self.rows, self.columns = grid.shape
+        self.grid_size = self.rows * self.columns
+        self.grid = self._to_layout(grid)
+
+        # Update the start attribute
+        if len(start) > 0:
+            self.start = start[0]
+        else:
+            self.start = self.get_random_cell()
+
+        # Update the goal attribute
+        if len(goal) == 0:
+            self.goal = {self.get_random_cell()}
+        else:
+            self.goal = set()
+            self.add_goal_cells(*goal)
+
+    @instrumented(_saved)
+    def save_maze(self, path: str):
+        """Save the maze as a maze file.
+
+        The start cell is marked ``S`` and the goal cell(s) ``G``, so that
+        :meth:`load_maze` reads the same maze back.
+
+        Parameters
+        ----------
+        path : str
+            A path wherein the maze file is saved.
+        """
+        write_maze(path, self.grid, self.start, self.goal)
+
+    @instrumented(_saved)
+    def save_binary(self, path: str):
+        """Save the maze as a binary file.
+
+        The file holds the size, seed, start and goal cells and generator name
+        of the maze, followed by its packed grid.
+
+        Parameters
+        ----------
+        path : str
+            A path wherein the binary file is saved.
+        """
+        write_binary(path, pack_grid(self.grid), self.start, self.goal,
+                     seed=self.seed, generator=type(self.generator).__name__)
+
+    def load_binary(self, path: str, mmap_mode: str = "r"):
+        """Load a binary file saved with :meth:`save_binary`.
+
+        The grid is memory-mapped rather than read. If :attr:`packed` is set,
+        :attr:`grid` is the memory map itself, so loading is nearly instant
+        and processes that load the same file share its pages. Otherwise, the
+        grid is unpacked into memory.
+
+        Parameters
+        ----------
+        path : str
+            A path to a binary file.
+        mmap_mode : str
+            The mode of the memory map, as in :class:`numpy.memmap`. The
+            default ``"r"`` makes a packed :attr:`grid` read-only; use ``"c"``
+            to allow changes in memory, or ``"r+"`` to write them to the file.
+        """
+        grid, start, goal, seed, generator = read_binary(path, mmap_mode)
+
+        self.rows, self.columns = grid.shape
+        self.grid_size = self.rows * self.columns
+        self.grid = self._to_layout(grid)
+        self.start = start
+        self.goal = goal
+        self.seed = seed
+        if seed is not None:
+            self._random = self._cell_random(seed)
+
+        # Restore the generator if it is one of the built-in generators.
+        generator_class = getattr(algorithms, generator, None)
+        if (
+            isinstance(generator_class, type)
+            and issubclass(generator_class, MazeGenerator)
+            and not isinstance(self.generator, generator_class)
+        ):
+            self.generator = generator_class()
 
     def generate(
         self,
         rows: int,
         columns: int,
-        seed: int = random.randrange(sys.maxsize)
+        seed: int | None = None
     ):
         """Generate a new maze and overwrite to :attr:`grid`.
 
@@ -160,19 +283,156 @@ class Maze:
             The total number of rows of the maze.
         columns : int
             The total number of columns of the maze.
-        seed : int
+        seed : int, optional
             The seed value used to initialize the random number generator.
+            Defaults to a random seed.
         """
+        if seed is None:
+            seed = random.randrange(sys.maxsize)
         self.seed = seed
+        self._random = self._cell_random(seed)
         self.rows = rows
         self.columns = columns
         self.grid_size = rows * columns
-        self.grid = self.generator.generate(rows, columns, seed=seed)
+        self.grid = self._to_layout(
+            self.generator.generate(rows, columns, seed=seed))
+
+    def solve(self) -> SolutionPath:
+        """Solve the maze with a specific configuration.
+
+        The solution is cached, so solving again without changing the grid,
+        start, goal or solver returns the cached solution. The solutions of
+        the last few configurations are kept. Once the groups of
+        connected cells are labeled, as by :meth:`components`, a goal in
+        another group than the start cell is found unreachable without
+        searching.
+
+        Returns
+        -------
+        SolutionPath
+            The solution path, or :obj:`None` if no goal cell can be reached.
+        """
+        key = (self.solver, self.start, frozenset(self.goal))
+        if key in self._solutions:
+            # Move the solution to the end, as the most recently used.
+            solution_path = self._solutions.pop(key)
+            self._solutions[key] = solution_path
+            return solution_path
+
+        components = self._components
+        if components is not None and not components.is_reachable(
+                self.start, self.goal):
+            solution_path = None
+        else:
+            solution_path = self.solver.solve(self.grid, self.start,
+                                              self.goal)
+            if solution_path is None and components is None:
+                # Label the cells after the first failed search, so that
+                # later failures on the same grid need no search.
+                self.components()
+        self._solutions[key] = solution_path
+        if len(self._solutions) > _SOLUTION_CACHE_SIZE:
+            del self._solutions[next(iter(self._solutions))]
+        return solution_path
+
+    def distance_map(self) -> np.ndarray:
+        """Get the distance of every cell to the nearest goal cell.
+
+        A shortest path from any cell can then be read off the map with
+        :meth:`.MazeSolver.follow_distance_map`.
+
+        Returns
+        -------
+        numpy.ndarray
+            A ``(rows, columns)`` array of ``int32`` distances, ``-1`` for the
+            cells from which no goal cell can be reached.
+        """
+        return self.solver.distance_map(self.grid, self.goal)
+
+    def solve_many(
+        self,
+        starts: np.ndarray,
+        next_step_only: bool = False
+    ) -> list[SolutionPath | None] | np.ndarray:
+        """Solve the maze from many start cells to the goal cell(s) at once.
+
+        See :meth:`.MazeSolver.solve_many`.
+
+        Parameters
+        ----------
+        starts : numpy.ndarray
+            An ``(n, 2)`` array of the locations of the start cells.
+        next_step_only : bool
+            Whether to only get the cell that each start cell moves to first.
+            Defaults to ``False``.
+
+        Returns
+        -------
+        list[SolutionPath | None] or numpy.ndarray
+            The solution path of each start cell, or the next cell of each
+            start cell as an ``(n, 2)`` ``int32`` array if `next_step_only` is
+            set.
+        """
+        return self.solver.solve_many(self.grid, starts, self.goal,
+                                      next_step_only)
+
+    def path_queries(self) -> PathQueries:
+        """Get a query engine for the shortest paths between any two cells.
+
+        The engine is built on first use and kept until the grid changes, so
+        that many queries share its precomputation.
+
+        Returns
+        -------
+        PathQueries
+            The query engine of the current grid.
+        """
+        if self._path_queries is None:
+            self._path_queries = PathQueries(self.grid)
+        return self._path_queries
+
+    def validate(self, connected: bool = True, perfect: bool = False):
+        """Check that the maze is consistent.
+
+        The start and goal cells must be inside the maze, and the grid must
+        pass :func:`~mazely.validation.validate_grid`. This is worth doing
+        after loading a maze from a file or changing its walls.
+
+        Parameters
+        ----------
+        connected : bool
+            Whether to check that all the cells are connected. Defaults to
+            ``True``.
+        perfect : bool
+            Whether to check that there is exactly one path between any two
+            cells. Defaults to ``False``.
+
+        Raises
+        ------
+        ValueError
+            If any check fails.
+        """
+        for cell in (self.start, *self.goal):
+            if not (0 <= cell[0] < self.rows and 0 <= cell[1] < self.columns):
+                raise ValueError(f"Cell {cell} is out of range.")
+        validate_grid(self.grid, connected, perfect)
 
-    def solve(self):
-        """Solve the maze with a specific configuration."""
-        self.solution_path = self.solver.solve(
-            self.grid, self.start, self.goal)
+    def components(self) -> Components:
+        """Get the groups of connected cells of the maze.
+
+        The groups are labeled on first use and kept until the grid changes.
+        While they are kept, :meth:`solve` answers that no goal cell can be
+        reached without searching. They are also labeled after a search finds
+        no path.
+
+        Returns
+        -------
+        Components
+            The groups of the current grid.
+        """
+        if self._components is None:
+            self._components = Components(self.grid)
+        return self._components
 
     def set_start_cell(self, row: int, column: int):
         """Set a cell location as the start cell.
@@ -244,7 +504,59 @@ class Maze:
         tuple[int, int]
             The location of a random cell.
         """
-        return (random.randrange(self.rows), random.randrange(self.columns))
+        return (self._random.randrange(self.rows),
+                self._random.randrange(self.columns))
+
+    def _wall_bits(self, *cells: tuple[int, int]) -> list[int]:
+        """Get the packed wall bits of cells."""
+        rows, columns = zip(*cells)
+        walls = self.grid[list(rows), list(columns)]
+        return pack_grid(walls[np.newaxis])[0].tolist()
+
+    def _set_wall_between(
+        self,
+        cell: tuple[int, int],
+        neighbor: tuple[int, int],
+        wall: bool
+    ) -> bool:
+        """Add or remove the wall between a cell and its neighbor."""
+        # Both cells must be inside the maze, or negative indices would wrap
+        # around to the other side of the grid.
+        for row, column in (cell, neighbor):
+            if not (0 <= row < self.rows and 0 <= column < self.columns):
+                return False
+        before = self._wall_bits(cell, neighbor)
+
+        # If both cells share the same column.
+        if cell[1] == neighbor[1]:
+            # If both cells are beside each other row-wise
+            if abs(cell[0] - neighbor[0]) != 1:
+                return False
+            if cell[0] < neighbor[0]:
+                set_wall(self.grid, cell, 1, wall)
+                set_wall(self.grid, neighbor, 0, wall)
+            else:
+                set_wall(self.grid, cell, 0, wall)
+                set_wall(self.grid, neighbor, 1, wall)
+
+        # If both cells share the same row.
+        elif cell[0] == neighbor[0]:
+            # If both cells are beside each other column-wise
+            if abs(cell[1] - neighbor[1]) != 1:
+                return False
+            if cell[1] < neighbor[1]:
+                set_wall(self.grid, cell, 2, wall)
+                set_wall(self.grid, neighbor, 3, wall)
+            else:
+                set_wall(self.grid, cell, 3, wall)
+                set_wall(self.grid, neighbor, 2, wall)
+        else:
+            return False
+
+        # Keep the cached results if the wall was already as requested.
+        if self._wall_bits(cell, neighbor) != before:
+            self._grid_changed(cell, neighbor)
+        return True
 
     def remove_wall(
         self,
@@ -265,29 +577,25 @@ class Maze:
         bool
             Whether the wall removal is successful.
         """
-        # If both cells share the same column.
-        if cell[1] == neighbor[1]:
-            # If both cells are beside each other row-wise
-            if abs(cell[0] - neighbor[0]) == 1:
-                if cell[0] < neighbor[0]:
-                    self.grid[cell[0]][cell[1]][1] = False
-                    self.grid[neighbor[0]][neighbor[1]][0] = False
-                else:
-                    self.grid[cell[0]][cell[1]][0] = False
-                    self.grid[neighbor[0]][neighbor[1]][1] = False
-                return True
-            return False
+        return self._set_wall_between(cell, neighbor, False)
 
-        # If both cells share the same row.
-        elif cell[0] == neighbor[0]:
-            # If both cells are beside each other column-wise
-            if abs(cell[1] - neighbor[1]) == 1:
-                if cell[1] < neighbor[1]:
-                    self.grid[cell[0]][cell[1]][2] = False
-                    self.grid[neighbor[0]][neighbor[1]][3] = False
-                else:
-                    self.grid[cell[0]][cell[1]][3] = False
-                    self.grid[neighbor[0]][neighbor[1]][2] = False
-                return True
-            return False
-        return False
+    def add_wall(
+        self,
+        cell: tuple[int, int],
+        neighbor: tuple[int, int]
+    ) -> bool:
+        """Add a wall between a cell and its neighbor.
+
+        Parameters
+        ----------
+        cell : tuple[int, int]
+            The location of the cell.
+        neighbor : tuple[int, int]
+            The location of the cell's neighbor.
+
+        Returns
+        -------
+        bool
+            Whether the wall addition is successful.
+        """
+        return self._set_wall_between(cell, neighbor, True)
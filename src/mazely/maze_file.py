@@ -0,0 +1,482 @@
+"""Readers and writers for maze files.
+
+A maze file draws each cell as 3 characters wide and 3 characters tall, with
+neighboring cells sharing their borders::
+
+    +---+---+
+    | S     |
+    +   +---+
+    |     G |
+    +---+---+
+
+Text files are read and written in blocks of rows. The wall characters of a
+block are read from, or written into, a two-dimensional byte matrix of its
+text with strided slicing, so parsing and drawing cost a few whole-array
+operations rather than a Python loop per cell.
+
+Mazes can also be stored in a binary container: a header holding the size,
+seed, start and goal cells and generator name of a maze, followed by its
+packed grid. The grid of a binary file is memory-mapped rather than read, and
+can be written one block of rows at a time.
+"""
+
+import struct
+from collections.abc import Iterable, Iterator
+
+import numpy as np
+
+from .grid import wall_planes
+
+# The characters that draw the walls of a cell, in NSEW order.
+_WALL_CHARACTERS = b"--||"
+
+# The fixed part of a binary header: magic, version, rows, columns, whether
+# there is a seed, seed, start row, start column, number of goal cells and
+# length of the generator name. The variable part holds the generator name and
+# the goal cells, and is padded so that the grid starts on a multiple of
+# `_ALIGNMENT` bytes.
+_MAGIC = b"MAZELY"
+_VERSION = 1
+_HEADER = struct.Struct("<6sHIIBqIIIH")
+_ALIGNMENT = 64
+
+
+def _parse_lines(
+    lines: list[bytes],
+    rows: int,
+    columns: int
+) -> tuple[np.ndarray, list[tuple[int, int]], list[tuple[int, int]]]:
+    """Parse a run of cell rows from the non-blank, stripped lines of a maze
+    file.
+
+    Parameters
+    ----------
+    lines : list[bytes]
+        The lines drawing the rows, from the top border of the first row to
+        the bottom border of the last row.
+    rows : int
+        The total number of rows drawn by the lines.
+    columns : int
+        The total number of columns of the maze.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, list[tuple[int, int]], list[tuple[int, int]]]
+        A packed grid of the rows, and the start and goal cell locations
+        relative to the first row in row-major order.
+    """
+    # Pad every line to a common width and add enough blank lines and columns
+    # so that every cell can be sliced, even in a truncated file.
+    height = max(len(lines), rows * 2 + 1)
+    width = max(max(len(line) for line in lines), columns * 4 + 1)
+    text = b"".join(line.ljust(width) for line in lines)
+    text += b" " * (width * (height - len(lines)))
+    matrix = np.frombuffer(text, dtype=np.uint8).reshape(height, width)
+
+    # The characters at the center and at each wall of every cell.
+    centers = matrix[1:rows * 2:2, 2:columns * 4:4]
+    planes = (
+        matrix[0:rows * 2:2, 2:columns * 4:4],
+        matrix[2:rows * 2 + 1:2, 2:columns * 4:4],
+        matrix[1:rows * 2:2, 4:columns * 4 + 1:4],
+        matrix[1:rows * 2:2, 0:columns * 4:4],
+    )
+
+    grid = np.zeros((rows, columns), dtype=np.uint8)
+    for bit, (plane, character) in enumerate(zip(planes, _WALL_CHARACTERS)):
+        grid |= (plane == character).astype(np.uint8) << bit
+
+    start = [(int(row), int(column))
+             for row, column in np.argwhere(centers == ord("S"))]
+    goal = [(int(row), int(column))
+            for row, column in np.argwhere(centers == ord("G"))]
+    return grid, start, goal
+
+
+def _offset(
+    first_row: int,
+    grid: np.ndarray,
+    start: list[tuple[int, int]],
+    goal: list[tuple[int, int]]
+) -> tuple[int, np.ndarray, list[tuple[int, int]], list[tuple[int, int]]]:
+    """Shift the cell locations of a block by the index of its first row."""
+    return (
+        first_row,
+        grid,
+        [(row + first_row, column) for row, column in start],
+        [(row + first_row, column) for row, column in goal],
+    )
+
+
+def iter_maze_rows(
+    path: str,
+    block_rows: int = 1024
+) -> Iterator[tuple[int, np.ndarray, list[tuple[int, int]],
+                    list[tuple[int, int]]]]:
+    """Read a maze file in blocks of rows.
+
+    The file is read one line at a time and only the lines of the current
+    block are held in memory, so mazes larger than memory can be processed
+    block by block.
+
+    Parameters
+    ----------
+    path : str
+        A path to a maze file.
+    block_rows : int
+        The maximum number of rows in each block. Defaults to ``1024``.
+
+    Yields
+    ------
+    tuple[int, numpy.ndarray, list[tuple[int, int]], list[tuple[int, int]]]
+        The index of the first row of the block, a packed grid of the block,
+        and the locations of the cells marked ``S`` and ``G`` in the block, in
+        row-major order.
+
+    Raises
+    ------
+    ValueError
+        If the block size is not positive or the file has no rows.
+    """
+    if block_rows < 1:
+        raise ValueError("Block rows must be positive.")
+
+    # Non-ASCII characters are replaced rather than expanded, so that every
+    # character takes one column.
+    with open(path, "r", encoding="ascii", errors="replace") as file:
+        lines = (line.strip().encode("ascii", "replace")
+                 for line in file if not line.isspace())
+
+        block = []
+        columns = None
+        first_row = 0
+        for line in lines:
+            if columns is None:
+                columns = len(line) // 4
+            block.append(line)
+
+            # Each block ends with the line that the next block starts with.
+            if len(block) == block_rows * 2 + 1:
+                yield _offset(first_row,
+                              *_parse_lines(block, block_rows, columns))
+                first_row += block_rows
+                block = block[-1:]
+
+        if first_row == 0 and len(block) < 2:
+            raise ValueError("The maze file has no rows.")
+        if len(block) >= 2:
+            yield _offset(first_row,
+                          *_parse_lines(block, len(block) // 2, columns))
+
+
+def read_maze(
+    path: str
+) -> tuple[np.ndarray, list[tuple[int, int]], list[tuple[int, int]]]:
+    """Read a maze file.
+
+    Parameters
+    ----------
+    path : str
+        A path to a maze file.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, list[tuple[int, int]], list[tuple[int, int]]]
+        A packed grid, and the locations of the cells marked ``S`` and ``G``
+        in row-major order.
+    """
+    blocks = []
+    start = []
+    goal = []
+    for _, block, block_start, block_goal in iter_maze_rows(path):
+        blocks.append(block)
+        start.extend(block_start)
+        goal.extend(block_goal)
+    if len(blocks) == 1:
+        return blocks[0], start, goal
+    return np.concatenate(blocks), start, goal
+
+
+def _draw_rows(
+    grid: np.ndarray,
+    first_row: int,
+    last_row: int,
+    start: tuple[int, int],
+    goal: set[tuple[int, int]]
+) -> np.ndarray:
+    """Draw a run of cell rows of a grid as the lines of a maze file.
+
+    Each row is drawn as the line through its cells and the border line below
+    it. A wall is drawn if either of the cells that share it has the wall.
+
+    Parameters
+    ----------
+    grid : numpy.ndarray
+        A two-dimensional array of cells representing a rectangular maze, in
+        either layout.
+    first_row : int
+        The index of the first row to draw.
+    last_row : int
+        The index after the last row to draw.
+    start : tuple[int, int]
+        The location of the start cell.
+    goal : set[tuple[int, int]]
+        The location(s) of the goal cell(s).
+
+    Returns
+    -------
+    numpy.ndarray
+        A ``(rows * 2, columns * 4 + 2)`` byte matrix of the lines, each
+        ending with a newline.
+    """
+    rows = last_row - first_row
+    columns = grid.shape[1]
+    planes = wall_planes(grid[first_row:last_row])
+    south = planes[1].copy()
+    if last_row < grid.shape[0]:
+        south[-1] |= wall_planes(grid[last_row:last_row + 1])[0, 0]
+    south[:-1] |= planes[0, 1:]
+    east = planes[2].copy()
+    east[:, :-1] |= planes[3, :, 1:]
+
+    text = np.full((rows * 2, columns * 4 + 2), ord(" "), dtype=np.uint8)
+    text[:, -1] = ord("\n")
+    cells = text[0::2]
+    borders = text[1::2]
+    cells[:, 0] = np.where(planes[3, :, 0], ord("|"), ord(" "))
+    cells[:, 4:columns * 4 + 1:4] = np.where(east, ord("|"), ord(" "))
+    borders[:, 0:columns * 4 + 1:4] = ord("+")
+    for offset in range(1, 4):
+        borders[:, offset:columns * 4:4] = np.where(south, ord("-"),
+                                                    ord(" "))
+
+    centers = cells[:, 2:columns * 4:4]
+    for (row, column), character in [
+        *((cell, ord("G")) for cell in goal), (start, ord("S"))
+    ]:
+        if first_row <= row < last_row:
+            centers[row - first_row, column] = character
+    return text
+
+
+def write_maze(
+    path: str,
+    grid: np.ndarray,
+    start: tuple[int, int],
+    goal: set[tuple[int, int]],
+    block_rows: int = 1024
+):
+    """Write a maze file.
+
+    The file is drawn and written in blocks of rows, so that only the text of
+    one block is held in memory. A maze whose walls are present on both
+    sides of every wall, and whose start cell is not a goal cell, reads back
+    as the same maze with :func:`read_maze`.
+
+    Parameters
+    ----------
+    path : str
+        A path wherein the maze file is saved.
+    grid : numpy.ndarray
+        A two-dimensional array of cells representing a rectangular maze, in
+        either layout.
+    start : tuple[int, int]
+        The location of the start cell, marked ``S``.
+    goal : set[tuple[int, int]]
+        The location(s) of the goal cell(s), marked ``G``.
+    block_rows : int
+        The maximum number of rows in each block. Defaults to ``1024``.
+
+    Raises
+    ------
+    ValueError
+        If the block size is not positive.
+    """
+    if block_rows < 1:
+        raise ValueError("Block rows must be positive.")
+    rows, columns = grid.shape[:2]
+    top = np.full(columns * 4 + 2, ord("+"), dtype=np.uint8)
+    top[-1] = ord("\n")
+    for offset in range(1, 4):
+        top[offset:columns * 4:4] = np.where(wall_planes(grid[:1])[0, 0],
+                                             ord("-"), ord(" "))
+
+    with open(path, "wb") as file:
+        file.write(top.data)
+        for first_row in range(0, rows, block_rows):
+            last_row = min(first_row + block_rows, rows)
+            file.write(_draw_rows(grid, first_row, last_row, start,
+                                  goal).data)
+
+
+def _binary_header(
+    rows: int,
+    columns: int,
+    start: tuple[int, int],
+    goal: set[tuple[int, int]],
+    seed: int | None,
+    generator: str
+) -> bytes:
+    """Pack the header of a binary file, padded to where its grid starts."""
+    if seed is not None and not -2 ** 63 <= seed < 2 ** 63:
+        raise ValueError("Seed must fit in a signed 64-bit integer.")
+    name = generator.encode()
+    goal_cells = np.array(sorted(goal), dtype="<u4").reshape(-1, 2)
+    header = _HEADER.pack(
+        _MAGIC, _VERSION, rows, columns, seed is not None, seed or 0, *start,
+        len(goal_cells), len(name)
+    ) + name + goal_cells.tobytes()
+    return header + bytes(-len(header) % _ALIGNMENT)
+
+
+def write_binary(
+    path: str,
+    grid: np.ndarray,
+    start: tuple[int, int],
+    goal: set[tuple[int, int]],
+    seed: int | None = None,
+    generator: str = ""
+):
+    """Write a maze to a binary file.
+
+    Parameters
+    ----------
+    path : str
+        A path wherein the binary file is saved.
+    grid : numpy.ndarray
+        A packed grid.
+    start : tuple[int, int]
+        The location of the start cell.
+    goal : set[tuple[int, int]]
+        The location(s) of the goal cell(s).
+    seed : int, optional
+        The seed value used to generate the maze. Defaults to ``None``.
+    generator : str
+        The name of the generator of the maze. Defaults to ``""``.
+
+    Raises
+    ------
+    ValueError
+        If the seed does not fit in a signed 64-bit integer.
+    """
+    header = _binary_header(*grid.shape, start, goal, seed, generator)
+    with open(path, "wb") as file:
+        file.write(header)
+        file.write(np.ascontiguousarray(grid, dtype=np.uint8).data)
+
+
+def write_binary_rows(
+    path: str,
+    rows: int,
+    columns: int,
+    blocks: Iterable[np.ndarray],
+    start: tuple[int, int],
+    goal: set[tuple[int, int]],
+    seed: int | None = None,
+    generator: str = ""
+):
+    """Write a maze to a binary file from its rows as they are generated.
+
+    Each block is written as soon as it is produced, so a maze larger than
+    memory can be written from a generator such as
+    :meth:`.Eller.iter_rows`::
+
+        eller = Eller()
+        write_binary_rows("maze.bin", rows, columns,
+                          eller.iter_rows(rows, columns, seed),
+                          (0, 0), {(rows - 1, columns - 1)}, seed, "Eller")
+
+    Parameters
+    ----------
+    path : str
+        A path wherein the binary file is saved.
+    rows : int
+        The total number of rows of the maze.
+    columns : int
+        The total number of columns of the maze.
+    blocks : Iterable[numpy.ndarray]
+        The packed cells of the maze, in row-major order, as single rows or
+        blocks of rows.
+    start : tuple[int, int]
+        The location of the start cell.
+    goal : set[tuple[int, int]]
+        The location(s) of the goal cell(s).
+    seed : int, optional
+        The seed value used to generate the maze. Defaults to ``None``.
+    generator : str
+        The name of the generator of the maze. Defaults to ``""``.
+
+    Raises
+    ------
+    ValueError
+        If the seed does not fit in a signed 64-bit integer, or if the blocks
+        do not hold exactly `rows` rows of `columns` cells.
+    """
+    header = _binary_header(rows, columns, start, goal, seed, generator)
+    cells = 0
+    with open(path, "wb") as file:
+        file.write(header)
+        for block in blocks:
+            block = np.ascontiguousarray(block, dtype=np.uint8)
+            if block.size % columns:
+                raise ValueError("Blocks must hold whole rows.")
+            cells += block.size
+            if cells > rows * columns:
+                raise ValueError("Blocks hold more rows than the maze.")
+            file.write(block.data)
+    if cells != rows * columns:
+        raise ValueError("Blocks hold fewer rows than the maze.")
+
+
+def read_binary(
+    path: str,
+    mmap_mode: str = "r"
+) -> tuple[np.ndarray, tuple[int, int], set[tuple[int, int]], int | None,
+           str]:
+    """Read a maze from a binary file.
+
+    The grid is memory-mapped rather than read, so opening a file is nearly
+    instant regardless of its size, and processes that open the same file
+    share its pages.
+
+    Parameters
+    ----------
+    path : str
+        A path to a binary file.
+    mmap_mode : str
+        The mode of the memory map, as in :class:`numpy.memmap`: ``"r"`` for
+        read-only, ``"c"`` for copy-on-write or ``"r+"`` to write changes back
+        to the file. Defaults to ``"r"``.
+
+    Returns
+    -------
+    tuple[numpy.ndarray, tuple[int, int], set[tuple[int, int]], int | None, \
+str]
+        A memory-mapped packed grid, the location of the start cell, the
+        location(s) of the goal cell(s), the seed and the name of the
+        generator.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a binary maze file of a supported version.
+    """
+    with open(path, "rb") as file:
+        fields = _HEADER.unpack(file.read(_HEADER.size))
+        (magic, version, rows, columns, has_seed, seed, start_row,
+         start_column, goal_count, name_length) = fields
+        if magic != _MAGIC:
+            raise ValueError("Not a binary maze file.")
+        if version != _VERSION:
+            raise ValueError(f"Unsupported binary maze version {version}.")
+        generator = file.read(name_length).decode()
+        goal_cells = np.frombuffer(file.read(goal_count * 8), dtype="<u4")
+
+    offset = _HEADER.size + name_length + goal_count * 8
+    offset += -offset % _ALIGNMENT
+    grid = np.memmap(path, dtype=np.uint8, mode=mmap_mode, offset=offset,
+                     shape=(rows, columns))
+    goal = {(int(row), int(column))
+            for row, column in goal_cells.reshape(-1, 2)}
+    return (grid, (start_row, start_column), goal,
+            seed if has_seed else None, generator)
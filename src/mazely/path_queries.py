@@ -0,0 +1,292 @@
+"""Shortest-path queries between many pairs of cells of one maze.
+
+The open passages of a perfect maze, such as one generated by
+:class:`.RecursiveBacktracking`, form a tree, so the path between two cells is
+unique and passes through their lowest common ancestor. :class:`PathQueries`
+roots the tree once, then answers each query from the depths of the cells and
+a binary lifting table of their ancestors instead of searching the maze.
+"""
+
+from array import array
+
+import numpy as np
+
+from .algorithms import MazeSolver, ShortestPath
+from .grid import EAST, NORTH, SOUTH, WEST, sealed_walls
+from .solution_path import SolutionPath
+
+
+class PathQueries:
+    """A query engine for the shortest paths between pairs of cells of a
+    maze.
+
+    Building the engine takes a breadth-first search over the whole maze.
+    Afterwards, if the maze has no loops, the length of the path between two
+    cells takes O(log n) steps for n cells, and the path itself takes steps
+    in proportion to its length. The table of ancestors takes 4 bytes per
+    cell for each power of two up to the depth of the deepest cell.
+
+    If the maze has loops, or a wall that is only present on one side, the
+    engine falls back to a breadth-first search for each query.
+
+    The engine reads the grid once, so it has to be built again after the
+    walls change.
+
+    Parameters
+    ----------
+    grid : numpy.ndarray
+        A two-dimensional array of cells representing a rectangular maze, in
+        either layout.
+
+    Attributes
+    ----------
+    is_tree : bool
+        Whether the open passages form a tree, or one tree per group of
+        connected cells, so that queries use the table of ancestors.
+    """
+
+    def __init__(self, grid: np.ndarray):
+        walls = sealed_walls(grid)
+        rows, columns = walls.shape
+        self._grid = grid
+        self._rows = rows
+        self._columns = columns
+
+        # Passages open from both sides, and whether every passage is.
+        east = walls[:, :-1] & EAST == 0
+        south = walls[:-1] & SOUTH == 0
+        symmetric = (np.array_equal(east, walls[:, 1:] & WEST == 0)
+                     and np.array_equal(south, walls[1:] & NORTH == 0))
+        passages = int(east.sum() + south.sum())
+
+        # Root each group of connected cells at its first cell in row-major
+        # order, and find the parent and depth of every cell.
+        moves = MazeSolver._moves(columns)
+        walls = walls.tobytes()
+        cells = len(walls)
+        parent = array("i", range(cells))
+        depth = array("i", [-1]) * cells
+        order = []
+        roots = 0
+        for root in range(cells):
+            if depth[root] >= 0:
+                continue
+            roots += 1
+            depth[root] = 0
+            head = len(order)
+            order.append(root)
+            while head < len(order):
+                cell = order[head]
+                head += 1
+                level = depth[cell] + 1
+                for offset in moves[walls[cell]]:
+                    neighbor = cell + offset
+                    if depth[neighbor] < 0:
+                        depth[neighbor] = level
+                        parent[neighbor] = cell
+                        order.append(neighbor)
+
+        # A forest has one passage less than cells for each of its trees.
+        self.is_tree = symmetric and passages == cells - roots
+        self._parent = parent
+        self._depth = depth
+        if not self.is_tree:
+            self._solver = ShortestPath()
+            return
+
+        # The ancestor of each cell 2 ** k steps up, stopping at the root.
+        ancestors = [np.frombuffer(parent, dtype=np.int32)]
+        deepest = int(np.frombuffer(depth, dtype=np.int32).max())
+        for _ in range(max(deepest.bit_length() - 1, 0)):
+            ancestors.append(ancestors[-1][ancestors[-1]])
+        self._ancestors = ancestors
+
+    def _index(self, cell: tuple[int, int]) -> int:
+        """Get the flat index of a cell."""
+        row, column = cell
+        if row < 0 or row >= self._rows:
+            raise ValueError("Row is out of range.")
+        if column < 0 or column >= self._columns:
+            raise ValueError("Column is out of range.")
+        return row * self._columns + column
+
+    def _common_ancestor(self, first: int, second: int) -> int:
+        """Get the lowest common ancestor of two cells, or ``-1`` if they are
+        in different trees."""
+        depth = self._depth
+        ancestors = self._ancestors
+        if depth[first] < depth[second]:
+            first, second = second, first
+
+        # Lift the deeper cell to the depth of the other.
+        difference = depth[first] - depth[second]
+        level = 0
+        while difference:
+            if difference & 1:
+                first = int(ancestors[level][first])
+            difference >>= 1
+            level += 1
+        if first == second:
+            return first
+
+        # Lift both cells as far as they stay apart.
+        for table in reversed(ancestors):
+            if table[first] != table[second]:
+                first = int(table[first])
+                second = int(table[second])
+        first = self._parent[first]
+        return first if first == self._parent[second] else -1
+
+    def distance(
+        self,
+        start: tuple[int, int],
+        goal: tuple[int, int]
+    ) -> int | None:
+        """Get the length of the shortest path between two cells.
+
+        Parameters
+        ----------
+        start : tuple[int, int]
+            The location of the start cell.
+        goal : tuple[int, int]
+            The location of the goal cell.
+
+        Returns
+        -------
+        int
+            The number of steps of the path, or :obj:`None` if the goal cell
+            cannot be reached.
+
+        Raises
+        ------
+        ValueError
+            If a cell is outside the maze.
+        """
+        first = self._index(start)
+        second = self._index(goal)
+        if not self.is_tree:
+            solution_path = self.path(start, goal)
+            return None if solution_path is None else len(solution_path) - 1
+
+        ancestor = self._common_ancestor(first, second)
+        if ancestor < 0:
+            return None
+        depth = self._depth
+        return depth[first] + depth[second] - 2 * depth[ancestor]
+
+    def distances(
+        self,
+        starts: np.ndarray,
+        goals: np.ndarray
+    ) -> np.ndarray:
+        """Get the lengths of the shortest paths between many pairs of cells.
+
+        For a maze without loops, all the pairs are lifted through the table
+        of ancestors together with array operations. Otherwise, a distance map
+        is found for each distinct goal cell.
+
+        Parameters
+        ----------
+        starts : numpy.ndarray
+            An ``(n, 2)`` array of the locations of the start cells.
+        goals : numpy.ndarray
+            An ``(n, 2)`` array of the locations of the goal cells.
+
+        Returns
+        -------
+        numpy.ndarray
+            An array of ``n`` distances, ``-1`` for the pairs of cells between
+            which there is no path.
+
+        Raises
+        ------
+        ValueError
+            If a cell is outside the maze.
+        """
+        starts = np.asarray(starts, dtype=np.intp).reshape(-1, 2)
+        goals = np.asarray(goals, dtype=np.intp).reshape(-1, 2)
+        for cells in (starts, goals):
+            if ((cells[:, 0] < 0) | (cells[:, 0] >= self._rows)).any():
+                raise ValueError("Row is out of range.")
+            if ((cells[:, 1] < 0) | (cells[:, 1] >= self._columns)).any():
+                raise ValueError("Column is out of range.")
+
+        if not self.is_tree:
+            result = np.empty(len(starts), dtype=np.int32)
+            targets, inverse = np.unique(goals, axis=0, return_inverse=True)
+            for index, (row, column) in enumerate(targets):
+                distance_map = self._solver.distance_map(
+                    self._grid, {(int(row), int(column))})
+                chosen = inverse.ravel() == index
+                result[chosen] = distance_map[starts[chosen, 0],
+                                              starts[chosen, 1]]
+            return result
+
+        depth = np.frombuffer(self._depth, dtype=np.int32)
+        first = starts[:, 0] * self._columns + starts[:, 1]
+        second = goals[:, 0] * self._columns + goals[:, 1]
+        swap = depth[first] < depth[second]
+        first, second = (np.where(swap, second, first),
+                         np.where(swap, first, second))
+        total = depth[first] + depth[second]
+
+        difference = depth[first] - depth[second]
+        for level, table in enumerate(self._ancestors):
+            lifted = (difference >> level & 1).astype(bool)
+            first[lifted] = table[first[lifted]]
+        for table in reversed(self._ancestors):
+            apart = table[first] != table[second]
+            first[apart] = table[first[apart]]
+            second[apart] = table[second[apart]]
+        parent = self._ancestors[0]
+        ancestor = np.where(first == second, first, parent[first])
+        connected = (first == second) | (parent[first] == parent[second])
+        return np.where(connected, total - 2 * depth[ancestor], -1)
+
+    def path(
+        self,
+        start: tuple[int, int],
+        goal: tuple[int, int]
+    ) -> SolutionPath | None:
+        """Get the shortest path between two cells.
+
+        Parameters
+        ----------
+        start : tuple[int, int]
+            The location of the start cell.
+        goal : tuple[int, int]
+            The location of the goal cell.
+
+        Returns
+        -------
+        SolutionPath
+            The path from the start cell to the goal cell, or :obj:`None` if
+            the goal cell cannot be reached.
+
+        Raises
+        ------
+        ValueError
+            If a cell is outside the maze.
+        """
+        first = self._index(start)
+        second = self._index(goal)
+        if not self.is_tree:
+            return self._solver.solve(self._grid, start, {goal})
+
+        ancestor = self._common_ancestor(first, second)
+        if ancestor < 0:
+            return None
+        parent = self._parent
+        rising = array("i")
+        while first != ancestor:
+            rising.append(first)
+            first = parent[first]
+        falling = array("i")
+        while second != ancestor:
+            falling.append(second)
+            second = parent[second]
+        rising.append(ancestor)
+        falling.reverse()
+        rising.extend(falling)
+        return SolutionPath(np.frombuffer(rising, dtype=np.int32),
+                            self._columns)
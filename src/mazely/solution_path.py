@@ -0,0 +1,153 @@
+"""A compact representation of the solution path of a maze.
+
+A :class:`SolutionPath` keeps the cells of a path as one ``int32`` array of
+flat indices, 4 bytes per cell, rather than as a list of tuples. It behaves
+like a read-only sequence of ``(row, column)`` tuples, which are only created
+as they are iterated over or indexed, and converts to an ``(n, 2)`` array of
+cell locations without creating any.
+"""
+
+from collections.abc import Iterator
+
+import numpy as np
+
+# The number of cells converted to tuples at a time while iterating.
+_CHUNK_SIZE = 4096
+
+
+class SolutionPath:
+    """An ordered sequence of cell locations of a maze, backed by an array
+    of flat cell indices.
+
+    Indexing with an integer gives a ``(row, column)`` tuple, and slicing
+    gives another :class:`SolutionPath` that shares the same array. A path
+    compares equal to another path or to a sequence of ``(row, column)``
+    pairs with the same cells.
+
+    Parameters
+    ----------
+    cells : numpy.ndarray
+        The flat index ``row * columns + column`` of each cell of the path,
+        in order.
+    columns : int
+        The total number of columns of the maze.
+
+    Attributes
+    ----------
+    cells : numpy.ndarray
+        The flat index of each cell of the path, as ``int32``.
+    columns : int
+        The total number of columns of the maze.
+    """
+
+    def __init__(self, cells: np.ndarray, columns: int):
+        self.cells = np.asarray(cells, dtype=np.int32).ravel()
+        self.columns = columns
+
+    @classmethod
+    def from_locations(
+        cls,
+        locations: np.ndarray,
+        columns: int
+    ) -> "SolutionPath":
+        """Make a path from the locations of its cells.
+
+        Parameters
+        ----------
+        locations : numpy.ndarray
+            An ``(n, 2)`` array or sequence of cell locations.
+        columns : int
+            The total number of columns of the maze.
+
+        Returns
+        -------
+        SolutionPath
+            The path.
+        """
+        locations = np.asarray(locations, dtype=np.int32).reshape(-1, 2)
+        return cls(locations[:, 0] * columns + locations[:, 1], columns)
+
+    def locations(self) -> np.ndarray:
+        """Get the locations of the cells of the path.
+
+        Returns
+        -------
+        numpy.ndarray
+            An ``(n, 2)`` array of ``int32`` cell locations.
+        """
+        locations = np.empty((len(self.cells), 2), dtype=np.int32)
+        np.divmod(self.cells, self.columns,
+                  out=(locations[:, 0], locations[:, 1]))
+        return locations
+
+    def tolist(self) -> list[tuple[int, int]]:
+        """Get the cells of the path as a list of tuples.
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            An ordered list of cell locations.
+        """
+        return list(self)
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        locations = self.locations()
+        return locations if dtype is None else locations.astype(dtype)
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        columns = self.columns
+        for first in range(0, len(self.cells), _CHUNK_SIZE):
+            for cell in self.cells[first:first + _CHUNK_SIZE].tolist():
+                yield divmod(cell, columns)
+
+    def __reversed__(self) -> Iterator[tuple[int, int]]:
+        return iter(self[::-1])
+
+    def __getitem__(
+        self,
+        index: int | slice
+    ) -> "tuple[int, int] | SolutionPath":
+        if isinstance(index, slice):
+            return SolutionPath(self.cells[index], self.columns)
+        return divmod(int(self.cells[index]), self.columns)
+
+    def __contains__(self, cell: object) -> bool:
+        try:
+            row, column = cell
+        except (TypeError, ValueError):
+            return False
+        if not 0 <= column < self.columns:
+            return False
+        return bool((self.cells == row * self.columns + column).any())
+
+    def __add__(self, other: object) -> "SolutionPath":
+        if (not isinstance(other, SolutionPath)
+                or other.columns != self.columns):
+            return NotImplemented
+        return SolutionPath(np.concatenate((self.cells, other.cells)),
+                            self.columns)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SolutionPath):
+            locations = other.locations()
+        else:
+            try:
+                locations = np.asarray(other)
+            except (TypeError, ValueError):
+                return NotImplemented
+            if locations.size == 0:
+                locations = locations.reshape(0, 2)
+            elif locations.dtype.kind not in "iu":
+                return NotImplemented
+        return (locations.shape == (len(self), 2)
+                and np.array_equal(locations, self.locations()))
+
+    def __repr__(self) -> str:
+        if len(self) <= 6:
+            cells = ", ".join(map(str, self))
+        else:
+            cells = ", ".join(map(str, [*self[:3], "...", *self[-3:]]))
+        return f"{type(self).__name__}([{cells}])"
@@ -1,15 +1,36 @@
-import matplotlib as mpl
-import matplotlib.pyplot as plt
+import os
+import struct
+import zlib
+from typing import TYPE_CHECKING
+
 import numpy as np
-from matplotlib import collections, colors, patches
+
+from .colormaps import sample_colormap
+from .grid import wall_planes
+from .instrumentation import Stats, instrumented
+from .solution_path import SolutionPath
+
+if TYPE_CHECKING:
+    import matplotlib.pyplot as plt
+
+
+def _written(stats: Stats, _, __, arguments: dict):
+    """Collect the number of cells drawn and the size of the file written."""
+    rows, columns = arguments["grid"].shape[:2]
+    stats.cells_visited = rows * columns
+    stats.bytes_written = os.path.getsize(arguments["file_path"])
 
 
 class Utilities:
-    """A class to perform maze-related utility functions."""
+    """A class to perform maze-related utility functions.
+
+    The methods that save files are instrumented, as described in
+    :mod:`mazely.instrumentation`.
+    """
 
     def __init__(self):
-        self._figure: plt.Figure
-        self._axes: plt.Axes
+        self._figure: "plt.Figure"
+        self._axes: "plt.Axes"
 
     @staticmethod
     def _is_whole(number: float):
@@ -17,56 +38,80 @@ class Utilities:
             return int(number)
         return number
 
-    def _plot_walls(
-        self,
+    @classmethod
+    def _format_numbers(cls, numbers: np.ndarray) -> list:
+        """Convert an array of numbers to a list in which whole numbers are
+        integers."""
+        numbers = numbers.astype(float)
+        if (numbers == np.floor(numbers)).all():
+            return numbers.astype(np.int64).tolist()
+        return [cls._is_whole(number) for number in numbers.tolist()]
+
+    @staticmethod
+    def _runs(lines: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Find the runs of ``True`` along the rows of a Boolean array.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+            The row, first column and length of each run, in row-major order.
+        """
+        padded = np.zeros((lines.shape[0], lines.shape[1] + 2), dtype=np.int8)
+        padded[:, 1:-1] = lines
+        steps = np.diff(padded, axis=1)
+        rows, starts = np.nonzero(steps == 1)
+        ends = np.nonzero(steps == -1)[1]
+        return rows, starts, ends - starts
+
+    @staticmethod
+    def _wall_lines(grid: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Get the walls of a maze that are drawn, as lines of cell edges.
+
+        Returns
+        -------
+        tuple[numpy.ndarray, numpy.ndarray]
+            A ``(rows + 1, columns)`` Boolean array of the horizontal walls
+            above each row and below the last row, and a ``(columns + 1,
+            rows)`` Boolean array of the vertical walls left of each column
+            and right of the last column.
+        """
+        planes = wall_planes(grid)
+        rows, columns = planes.shape[1:]
+        horizontal = np.empty((rows + 1, columns), dtype=bool)
+        horizontal[0] = planes[0, 0]
+        horizontal[1:] = planes[1]
+        vertical = np.empty((columns + 1, rows), dtype=bool)
+        vertical[0] = planes[3, :, 0]
+        vertical[1:] = planes[2].T
+        return horizontal, vertical
+
+    @classmethod
+    def _wall_path(
+        cls,
         grid: np.ndarray,
-        cell_size: int = 15,
-        line_width: int = 2
-    ):
-        """Plot the walls of the maze with Matplotlib."""
-        line_width = line_width / cell_size
-        for row in range(len(grid)):
-            for column, walls in enumerate(grid[row]):
-                if row == 0 and walls[0]:
-                    self._axes.add_patch(patches.Rectangle(
-                        (column - line_width / 2, row - line_width / 2),
-                        line_width,
-                        1 + line_width,
-                        angle=270,
-                        rotation_point=(column, row), color="k"))
-                if walls[2]:
-                    self._axes.add_patch(patches.Rectangle(
-                        (column + 1 - line_width / 2,
-                         row + 1 - line_width / 2),
-                        line_width,
-                        1 + line_width,
-                        angle=180,
-                        rotation_point=(column + 1, row + 1),
-                        color="k"
-                    ))
-                if column == 0 and walls[3]:
-                    self._axes.add_patch(patches.Rectangle(
-                        (column - line_width / 2, row - line_width / 2),
-                        line_width,
-                        1 + line_width,
-                        angle=0,
-                        rotation_point=(column, row),
-                        color="k"
-                    ))
-                if walls[1]:
-                    self._axes.add_patch(patches.Rectangle(
-                        (column + 1 - line_width / 2,
-                         row + 1 - line_width / 2),
-                        line_width,
-                        1 + line_width,
-                        angle=90,
-                        rotation_point=(column + 1, row + 1),
-                        color="k"))
-        self._axes.set_xlim(-line_width / 2, len(grid[0]) + line_width / 2)
-        self._axes.set_ylim(len(grid) + line_width / 2, -line_width / 2)
+        cell_size: int,
+        line_width: int
+    ) -> str:
+        """Get the path data of the walls of a maze for an SVG file.
+
+        The walls are found from whole wall planes, and collinear walls are
+        merged into one line each.
+        """
+        horizontal, vertical = cls._wall_lines(grid)
+        commands = []
+        for lines, command in ((horizontal, "h"), (vertical, "v")):
+            across, along, lengths = cls._runs(lines)
+            across = across * cell_size + line_width / 2
+            along = along * cell_size + line_width / 2
+            points = (along, across) if command == "h" else (across, along)
+            numbers = np.stack([*points, lengths * cell_size], axis=1)
+            commands.append(f"M%s %s{command}%s" * len(numbers)
+                            % tuple(cls._format_numbers(numbers.ravel())))
+        return "".join(commands)
 
     def _initiate_plot(self):
         """Initiate a plot from Matplotlib."""
+        import matplotlib.pyplot as plt
         self._figure = plt.figure()
         self._axes = plt.axes()
         self._axes.set_aspect("equal")
@@ -80,12 +125,15 @@ class Utilities:
         Parameters
         ----------
         grid : numpy.ndarray
-            A two-dimensional array of cells representing a rectangular maze.
+            A two-dimensional array of cells representing a rectangular maze,
+            in either layout.
         """
+        import matplotlib.pyplot as plt
         self._initiate_plot()
-        self._plot_walls(grid)
+        self._axes.imshow(self.render_image(grid), interpolation="nearest")
         plt.show()
 
+    @instrumented(_written)
     def save_grid(
         self,
         grid: np.ndarray,
@@ -95,10 +143,14 @@ class Utilities:
     ):
         """Save a maze as an SVG file.
 
+        The walls are drawn as a single path in which collinear walls are
+        merged into one line.
+
         Parameters
         ----------
         grid : numpy.ndarray
-            A two-dimensional array of cells representing a rectangular maze.
+            A two-dimensional array of cells representing a rectangular maze,
+            in either layout.
         file_path : str
             A path wherein the SVG file is saved.
         cell_size : int
@@ -106,54 +158,25 @@ class Utilities:
         line_width : int
             The width of the wall lines in pixels.
         """
+        rows, columns = grid.shape[:2]
+        svg = [
+            '<svg xmlns="http://www.w3.org/2000/svg" '
+            f'width="{cell_size * columns + line_width}" '
+            f'height="{cell_size * rows + line_width}" '
+            f'fill="none" stroke="#000" stroke-width="{line_width}" '
+            'stroke-linecap="square" style="background-color: #FFF">\n'
+        ]
+        path = self._wall_path(grid, cell_size, line_width)
+        if path:
+            svg.append(f'\t<path d="{path}"/>\n')
+        svg.append("</svg>")
         with open(file_path, "w") as file:
-            file.write(
-                '<svg xmlns="http://www.w3.org/2000/svg" '
-                f'width="{cell_size * len(grid[0]) + line_width}" '
-                f'height="{cell_size * len(grid) + line_width}" '
-                f'fill="none" stroke="#000" stroke-width="{line_width}" '
-                'stroke-linecap="square" style="background-color: #FFF">\n'
-            )
-            for row in range(len(grid)):
-                for column, walls in enumerate(grid[row]):
-                    x1 = self._is_whole(
-                        column * cell_size + line_width / 2
-                    )
-                    y1 = self._is_whole(
-                        row * cell_size + line_width / 2
-                    )
-                    x2 = self._is_whole(
-                        (column + 1) * cell_size + line_width / 2
-                    )
-                    y2 = self._is_whole(
-                        (row + 1) * cell_size + line_width / 2
-                    )
-                    if row == 0 and walls[0]:
-                        file.write(
-                            f'\t<line x1="{x1}" y1="{y1}" '
-                            f'x2="{x2}" y2="{y1}"/>\n'
-                        )
-                    if walls[1]:
-                        file.write(
-                            f'\t<line x1="{x1}" y1="{y2}" '
-                            f'x2="{x2}" y2="{y2}"/>\n'
-                        )
-                    if walls[2]:
-                        file.write(
-                            f'\t<line x1="{x2}" y1="{y1}" '
-                            f'x2="{x2}" y2="{y2}"/>\n'
-                        )
-                    if column == 0 and walls[3]:
-                        file.write(
-                            f'\t<line x1="{x1}" y1="{y1}" '
-                            f'x2="{x1}" y2="{y2}"/>\n'
-                        )
-            file.write("</svg>")
+            file.write("".join(svg))
 
     def show_solution(
         self,
         grid: np.ndarray,
-        solution_path: list[tuple[int, int]]
+        solution_path: SolutionPath | list[tuple[int, int]]
     ):
         """Display a plot of a rectangular, two-dimensional maze and its
         solution path.
@@ -163,41 +186,22 @@ class Utilities:
         Parameters
         ----------
         grid : numpy.ndarray
-            A two-dimensional array of cells representing a rectangular maze.
-        solution_path : list[tuple[int, int]]
-            An ordered list of cell locations representing the solution path.
+            A two-dimensional array of cells representing a rectangular maze,
+            in either layout.
+        solution_path : SolutionPath or list[tuple[int, int]]
+            The solution path, or an ordered list of its cell locations.
         """
+        import matplotlib.pyplot as plt
         self._initiate_plot()
-
-        # Add an ordered list of rectangle patches.
-        patch_list = []
-        for row, column in solution_path:
-            patch_list.append(patches.Rectangle((column, row), 1, 1))
-
-        # Create a value array for the color map.
-        values = [i for i in range(len(solution_path))]
-        norm = colors.Normalize().autoscale(values)
-
-        # Add the list of patches to a patch collection.
-        collection = collections.PatchCollection(
-            patch_list,
-            norm=norm,
-            cmap="RdYlGn"
-        )
-
-        # Set the value array of the patches.
-        collection.set_array(values)
-
-        # Add the collection to the axes.
-        self._axes.add_collection(collection)
-
-        self._plot_walls(grid)
+        self._axes.imshow(self.render_image(grid, solution_path),
+                          interpolation="nearest")
         plt.show()
 
+    @instrumented(_written)
     def save_solution(
         self,
         grid: np.ndarray,
-        solution_path: list[tuple[int, int]],
+        solution_path: SolutionPath | list[tuple[int, int]],
         file_path: str,
         cell_size: int = 15,
         line_width: int = 2,
@@ -205,15 +209,18 @@ class Utilities:
     ):
         """Save a maze and its solution as an SVG file.
 
+        The walls are drawn as in :meth:`save_grid`.
+
         For more colormap selection, click `here
         <https://matplotlib.org/stable/tutorials/colors/colormaps.html>`_.
 
         Parameters
         ----------
         grid : numpy.ndarray
-            A two-dimensional array of cells representing a rectangular maze.
-        solution_path : list[tuple[int, int]]
-            An ordered list of cell locations representing the solution path.
+            A two-dimensional array of cells representing a rectangular maze,
+            in either layout.
+        solution_path : SolutionPath or list[tuple[int, int]]
+            The solution path, or an ordered list of its cell locations.
         file_path : str
             A path wherein the SVG file is saved.
         cell_size : int
@@ -221,62 +228,166 @@ class Utilities:
         line_width : int
             The width of the wall lines in pixels.
         colormap : str
-            A colormap included with Matplotlib.
+            A colormap included with Matplotlib. Matplotlib is only imported
+            for colormaps that are not built in; see
+            :func:`.colormaps.sample_colormap`.
         """
+        rows, columns = grid.shape[:2]
 
-        colormap_ = mpl.colormaps[colormap]
-        array = np.linspace(0, 1, len(solution_path))
-        color_list = list()
+        color_list = [
+            f"#{red:02x}{green:02x}{blue:02x}"
+            for red, green, blue in sample_colormap(
+                colormap, len(solution_path)).tolist()
+        ]
 
-        for value in array:
-            rgba = colormap_(value)
-            color_list.append(colors.to_hex(rgba))
+        cells = np.asarray(solution_path, dtype=float).reshape(-1, 2)
+        ys = self._format_numbers(cells[:, 0] * cell_size + line_width / 2)
+        xs = self._format_numbers(cells[:, 1] * cell_size + line_width / 2)
 
+        svg = [
+            '<svg xmlns="http://www.w3.org/2000/svg" '
+            f'width="{cell_size * columns + line_width}" '
+            f'height="{cell_size * rows + line_width}" '
+            'style="background-color: #FFF">\n'
+        ]
+        svg.extend(
+            f'\t<path fill="{color}" d="M{x} {y}'
+            f'h{cell_size}v{cell_size}h-{cell_size}z"/>\n'
+            for color, x, y in zip(color_list, xs, ys)
+        )
+        svg.append(
+            f'\t<g fill="none" stroke="#000" stroke-width="{line_width}" '
+            'stroke-linecap="square">\n'
+        )
+        path = self._wall_path(grid, cell_size, line_width)
+        if path:
+            svg.append(f'\t\t<path d="{path}"/>\n')
+        svg.append("\t</g>\n</svg>")
         with open(file_path, "w") as file:
-            file.write(
-                '<svg xmlns="http://www.w3.org/2000/svg" '
-                f'width="{cell_size * len(grid[0]) + line_width}" '
-                f'height="{cell_size * len(grid) + line_width}" '
-                'style="background-color: #FFF">\n'
-            )
-
-            for i, cell in enumerate(solution_path):
-                file.write(
-                    f'\t<path fill="{color_list[i]}" d="M'
-                    f'{self._is_whole(cell[1] * cell_size + line_width / 2)} '
-                    f'{self._is_whole(cell[0] * cell_size + line_width / 2)}'
-                    f'h{cell_size}v{cell_size}h-{cell_size}z"/>\n'
-                )
-            file.write(
-                f'\t<g fill="none" stroke="#000" stroke-width="{line_width}" '
-                'stroke-linecap="square">\n'
-            )
-            for row in range(len(grid)):
-                for column, walls in enumerate(grid[row]):
-                    a = self._is_whole(column * cell_size + line_width / 2)
-                    b = self._is_whole(row * cell_size + line_width / 2)
-                    c = self._is_whole(
-                        (column + 1) * cell_size + line_width / 2)
-                    d = self._is_whole((row + 1) * cell_size + line_width / 2)
-                    if row == 0 and walls[0]:
-                        file.write(
-                            f'\t\t<line x1="{a}" y1="{b}" '
-                            f'x2="{c}" y2="{b}"/>\n'
-                        )
-                    if walls[1]:
-                        file.write(
-                            f'\t\t<line x1="{a}" y1="{d}" '
-                            f'x2="{c}" y2="{d}"/>\n'
-                        )
-                    if walls[2]:
-                        file.write(
-                            f'\t\t<line x1="{c}" y1="{b}" '
-                            f'x2="{c}" y2="{d}"/>\n'
-                        )
-                    if column == 0 and walls[3]:
-                        file.write(
-                            f'\t\t<line x1="{a}" y1="{b}" '
-                            f'x2="{a}" y2="{d}"/>\n'
-                        )
-            file.write("\t</g>\n")
-            file.write("</svg>")
+            file.write("".join(svg))
+
+    def render_image(
+        self,
+        grid: np.ndarray,
+        solution_path: SolutionPath | list[tuple[int, int]] | None = None,
+        cell_size: int = 15,
+        line_width: int = 2,
+        colormap: str = "RdYlGn",
+    ) -> np.ndarray:
+        """Render a maze and, optionally, its solution as an RGB image.
+
+        The image has the same geometry as the SVG files of :meth:`save_grid`
+        and :meth:`save_solution`, and is painted with array slicing rather
+        than by drawing each wall.
+
+        Parameters
+        ----------
+        grid : numpy.ndarray
+            A two-dimensional array of cells representing a rectangular maze,
+            in either layout.
+        solution_path : SolutionPath or list[tuple[int, int]], optional
+            The solution path, or an ordered list of its cell locations.
+            Defaults to :obj:`None`.
+        cell_size : int
+            The size of each cell in pixels.
+        line_width : int
+            The width of the wall lines in pixels.
+        colormap : str
+            A colormap included with Matplotlib, used to color the solution
+            path. Matplotlib is only imported for colormaps that are not
+            built in.
+
+        Returns
+        -------
+        numpy.ndarray
+            A ``(height, width, 3)`` array of ``uint8`` colors.
+        """
+        horizontal, vertical = self._wall_lines(grid)
+        rows, columns = vertical.shape[1], horizontal.shape[1]
+        height = cell_size * rows + line_width
+        width = cell_size * columns + line_width
+        image = np.full((height, width, 3), 255, dtype=np.uint8)
+
+        if solution_path is not None and len(solution_path) > 0:
+            cells = np.asarray(solution_path).reshape(-1, 2)
+            fill = np.full((rows, columns, 3), 255, dtype=np.uint8)
+            fill[cells[:, 0], cells[:, 1]] = sample_colormap(colormap,
+                                                             len(cells))
+            offset = line_width // 2
+            # Each cell of the fill becomes a block of pixels; splitting the
+            # axes of the region keeps it a view of the image.
+            region = image[offset:offset + rows * cell_size,
+                           offset:offset + columns * cell_size]
+            region.reshape(rows, cell_size, columns, cell_size, 3)[:] = \
+                fill[:, np.newaxis, :, np.newaxis]
+
+        # Paint the lines of each direction into a mask, with the vertical
+        # lines painted into the transpose of the mask. A line covers its
+        # cells' edges and extends by the line width past the end, as the
+        # square line caps of the SVG files do.
+        walls = np.zeros((height, width), dtype=bool)
+        for lines, mask in ((horizontal, walls), (vertical, walls.T)):
+            edges = np.zeros((lines.shape[0], mask.shape[1]), dtype=bool)
+            edges[:, :lines.shape[1] * cell_size] = np.repeat(
+                lines, cell_size, axis=1)
+            spans = edges.copy()
+            for shift in range(1, line_width + 1):
+                spans[:, shift:] |= edges[:, :-shift]
+            for row in range(line_width):
+                mask[row:row + (lines.shape[0] - 1) * cell_size + 1:
+                     cell_size] |= spans
+        image[walls] = 0
+        return image
+
+    @instrumented(_written)
+    def save_image(
+        self,
+        grid: np.ndarray,
+        file_path: str,
+        solution_path: SolutionPath | list[tuple[int, int]] | None = None,
+        cell_size: int = 15,
+        line_width: int = 2,
+        colormap: str = "RdYlGn",
+    ):
+        """Save a maze and, optionally, its solution as a PNG file.
+
+        The image is rendered with :meth:`render_image` and encoded with the
+        standard library alone.
+
+        Parameters
+        ----------
+        grid : numpy.ndarray
+            A two-dimensional array of cells representing a rectangular maze,
+            in either layout.
+        file_path : str
+            A path wherein the PNG file is saved.
+        solution_path : SolutionPath or list[tuple[int, int]], optional
+            The solution path, or an ordered list of its cell locations.
+            Defaults to :obj:`None`.
+        cell_size : int
+            The size of each cell in pixels.
+        line_width : int
+            The width of the wall lines in pixels.
+        colormap : str
+            A colormap included with Matplotlib, used to color the solution
+            path. Matplotlib is only imported for colormaps that are not
+            built in.
+        """
+        image = self.render_image(grid, solution_path, cell_size, line_width,
+                                  colormap)
+        height, width = image.shape[:2]
+
+        # Each scanline starts with its filter type, which is none.
+        scanlines = np.zeros((height, width * 3 + 1), dtype=np.uint8)
+        scanlines[:, 1:] = image.reshape(height, -1)
+
+        def chunk(kind: bytes, data: bytes) -> bytes:
+            return (struct.pack(">I", len(data)) + kind + data
+                    + struct.pack(">I", zlib.crc32(kind + data)))
+
+        with open(file_path, "wb") as file:
+            file.write(b"\x89PNG\r\n\x1a\n")
+            file.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height,
+                                                  8, 2, 0, 0, 0)))
+            file.write(chunk(b"IDAT", zlib.compress(scanlines.tobytes())))
+            file.write(chunk(b"IEND", b""))
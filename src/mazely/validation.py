@@ -0,0 +1,90 @@
+"""Consistency checks of the walls of a maze.
+
+:func:`validate_grid` compares the walls of whole grids at once, and counts
+the groups of connected cells with :func:`.label_components`, so it is fast
+enough to run on every maze that is loaded or edited.
+"""
+
+import numpy as np
+
+from .components import label_components, passages
+from .grid import wall_planes
+
+
+def _first(
+    mask: np.ndarray,
+    offset: tuple[int, int] = (0, 0)
+) -> tuple[int, int]:
+    """Get the location of the first set cell of a mask."""
+    row, column = np.argwhere(mask)[0].tolist()
+    return row + offset[0], column + offset[1]
+
+
+def validate_grid(
+    grid: np.ndarray,
+    connected: bool = True,
+    perfect: bool = False
+):
+    """Check that the walls of a grid are consistent.
+
+    The wall of a cell must match the facing wall of its neighbor, and the
+    outer border must be closed. Optionally, every cell must be reachable
+    from every other, and the passages must form a tree, as in a perfect
+    maze. Every check is made, and the failed ones are reported together.
+
+    Parameters
+    ----------
+    grid : numpy.ndarray
+        A two-dimensional array of cells representing a rectangular maze, in
+        either layout.
+    connected : bool
+        Whether to check that all the cells are connected. Defaults to
+        ``True``.
+    perfect : bool
+        Whether to check that there is exactly one path between any two
+        cells, which implies that they are connected. Defaults to ``False``.
+
+    Raises
+    ------
+    ValueError
+        If any check fails.
+    """
+    north, south, east, west = wall_planes(grid)
+    problems = []
+
+    horizontal = east[:, :-1] != west[:, 1:]
+    vertical = south[:-1] != north[1:]
+    mismatched = int(horizontal.sum() + vertical.sum())
+    if mismatched:
+        where = (f"east of {_first(horizontal)}" if horizontal.any()
+                 else f"south of {_first(vertical)}")
+        problems.append(f"The walls between {mismatched} pairs of "
+                        f"neighboring cells do not match, such as {where}.")
+
+    rows, columns = north.shape
+    borders = (
+        ("north", ~north[:1], (0, 0)),
+        ("south", ~south[-1:], (rows - 1, 0)),
+        ("west", ~west[:, :1], (0, 0)),
+        ("east", ~east[:, -1:], (0, columns - 1)),
+    )
+    missing = sum(int(opening.sum()) for _, opening, _ in borders)
+    if missing:
+        side, opening, offset = next(border for border in borders
+                                     if border[1].any())
+        problems.append(f"{missing} walls on the border are missing, such "
+                        f"as {side} of {_first(opening, offset)}.")
+
+    if connected or perfect:
+        _, sizes = label_components(grid)
+        if len(sizes) > 1:
+            problems.append(f"The cells form {len(sizes)} separate groups.")
+        if perfect:
+            # A forest has one passage less than cells for each of its trees.
+            loops = (sum(int(open_.sum()) for open_ in passages(grid))
+                     - (rows * columns - len(sizes)))
+            if loops:
+                problems.append(f"The passages form {loops} loops.")
+
+    if problems:
+        raise ValueError(" ".join(problems))
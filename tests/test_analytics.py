@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from mazely import Maze, generate_batch, pack_grid
+from mazely.analytics import Analytics, tortuosity, turns
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_analytics(grid, packed):
+    analytics = Analytics(pack_grid(grid) if packed else grid)
+    assert analytics.open_sides.tolist() == [[1, 2, 2], [2, 1, 2], [2, 2, 2]]
+    assert analytics.side_counts().tolist() == [0, 2, 7, 0, 0]
+    assert analytics.dead_ends() == 2
+    assert analytics.junctions() == 0
+    assert analytics.corridor_lengths().tolist() == [0, 0, 2, 3]
+
+
+def test_junctions(grid):
+    grid = grid.copy()
+    grid[1, 1, 2] = grid[1, 2, 3] = False
+    analytics = Analytics(grid)
+    assert analytics.dead_ends() == 1
+    assert analytics.junctions() == 1
+    assert analytics.corridor_lengths().tolist() == [0, 0, 3, 3]
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_batch(packed):
+    grids = generate_batch(6, 8, range(5), packed=packed, workers=1)
+    analytics = Analytics(grids)
+    assert analytics.open_sides.shape == (5, 6, 8)
+    counts = analytics.corridor_lengths()
+    for index, grid in enumerate(grids):
+        single = Analytics(grid)
+        assert analytics.dead_ends()[index] == single.dead_ends()
+        assert analytics.junctions()[index] == single.junctions()
+        lengths = single.corridor_lengths()
+        assert np.array_equal(counts[index, :len(lengths)], lengths)
+        assert not counts[index, len(lengths):].any()
+
+
+def test_perfect_maze():
+    analytics = Analytics(Maze(20, 30, seed=0, packed=True).grid)
+    # A tree has one passage less than cells.
+    assert analytics.open_sides.sum() == 2 * (20 * 30 - 1)
+    assert analytics.side_counts().sum() == 20 * 30
+    # Each passage is in exactly one straight corridor.
+    lengths = analytics.corridor_lengths()
+    assert (lengths * (np.arange(len(lengths)) - 1)).sum() == 20 * 30 - 1
+
+
+def test_path_measures(solution_path):
+    assert tortuosity(solution_path) == 4.0
+    assert turns(solution_path) == 4
+    assert tortuosity(solution_path.tolist()) == 4.0
+    assert tortuosity([(1, 1)]) == 1.0
+    assert turns([(0, 0), (0, 1), (0, 2)]) == 0
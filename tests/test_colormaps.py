@@ -0,0 +1,31 @@
+import subprocess
+import sys
+
+import matplotlib as mpl
+import numpy as np
+import pytest
+
+from mazely.colormaps import sample_colormap
+
+
+@pytest.mark.parametrize("name", ["RdYlGn", "RdYlBu_r", "Spectral"])
+def test_sample_colormap(name):
+    for count in (0, 1, 2, 9, 257, 1000):
+        rgb = mpl.colormaps[name](np.linspace(0, 1, count))[:, :3]
+        assert np.array_equal(sample_colormap(name, count),
+                              np.round(rgb * 255))
+
+
+def test_sample_colormap_from_matplotlib():
+    assert sample_colormap("viridis", 2).tolist() == [[68, 1, 84],
+                                                      [253, 231, 37]]
+
+
+def test_import_without_matplotlib():
+    code = ("import sys, mazely; "
+            "from mazely.colormaps import sample_colormap; "
+            "sample_colormap('RdYlGn', 9); "
+            "print('matplotlib' in sys.modules)")
+    output = subprocess.run([sys.executable, "-c", code], check=True,
+                            capture_output=True, text=True).stdout
+    assert output.strip() == "False"
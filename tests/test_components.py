@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from mazely import Maze, pack_grid
+from mazely.components import Components, label_components
+
+
+def same_groups(first: np.ndarray, second: np.ndarray) -> bool:
+    """Whether two labelings group the cells in the same way."""
+    pairs = set(zip(first.ravel().tolist(), second.ravel().tolist()))
+    return len(pairs) == len(np.unique(first)) == len(np.unique(second))
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_label_components(grid, packed):
+    grid = grid.copy()
+    # Close off the goal cell, which only opens to the north.
+    grid[0, 1, 1] = grid[1, 1, 0] = True
+    labels, sizes = label_components(pack_grid(grid) if packed else grid)
+    assert labels.dtype == np.int32
+    assert sorted(sizes.tolist()) == [1, 8]
+    assert sizes[labels[1, 1]] == 1
+    assert len(np.unique(np.delete(labels.ravel(), 4))) == 1
+
+
+def test_perfect_maze():
+    labels, sizes = label_components(Maze(40, 60, seed=0, packed=True).grid)
+    assert not labels.any()
+    assert sizes.tolist() == [40 * 60]
+
+
+def test_one_sided_walls():
+    # A wall open from one side still connects the cells.
+    grid = np.ones((1, 2, 4), dtype=bool)
+    grid[0, 0, 2] = False
+    assert label_components(grid)[1].tolist() == [2]
+
+
+def test_random_walls():
+    rng = np.random.default_rng(0)
+    grid = rng.random((30, 40, 4)) < 0.6
+    labels, sizes = label_components(grid)
+
+    # Flood fill each group from its first cell.
+    expected = np.full((30, 40), -1)
+    moves = ((-1, 0, 0, 1), (1, 0, 1, 0), (0, 1, 2, 3), (0, -1, 3, 2))
+    for label, (row, column) in enumerate(np.ndindex(30, 40)):
+        if expected[row, column] >= 0:
+            continue
+        expected[row, column] = label
+        stack = [(row, column)]
+        while stack:
+            row, column = stack.pop()
+            for row_delta, column_delta, wall, facing in moves:
+                neighbor = (row + row_delta, column + column_delta)
+                if (0 <= neighbor[0] < 30 and 0 <= neighbor[1] < 40
+                        and expected[neighbor] < 0
+                        and not (grid[row, column, wall]
+                                 and grid[neighbor][facing])):
+                    expected[neighbor] = label
+                    stack.append(neighbor)
+    assert same_groups(labels, expected)
+    assert np.array_equal(np.bincount(labels.ravel()), sizes)
+
+
+def test_components(grid):
+    grid = grid.copy()
+    grid[0, 1, 1] = grid[1, 1, 0] = True
+    components = Components(grid)
+    assert components.size((1, 1)) == 1
+    assert components.size((0, 0)) == 8
+    assert components.label((0, 0)) == components.label((2, 2))
+    assert components.label((0, 0)) != components.label((1, 1))
+    assert components.is_reachable((0, 0), {(2, 2)})
+    assert not components.is_reachable((0, 0), {(1, 1)})
+    assert components.is_reachable((0, 0), {(1, 1), (0, 2)})
+    assert not components.is_reachable((0, 0), set())
+    with pytest.raises(ValueError):
+        components.label((3, 0))
+    with pytest.raises(ValueError):
+        components.is_reachable((0, 0), {(0, -1)})
@@ -0,0 +1,35 @@
+import numpy as np
+
+from mazely import pack_grid, unpack_grid
+from mazely.grid import EAST, NORTH, SOUTH, WEST, set_wall, wall_planes
+
+
+def test_pack_grid(grid):
+    packed = pack_grid(grid)
+    assert packed.shape == (3, 3)
+    assert packed.dtype == np.uint8
+    assert packed[0][0] == NORTH | EAST | WEST
+    assert packed[1][1] == SOUTH | EAST | WEST
+    assert pack_grid(packed) is packed
+
+
+def test_unpack_grid(grid):
+    assert np.array_equal(unpack_grid(pack_grid(grid)), grid)
+    assert unpack_grid(grid) is grid
+
+
+def test_wall_planes(grid):
+    planes = wall_planes(pack_grid(grid))
+    assert planes.shape == (4, 3, 3)
+    assert np.array_equal(planes, wall_planes(grid))
+    assert np.array_equal(planes[1], grid[:, :, 1])
+
+
+def test_set_wall(grid):
+    packed = pack_grid(grid)
+    set_wall(packed, (0, 0), 0, False)
+    set_wall(grid, (0, 0), 0, False)
+    assert packed[0][0] == EAST | WEST
+    assert np.array_equal(unpack_grid(packed), grid)
+    set_wall(packed, (0, 0), 0, True)
+    assert packed[0][0] == NORTH | EAST | WEST
@@ -0,0 +1,113 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from mazely import Maze, Utilities
+from mazely.algorithms import (AStar, BidirectionalBFS, RecursiveBacktracking,
+                               ShortestPath)
+from mazely.instrumentation import (add_hook, current_stats, instrument,
+                                    last_stats, remove_hook)
+
+RESOURCES = Path(__file__).parent.parent / "resources"
+
+
+def test_disabled():
+    last = last_stats()
+    maze = Maze(8, 8, seed=0)
+    maze.solve()
+    assert last_stats() is last
+    assert current_stats() is None
+
+
+def test_instrument(tmp_path):
+    generator = RecursiveBacktracking()
+    utilities = Utilities()
+    with instrument() as records:
+        maze = Maze(8, 8, seed=0, generator=generator)
+        maze.set_start_cell(0, 0)
+        maze.set_goal_cell(7, 7)
+        solution_path = maze.solve()
+        utilities.save_grid(maze.grid, tmp_path / "maze.svg")
+        maze.save_binary(tmp_path / "maze.bin")
+        loaded_maze = Maze(path=RESOURCES / "zigzag.maze")
+        assert last_stats() is records[-1]
+    Maze(4, 4, seed=0, generator=generator)
+    assert last_stats() is records[-1]
+
+    assert [stats.operation for stats in records] == [
+        "RecursiveBacktracking.generate",
+        "ShortestPath.solve",
+        "Utilities.save_grid",
+        "Maze.save_binary",
+        "Maze.load_maze",
+    ]
+    generated, solved, saved_grid, saved_binary, loaded = records
+    assert all(stats.seconds >= 0 for stats in records)
+    assert generated.cells_visited == 64
+    assert 1 <= solved.nodes_expanded <= solved.cells_visited
+    assert len(solution_path) <= solved.cells_visited <= 64
+    assert 1 <= solved.queue_peak < solved.cells_visited
+    assert saved_grid.bytes_written == (tmp_path / "maze.svg").stat().st_size
+    assert saved_binary.bytes_written == (tmp_path / "maze.bin").stat().st_size
+    assert loaded.cells_visited == loaded_maze.grid_size
+    assert loaded.bytes_written is None
+    assert set(solved.as_dict()) == {
+        "operation", "seconds", "cells_visited", "nodes_expanded",
+        "queue_peak", "bytes_written"
+    }
+
+
+@pytest.mark.parametrize("solver_class", [AStar, BidirectionalBFS])
+def test_solver_counters(grid, solver_class):
+    solver = solver_class()
+    calls = []
+    add_hook(calls.append)
+    try:
+        solver.solve(grid, (0, 0), {(1, 1)})
+    finally:
+        remove_hook(calls.append)
+    solver.solve(grid, (0, 0), {(1, 1)})
+
+    assert len(calls) == 1
+    assert calls[0].operation == f"{solver_class.__name__}.solve"
+    assert 0 < calls[0].nodes_expanded <= calls[0].cells_visited <= 9
+    assert 0 < calls[0].queue_peak <= calls[0].cells_visited
+
+
+def test_threads(grid):
+    # Each thread sees the measurements of its own calls to a shared solver.
+    solver = ShortestPath()
+    goals = [{(0, 1)}, {(1, 1)}, {(2, 2)}] * 8
+
+    def solve(goal: set[tuple[int, int]]) -> int:
+        solver.solve(grid, (0, 0), goal)
+        return last_stats().cells_visited
+
+    with instrument() as records:
+        expected = [solve(goal) for goal in goals]
+        with ThreadPoolExecutor(4) as executor:
+            assert list(executor.map(solve, goals)) == expected
+    assert len(set(expected)) == 3
+    assert len(records) == 2 * len(goals)
+
+
+def test_delegating_subclasses(grid):
+    # An override that calls the method it overrides is measured once.
+    class Generator(RecursiveBacktracking):
+        def generate(self, rows, columns, seed=None):
+            return super().generate(rows, columns, seed)
+
+    class Solver(ShortestPath):
+        def solve(self, grid, start, goal):
+            return super().solve(grid, start, goal)
+
+    with instrument() as records:
+        Generator().generate(4, 5, seed=0)
+        Solver().solve(grid, (0, 0), {(1, 1)})
+    assert [stats.operation for stats in records] == [
+        "Generator.generate", "Solver.solve"
+    ]
+    assert records[0].cells_visited == 20
+    assert (records[1].nodes_expanded, records[1].cells_visited) == (8, 9)
+    assert last_stats() is records[1]
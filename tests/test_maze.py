@@ -1,8 +1,14 @@
+import random
 from pathlib import Path
 
 import numpy as np
 import pytest
 
+from mazely import Maze, generate_batch, pack_grid
+from mazely.algorithms import IncrementalShortestPath, ShortestPath
+from mazely.grid import NORTH, WEST
+from mazely.instrumentation import instrument
+
 
 def test_are_cells_adjacent(maze):
     assert not maze.are_cells_adjacent((0, 0))
@@ -68,3 +74,218 @@ def test_remove_wall(maze):
     assert not maze.remove_wall((1, 0), (1, 2))
     assert np.array_equiv(maze.grid[1][0], [False, False, True, True])
     assert np.array_equiv(maze.grid[1][2], [False, False, True, True])
+
+    # Removing a missing wall keeps the cached results.
+    solution_path = maze.solve()
+    components = maze.components()
+    assert maze.remove_wall((0, 1), (0, 0))
+    assert maze.solve() is solution_path
+    assert maze.components() is components
+
+    grid = maze.grid.copy()
+    assert not maze.remove_wall((0, 0), (-1, 0))
+    assert not maze.remove_wall((2, 2), (2, 3))
+    assert np.array_equal(maze.grid, grid)
+
+
+def test_add_wall(maze):
+    assert maze.add_wall((0, 1), (1, 1))
+    assert np.array_equiv(maze.grid[0][1], [True, True, False, True])
+    assert np.array_equiv(maze.grid[1][1], [True, True, True, True])
+    assert maze.solution_path is None
+
+    assert not maze.add_wall((0, 0), (2, 0))
+
+
+def test_incremental_solver():
+    maze = Maze(3, 3, seed=0, solver=IncrementalShortestPath())
+    maze.set_start_cell(0, 0)
+    maze.set_goal_cell(1, 1)
+    assert len(maze.solution_path) == 9
+
+    assert maze.remove_wall((0, 0), (0, 1))
+    assert maze.solution_path == [(0, 0), (0, 1), (1, 1)]
+    assert maze.add_wall((0, 0), (0, 1))
+    with instrument() as records:
+        assert len(maze.solution_path) == 9
+    assert records[0].nodes_expanded < maze.grid_size
+
+    # Walls changed in place are picked up when the grid is assigned again.
+    assert maze.remove_wall((0, 0), (0, 1))
+    assert len(maze.solution_path) == 3
+    maze.grid[0, 0, 2] = maze.grid[0, 1, 3] = True
+    maze.grid = maze.grid
+    assert len(maze.solution_path) == 9
+
+
+def test_random_seed():
+    assert Maze().seed != Maze().seed
+
+    maze = Maze(5, 5, seed=3)
+    assert (maze.start, maze.goal) == (Maze(5, 5, seed=3).start,
+                                       Maze(5, 5, seed=3).goal)
+    maze.generate(5, 5)
+    assert maze.seed != 3
+
+    # The start cell is not the first cell the generator carves from.
+    roots = []
+    for seed in range(10):
+        generator_random = random.Random(seed)
+        roots.append((generator_random.randrange(5),
+                      generator_random.randrange(5)))
+    assert [Maze(5, 5, seed=seed).start for seed in range(10)] != roots
+
+
+def test_packed_maze():
+    maze = Maze(3, 3, seed=0, packed=True)
+    assert np.array_equal(maze.grid, pack_grid(Maze(3, 3, seed=0).grid))
+
+    maze.set_start_cell(0, 0)
+    maze.set_goal_cell(1, 1)
+    maze.solve()
+    assert len(maze.solution_path) == 9
+
+    assert maze.remove_wall((0, 0), (0, 1))
+    assert maze.grid[0][0] == NORTH | WEST
+    assert maze.grid[0][1] == NORTH
+
+
+def test_save_binary(maze, tmp_path):
+    maze.save_binary(tmp_path / "maze.bin")
+
+    loaded = Maze(packed=True)
+    loaded.load_binary(tmp_path / "maze.bin")
+    assert isinstance(loaded.grid, np.memmap)
+    assert np.array_equal(loaded.grid, pack_grid(maze.grid))
+    assert (loaded.rows, loaded.columns, loaded.grid_size) == (3, 3, 9)
+    assert loaded.start == (0, 0)
+    assert loaded.goal == {(1, 1)}
+    assert loaded.seed == 0
+
+    loaded = Maze()
+    loaded.load_binary(tmp_path / "maze.bin")
+    assert np.array_equal(loaded.grid, maze.grid)
+
+
+def test_distance_map(maze):
+    distances = maze.distance_map()
+    assert distances.shape == (3, 3)
+    assert distances[maze.start] == len(maze.solution_path) - 1
+    assert distances[1][1] == 0
+
+
+class CountingSolver(ShortestPath):
+    """A solver that counts how many times it solves a maze."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def solve(self, grid, start, goal):
+        self.calls += 1
+        return super().solve(grid, start, goal)
+
+
+def test_cached_solution():
+    solver = CountingSolver()
+    maze = Maze(3, 3, seed=0, solver=solver)
+    assert solver.calls == 0
+
+    maze.set_start_cell(0, 0)
+    maze.set_goal_cell(1, 1)
+    assert len(maze.solution_path) == 9
+    assert maze.solve() is maze.solution_path
+    assert solver.calls == 1
+
+    maze.set_start_cell(0, 1)
+    assert maze.solution_path == [(0, 1), (1, 1)]
+    maze.add_goal_cells((0, 2))
+    assert maze.solution_path == [(0, 1), (1, 1)]
+    assert solver.calls == 3
+
+    maze.set_start_cell(0, 0)
+    assert maze.remove_wall((0, 0), (0, 1))
+    assert maze.solution_path == [(0, 0), (0, 1), (1, 1)]
+    assert solver.calls == 4
+
+    maze.grid = Maze(3, 3, seed=0).grid
+    assert maze.solution_path[-1] == (0, 2)
+    assert solver.calls == 5
+
+    # Only the last few solutions are kept.
+    maze.set_goal_cell(2, 2)
+    cells = [(row, column) for row in range(3) for column in range(3)]
+    for cell in cells:
+        maze.set_start_cell(*cell)
+        maze.solve()
+    assert solver.calls == 14
+    maze.set_start_cell(*cells[-1])
+    maze.solve()
+    assert solver.calls == 14
+    for cell in cells[:2]:
+        maze.set_start_cell(*cell)
+        maze.solve()
+    assert solver.calls == 16
+
+
+def test_unreachable_goal():
+    solver = CountingSolver()
+    maze = Maze(3, 3, seed=0, solver=solver)
+    maze.set_start_cell(0, 0)
+    maze.set_goal_cell(1, 1)
+    assert maze.add_wall((0, 1), (1, 1))
+    assert maze.solution_path is None
+    assert solver.calls == 1
+    assert maze.components().sizes.tolist() in ([8, 1], [1, 8])
+
+    # Later failures are answered from the components without searching.
+    maze.set_start_cell(2, 2)
+    assert maze.solution_path is None
+    assert solver.calls == 1
+    maze.set_goal_cell(0, 1)
+    assert len(maze.solution_path) == 4
+    assert solver.calls == 2
+
+    components = maze.components()
+    assert maze.components() is components
+    assert maze.remove_wall((0, 1), (1, 1))
+    assert maze.components() is not components
+    assert maze.components().sizes.tolist() == [9]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_generate_batch(workers):
+    seeds = [0, 5, 7, 11, 13]
+    grids = generate_batch(4, 5, seeds, workers=workers)
+    assert grids.shape == (5, 4, 5, 4)
+    for seed, grid in zip(seeds, grids):
+        assert np.array_equal(grid, Maze(4, 5, seed=seed).grid)
+
+    grids, solution_paths = generate_batch(4, 5, seeds, solve=True,
+                                           workers=workers, packed=True)
+    assert grids.shape == (5, 4, 5)
+    for seed, grid, solution_path in zip(seeds, grids, solution_paths):
+        maze = Maze(4, 5, seed=seed, packed=True)
+        assert np.array_equal(grid, maze.grid)
+        assert solution_path == maze.solution_path
+
+    with pytest.raises(ValueError):
+        generate_batch(4, 5, seeds, workers=0)
+
+
+def test_solve_many(maze):
+    paths = maze.solve_many([maze.start, (2, 2)])
+    assert paths[0] == maze.solution_path
+    assert paths[1][-1] == (1, 1)
+    assert maze.solve_many([maze.start], next_step_only=True).tolist() == \
+        [list(maze.solution_path[1])]
+
+
+def test_save_maze(tmp_path):
+    maze = Maze(9, 7, seed=0, packed=True)
+    maze.goal = {(8, 6), (4, 4)}
+    maze.save_maze(tmp_path / "maze.maze")
+    loaded = Maze(path=tmp_path / "maze.maze", packed=True)
+    assert np.array_equal(loaded.grid, maze.grid)
+    assert loaded.start == maze.start
+    assert loaded.goal == maze.goal
@@ -0,0 +1,145 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from mazely import pack_grid, unpack_grid
+from mazely.maze_file import (iter_maze_rows, read_binary, read_maze,
+                              write_binary, write_binary_rows, write_maze)
+
+RESOURCES = Path(__file__).parent.parent / "resources"
+
+
+# The maze from the README.
+MAZE_TEXT = """
++---+---+---+
+|           |
++   +---+   +
+|     G |   |
++---+---+   +
+| S         |
++---+---+---+
+"""
+
+
+def read_maze_text(tmp_path: Path) -> tuple:
+    """Read the maze from the README."""
+    file_path = tmp_path / "readme.maze"
+    file_path.write_text(MAZE_TEXT)
+    return read_maze(file_path)
+
+
+def test_read_maze(tmp_path):
+    grid, start, goal = read_maze_text(tmp_path)
+
+    assert start == [(2, 0)]
+    assert goal == [(1, 1)]
+    assert np.array_equal(unpack_grid(grid), [
+        [
+            [True, False, False, True],
+            [True, True, False, False],
+            [True, False, True, False],
+        ],
+        [
+            [False, True, False, True],
+            [True, True, True, False],
+            [False, False, True, True],
+        ],
+        [
+            [True, True, False, True],
+            [True, True, False, False],
+            [False, True, True, False],
+        ],
+    ])
+
+
+def test_read_maze_resource():
+    grid, start, goal = read_maze(RESOURCES / "2019japan.maze")
+    assert grid.shape == (32, 32)
+    assert start == [(31, 0)]
+    assert goal == [(row, column)
+                    for row in range(16, 19) for column in range(17, 20)]
+
+
+def test_iter_maze_rows():
+    grid, start, goal = read_maze(RESOURCES / "2019japan.maze")
+    blocks = list(iter_maze_rows(RESOURCES / "2019japan.maze", block_rows=5))
+    assert [block[0] for block in blocks] == list(range(0, 32, 5))
+    assert np.array_equal(np.concatenate([block[1] for block in blocks]),
+                          grid)
+    assert [cell for block in blocks for cell in block[2]] == start
+    assert [cell for block in blocks for cell in block[3]] == goal
+
+
+def test_iter_maze_rows_empty_file(tmp_path):
+    file_path = tmp_path / "empty.maze"
+    file_path.write_text("\n\n")
+    with pytest.raises(ValueError):
+        list(iter_maze_rows(file_path))
+
+
+def test_binary_round_trip(grid, tmp_path):
+    file_path = tmp_path / "maze.bin"
+    write_binary(file_path, pack_grid(grid), (0, 0), {(1, 1), (2, 2)},
+                 seed=0, generator="RecursiveBacktracking")
+    packed, start, goal, seed, generator = read_binary(file_path)
+
+    assert isinstance(packed, np.memmap)
+    assert np.array_equal(unpack_grid(packed), grid)
+    assert start == (0, 0)
+    assert goal == {(1, 1), (2, 2)}
+    assert seed == 0
+    assert generator == "RecursiveBacktracking"
+
+    write_binary(file_path, pack_grid(grid), (0, 0), {(1, 1)})
+    assert read_binary(file_path)[3:] == (None, "")
+
+
+def test_read_binary_invalid_file(tmp_path):
+    file_path = tmp_path / "readme.maze"
+    file_path.write_text(MAZE_TEXT * 4)
+    with pytest.raises(ValueError):
+        read_binary(file_path)
+
+
+def test_write_binary_rows(grid, tmp_path):
+    file_path = tmp_path / "maze.bin"
+    packed = pack_grid(grid)
+    write_binary_rows(file_path, *packed.shape, iter(packed), (0, 0),
+                      {(1, 1)}, seed=0, generator="RecursiveBacktracking")
+    streamed = read_binary(file_path)
+
+    write_binary(file_path, packed, (0, 0), {(1, 1)}, seed=0,
+                 generator="RecursiveBacktracking")
+    written = read_binary(file_path)
+    assert np.array_equal(streamed[0], written[0])
+    assert streamed[1:] == written[1:]
+
+    with pytest.raises(ValueError):
+        write_binary_rows(file_path, *packed.shape, [packed[:1]], (0, 0),
+                          {(1, 1)})
+    with pytest.raises(ValueError):
+        write_binary_rows(file_path, *packed.shape, [packed, packed[:1]],
+                          (0, 0), {(1, 1)})
+
+
+def test_write_maze(tmp_path):
+    file_path = tmp_path / "readme.maze"
+    grid, start, goal = read_maze_text(tmp_path)
+    write_maze(file_path, unpack_grid(grid), start[0], set(goal))
+    assert file_path.read_text() == MAZE_TEXT.lstrip()
+
+    with pytest.raises(ValueError):
+        write_maze(file_path, grid, start[0], set(goal), block_rows=0)
+
+
+@pytest.mark.parametrize("name", ["2015apec", "2019japan", "zigzag"])
+def test_write_maze_round_trip(name, tmp_path):
+    grid, start, goal = read_maze(RESOURCES / f"{name}.maze")
+    file_path = tmp_path / "maze.maze"
+    for block_rows in (1, 5, 1024):
+        write_maze(file_path, grid, (0, 0), set(goal), block_rows)
+        written = read_maze(file_path)
+        assert np.array_equal(written[0], grid)
+        assert written[1] == [(0, 0)]
+        assert sorted(written[2]) == sorted(goal)
@@ -1,7 +1,13 @@
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import pytest
 
-from mazely.algorithms import MazeGenerator, RecursiveBacktracking
+from mazely import unpack_grid
+from mazely.algorithms import (Eller, Kruskal, MazeGenerator,
+                               RecursiveBacktracking)
 
 
 def is_each_seed_unique(generator: MazeGenerator) -> bool:
@@ -50,6 +56,22 @@ def has_isolated_cells(grid: np.ndarray) -> bool:
     return False
 
 
+def is_connected(grid: np.ndarray) -> bool:
+    """Whether every cell of a grid can be reached from every other cell."""
+    rows, columns = grid.shape[:2]
+    moves = ((-1, 0), (1, 0), (0, 1), (0, -1))
+    reached = {(0, 0)}
+    stack = [(0, 0)]
+    while stack:
+        row, column = stack.pop()
+        for wall, (row_step, column_step) in enumerate(moves):
+            neighbor = (row + row_step, column + column_step)
+            if not grid[row, column, wall] and neighbor not in reached:
+                reached.add(neighbor)
+                stack.append(neighbor)
+    return len(reached) == rows * columns
+
+
 def test_base_maze_generator():
     generator = MazeGenerator()
     with pytest.raises(NotImplementedError):
@@ -83,3 +105,65 @@ def test_recursive_backtracking():
         ],
     ])
     assert np.array_equal(grid, grid_literal) is True
+
+
+def test_recursive_backtracking_large_grid():
+    recursion_limit = sys.getrecursionlimit()
+    grid = RecursiveBacktracking().generate(200, 300, seed=0)
+    assert sys.getrecursionlimit() == recursion_limit
+    assert grid.shape == (200, 300, 4)
+    assert is_boundary_closed(grid) is True
+    assert has_isolated_cells(grid) is False
+    # A perfect maze has one passage less than it has cells.
+    assert (~grid).sum() // 2 == 200 * 300 - 1
+
+
+def test_recursive_backtracking_packed():
+    grid = RecursiveBacktracking().generate(9, 7, seed=0)
+    packed = RecursiveBacktracking(packed=True).generate(9, 7, seed=0)
+    assert packed.shape == (9, 7)
+    assert np.array_equal(unpack_grid(packed), grid)
+
+
+def test_recursive_backtracking_threads():
+    generator = RecursiveBacktracking(packed=True)
+    seeds = list(range(16))
+    with ThreadPoolExecutor(4) as executor:
+        grids = list(executor.map(
+            lambda seed: generator.generate(40, 40, seed=seed), seeds))
+    for seed, grid in zip(seeds, grids):
+        assert np.array_equal(grid, generator.generate(40, 40, seed=seed))
+
+
+def test_recursive_backtracking_global_random():
+    random.seed(0)
+    state = random.getstate()
+    RecursiveBacktracking().generate(5, 5, seed=1)
+    assert random.getstate() == state
+
+
+@pytest.mark.parametrize("generator_class", [Kruskal, Eller])
+def test_perfect_maze_generators(generator_class):
+    generator = generator_class()
+    assert is_each_seed_unique(generator)
+
+    for rows, columns in [(1, 1), (1, 6), (6, 1), (30, 40)]:
+        grid = generator.generate(rows, columns, seed=0)
+        assert grid.shape == (rows, columns, 4)
+        assert grid[0, :, 0].all() and grid[-1, :, 1].all()
+        assert grid[:, -1, 2].all() and grid[:, 0, 3].all()
+        # A perfect maze has one passage less than it has cells, and reaches
+        # every cell.
+        assert (~grid).sum() // 2 == rows * columns - 1
+        assert is_connected(grid) is True
+
+    packed = generator_class(packed=True).generate(9, 7, seed=0)
+    assert np.array_equal(unpack_grid(packed),
+                          generator.generate(9, 7, seed=0))
+
+
+def test_eller_iter_rows():
+    generator = Eller(packed=True)
+    rows = list(generator.iter_rows(20, 30, seed=0))
+    assert len(rows) == 20
+    assert np.array_equal(np.stack(rows), generator.generate(20, 30, seed=0))
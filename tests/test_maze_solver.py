@@ -1,6 +1,12 @@
+import numpy as np
 import pytest
 
-from mazely.algorithms import MazeSolver, ShortestPath
+from mazely import SolutionPath, pack_grid
+from mazely.algorithms import (AStar, BidirectionalBFS,
+                               IncrementalShortestPath, MazeSolver,
+                               ShortestPath)
+from mazely.grid import set_wall
+from mazely.instrumentation import instrument
 
 
 def are_both_cells_adjacent(cell_one: tuple[int, int],
@@ -45,3 +51,210 @@ def test_shortest_path(grid):
     solution_path_literal = [(0, 0), (1, 0), (2, 0),
                              (2, 1), (2, 2), (1, 2), (0, 2), (0, 1), (1, 1)]
     assert solution_path == solution_path_literal
+
+
+def test_shortest_path_packed(grid, solution_path):
+    solver = ShortestPath()
+    assert solver.solve(pack_grid(grid), (0, 0), {(1, 1)}) == solution_path
+
+
+def open_grid(rows: int, columns: int) -> np.ndarray:
+    """A grid without inner walls."""
+    grid = np.zeros((rows, columns, 4), dtype=bool)
+    grid[0, :, 0] = grid[-1, :, 1] = grid[:, -1, 2] = grid[:, 0, 3] = True
+    return grid
+
+
+def test_shortest_path_with_loops():
+    # Every cell but the start can be reached through more than one shortest
+    # path.
+    grid = open_grid(3, 3)
+
+    solver = ShortestPath()
+    assert solver.solve(grid, (0, 0), {(2, 2)}) == \
+        [(0, 0), (0, 1), (0, 2), (1, 2), (2, 2)]
+    assert solver.solve(grid, (1, 1), {(0, 0), (2, 2)}) == \
+        [(1, 1), (1, 0), (0, 0)]
+    assert solver.solve(grid, (1, 1), {(1, 1)}) == [(1, 1)]
+
+
+def test_shortest_path_unreachable(grid):
+    # Wall in the start cell.
+    grid = grid.copy()
+    grid[0, 0] = grid[1, 0, 0] = grid[0, 1, 3] = True
+    assert ShortestPath().solve(grid, (0, 0), {(1, 1)}) is None
+
+
+@pytest.mark.parametrize("solver_class",
+                         [AStar, BidirectionalBFS, IncrementalShortestPath])
+def test_optimal_solvers(grid, solution_path, solver_class):
+    solver = solver_class()
+    assert solver.solve(grid, (0, 0), {(1, 1)}) == solution_path
+    with instrument() as records:
+        assert solver.solve(grid, (1, 1), {(1, 1)}) == [(1, 1)]
+    assert records[0].nodes_expanded == 0
+
+    # Every shortest path in an open grid has the same length.
+    grid = open_grid(20, 30)
+    solution_path = solver.solve(grid, (2, 3), {(17, 25), (0, 29)})
+    assert is_each_cell_adjacent(solution_path) is True
+    assert are_there_duplicates(solution_path) is True
+    assert solution_path[0] == (2, 3)
+    assert solution_path[-1] == (0, 29)
+    assert len(solution_path) == len(
+        ShortestPath().solve(grid, (2, 3), {(17, 25), (0, 29)}))
+
+
+@pytest.mark.parametrize("solver_class",
+                         [AStar, BidirectionalBFS, IncrementalShortestPath])
+def test_optimal_solvers_one_sided_walls(solver_class):
+    # A wall closed on one side only can be crossed from the other side.
+    grid = open_grid(1, 4)
+    grid[0, 1, 2] = True
+    assert ShortestPath().solve(grid, (0, 0), {(0, 2)}) is None
+    assert solver_class().solve(grid, (0, 0), {(0, 2)}) is None
+    assert solver_class().solve(grid, (0, 2), {(0, 0)}) == \
+        [(0, 2), (0, 1), (0, 0)]
+
+    random = np.random.default_rng(0)
+    for _ in range(50):
+        grid = open_grid(6, 7) | (random.random((6, 7, 4)) < 0.4)
+        start = tuple(random.integers((6, 7)).tolist())
+        goal = {tuple(cell) for cell in random.integers((6, 7), size=(2, 2))
+                .tolist()}
+        expected = ShortestPath().solve(grid, start, goal)
+        solution_path = solver_class().solve(grid, start, goal)
+        if expected is None:
+            assert solution_path is None
+        else:
+            assert len(solution_path) == len(expected)
+            assert solution_path[0] == start
+            assert solution_path[-1] in goal
+
+
+def test_nodes_expanded():
+    grid = open_grid(30, 30)
+    with instrument() as records:
+        for solver in [ShortestPath(), AStar(), BidirectionalBFS()]:
+            solver.solve(grid, (0, 0), {(29, 29)})
+    assert records[0].nodes_expanded > records[2].nodes_expanded
+    assert records[2].nodes_expanded > records[1].nodes_expanded
+    assert records[1].nodes_expanded == 58
+
+
+@pytest.mark.parametrize("solver_class",
+                         [AStar, BidirectionalBFS, IncrementalShortestPath])
+def test_optimal_solvers_unreachable(grid, solver_class):
+    # Wall in the start cell.
+    grid = grid.copy()
+    grid[0, 0] = grid[1, 0, 0] = grid[0, 1, 3] = True
+    assert solver_class().solve(grid, (0, 0), {(1, 1)}) is None
+    assert solver_class().solve(grid, (0, 0), set()) is None
+
+
+def test_incremental_shortest_path(grid, solution_path):
+    grid = grid.copy()
+    solver = IncrementalShortestPath()
+    with instrument() as records:
+        assert solver.solve(grid, (0, 0), {(1, 1)}) == solution_path
+        assert solver.solve(grid, (0, 1), {(1, 1)}) == [(0, 1), (1, 1)]
+    assert [stats.nodes_expanded for stats in records] == [9, 0]
+
+    # Open a shortcut from the start.
+    set_wall(grid, (0, 0), 2, False)
+    set_wall(grid, (0, 1), 3, False)
+    solver.update_walls(grid, (0, 0), (0, 1))
+    assert solver.solve(grid, (0, 0), {(1, 1)}) == [(0, 0), (0, 1), (1, 1)]
+    assert solver.solve(grid, (1, 0), {(1, 1)}) == \
+        [(1, 0), (0, 0), (0, 1), (1, 1)]
+
+    # Wall in the goal cell.
+    set_wall(grid, (0, 1), 1, True)
+    set_wall(grid, (1, 1), 0, True)
+    solver.update_walls(grid, (0, 1), (1, 1))
+    assert solver.solve(grid, (0, 0), {(1, 1)}) is None
+    assert solver.solve(grid, (1, 1), {(1, 1)}) == [(1, 1)]
+
+    # The repaired distances match those found from scratch.
+    for cell in [(row, column) for row in range(3) for column in range(3)]:
+        assert solver.solve(grid, cell, {(1, 1)}) == \
+            IncrementalShortestPath().solve(grid, cell, {(1, 1)})
+
+
+def test_distance_map(grid):
+    solver = ShortestPath()
+    distances = solver.distance_map(grid, {(1, 1)})
+    assert np.array_equal(distances, [
+        [8, 1, 2],
+        [7, 0, 3],
+        [6, 5, 4],
+    ])
+    assert np.array_equal(solver.distance_map(pack_grid(grid), {(1, 1)}),
+                          distances)
+
+    distances = solver.distance_map(open_grid(3, 4), {(0, 0), (2, 3)})
+    assert np.array_equal(distances, [
+        [0, 1, 2, 2],
+        [1, 2, 2, 1],
+        [2, 2, 1, 0],
+    ])
+
+
+def test_follow_distance_map(grid, solution_path):
+    solver = ShortestPath()
+    distances = solver.distance_map(grid, {(1, 1)})
+    assert solver.follow_distance_map(grid, distances, (0, 0)) == \
+        solution_path
+    assert solver.follow_distance_map(grid, distances, (1, 1)) == [(1, 1)]
+
+    # Wall in the goal cell.
+    grid = grid.copy()
+    grid[1, 1] = grid[0, 1, 1] = True
+    distances = solver.distance_map(grid, {(1, 1)})
+    assert (distances[np.arange(3) != 1] == -1).all()
+    assert solver.follow_distance_map(grid, distances, (0, 0)) is None
+
+
+def test_solve_many(grid, solution_path):
+    solver = ShortestPath()
+    starts = [(0, 0), (1, 1), (2, 2), (0, 1)]
+    paths = solver.solve_many(grid, starts, {(1, 1)})
+    assert all(isinstance(path, SolutionPath) for path in paths)
+    assert [path.columns for path in paths] == [3] * 4
+    assert paths == [
+        solution_path,
+        [(1, 1)],
+        [(2, 2), (1, 2), (0, 2), (0, 1), (1, 1)],
+        [(0, 1), (1, 1)],
+    ]
+    assert solver.solve_many(pack_grid(grid), starts, {(1, 1)},
+                             next_step_only=True).tolist() == \
+        [[1, 0], [1, 1], [1, 2], [1, 1]]
+
+
+def test_solve_many_with_loops():
+    grid = open_grid(5, 5)
+    set_wall(grid, (4, 4), 0, True)
+    set_wall(grid, (3, 4), 1, True)
+    starts = np.array([(row, column) for row in range(5)
+                       for column in range(5)])
+    goal = {(0, 0), (4, 4)}
+    solver = ShortestPath()
+    paths = solver.solve_many(grid, starts, goal)
+    for start, path in zip(starts.tolist(), paths):
+        assert path[0] == tuple(start) and path[-1] in goal
+        assert is_each_cell_adjacent(path) is True
+        assert len(path) == len(solver.solve(grid, tuple(start), goal))
+
+
+def test_solve_many_unreachable(grid):
+    set_wall(grid, (1, 1), 0, True)
+    set_wall(grid, (0, 1), 1, True)
+    solver = ShortestPath()
+    paths = solver.solve_many(grid, [(0, 0), (1, 1)], {(1, 1)})
+    assert paths[0] is None
+    assert paths[1] == [(1, 1)]
+    assert solver.solve_many(grid, [(0, 0)], {(1, 1)},
+                             next_step_only=True).tolist() == [[-1, -1]]
+    with pytest.raises(ValueError):
+        solver.solve_many(grid, [(0, 3)], {(1, 1)})
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from mazely import Maze, PathQueries
+from mazely.algorithms import ShortestPath
+
+
+def random_pairs(rows: int, columns: int, count: int) -> np.ndarray:
+    """Get random pairs of cells as a ``(2, count, 2)`` array."""
+    rng = np.random.default_rng(0)
+    return np.stack([rng.integers(0, rows, (2, count)),
+                     rng.integers(0, columns, (2, count))], axis=-1)
+
+
+def assert_matches_solver(maze: Maze, queries: PathQueries):
+    """Check each kind of query against solving with breadth-first search."""
+    starts, goals = random_pairs(maze.rows, maze.columns, 100)
+    distances = queries.distances(starts, goals)
+    for start, goal, distance in zip(starts.tolist(), goals.tolist(),
+                                     distances):
+        start, goal = tuple(start), tuple(goal)
+        solution_path = ShortestPath().solve(maze.grid, start, {goal})
+        assert queries.path(start, goal) == solution_path
+        assert queries.distance(start, goal) == len(solution_path) - 1
+        assert distance == len(solution_path) - 1
+
+
+@pytest.mark.parametrize("size", [(1, 1), (1, 6), (6, 1), (17, 23)])
+def test_perfect_maze(size):
+    maze = Maze(*size, seed=0)
+    queries = maze.path_queries()
+    assert queries.is_tree is True
+    assert maze.path_queries() is queries
+    assert_matches_solver(maze, queries)
+
+
+def test_maze_with_loops():
+    maze = Maze(12, 12, seed=0, packed=True)
+    queries = maze.path_queries()
+    maze.remove_wall((3, 3), (3, 4))
+    maze.remove_wall((5, 5), (6, 5))
+    assert maze.path_queries() is not queries
+    assert maze.path_queries().is_tree is False
+    assert_matches_solver(maze, maze.path_queries())
+
+
+def test_unreachable_cells():
+    maze = Maze(10, 10, seed=0)
+    for neighbor in ((4, 5), (6, 5), (5, 4), (5, 6)):
+        maze.add_wall((5, 5), neighbor)
+    queries = maze.path_queries()
+    assert queries.is_tree is True
+    assert queries.distance((5, 5), (0, 0)) is None
+    assert queries.path((0, 0), (5, 5)) is None
+    assert queries.distance((5, 5), (5, 5)) == 0
+    assert queries.distances([(5, 5), (0, 0)],
+                             [(0, 0), (9, 9)]).tolist()[0] == -1
+
+
+def test_cells_out_of_range():
+    queries = Maze(3, 3, seed=0).path_queries()
+    with pytest.raises(ValueError):
+        queries.distance((3, 0), (0, 0))
+    with pytest.raises(ValueError):
+        queries.path((0, 0), (0, -1))
+    with pytest.raises(ValueError):
+        queries.distances([(0, 0)], [(0, 3)])
@@ -0,0 +1,71 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from mazely import SolutionPath
+from mazely.algorithms import (AStar, BidirectionalBFS,
+                               IncrementalShortestPath, ShortestPath)
+
+
+@pytest.fixture
+def path():
+    return SolutionPath.from_locations([(0, 0), (0, 1), (1, 1), (1, 2)], 3)
+
+
+def test_sequence(path):
+    assert path.cells.dtype == np.int32
+    assert path.cells.tolist() == [0, 1, 4, 5]
+    assert len(path) == 4
+    assert list(path) == [(0, 0), (0, 1), (1, 1), (1, 2)]
+    assert list(reversed(path)) == [(1, 2), (1, 1), (0, 1), (0, 0)]
+    assert path[0] == (0, 0)
+    assert path[-1] == (1, 2)
+    assert (1, 1) in path
+    assert (2, 2) not in path
+    assert (0, 3) not in path
+    assert path.tolist() == [(0, 0), (0, 1), (1, 1), (1, 2)]
+    with pytest.raises(IndexError):
+        path[4]
+
+
+def test_slice(path):
+    part = path[1:3]
+    assert isinstance(part, SolutionPath)
+    assert part == [(0, 1), (1, 1)]
+    assert np.shares_memory(part.cells, path.cells)
+    assert path[::-1] == list(reversed(path))
+    assert path[:2] + path[2:] == path
+    assert len(path[4:]) == 0
+
+
+def test_locations(path):
+    locations = path.locations()
+    assert locations.dtype == np.int32
+    assert locations.tolist() == [[0, 0], [0, 1], [1, 1], [1, 2]]
+    assert np.array_equal(np.asarray(path), locations)
+    assert np.asarray(path, dtype=float).dtype == float
+
+
+def test_equality(path):
+    assert path == [(0, 0), (0, 1), (1, 1), (1, 2)]
+    assert [(0, 0), (0, 1), (1, 1), (1, 2)] == path
+    assert path == np.array([[0, 0], [0, 1], [1, 1], [1, 2]])
+    assert path != [(0, 0), (0, 1), (1, 1)]
+    assert path != path[::-1]
+    assert path is not None
+    assert path != "path"
+    assert SolutionPath([], 3) == []
+    assert pickle.loads(pickle.dumps(path)) == path
+
+
+@pytest.mark.parametrize(
+    "solver_class",
+    [ShortestPath, AStar, BidirectionalBFS, IncrementalShortestPath]
+)
+def test_solvers(grid, solver_class):
+    solution_path = solver_class().solve(grid, (0, 0), {(1, 1)})
+    assert isinstance(solution_path, SolutionPath)
+    assert solution_path.columns == 3
+    assert solution_path.tolist() == [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2),
+                                      (1, 2), (0, 2), (0, 1), (1, 1)]
@@ -1,5 +1,7 @@
 import hashlib
 
+import matplotlib.pyplot as plt
+import numpy as np
 import pytest
 
 try:
@@ -67,3 +69,39 @@ def test_save_solution(utilities, grid, solution_path, hashes, tmp_path):
 
     assert hashes["tests.test_utilities.test_save_solution"] == file_hash, \
         "Hashes don't match"
+
+
+def test_save_grid_merges_walls(utilities, grid, tmp_path):
+    file_path = tmp_path / "test_save_grid.svg"
+    utilities.save_grid(grid, str(file_path))
+
+    # One line per run of collinear walls.
+    assert file_path.read_text().splitlines()[1] == (
+        '\t<path d="M1 1h45M16 31h15M1 46h45'
+        'M1 1v45M16 1v30M31 16v15M46 1v45"/>'
+    )
+
+
+def test_render_image(utilities, grid, solution_path):
+    image = utilities.render_image(grid)
+    assert image.shape == (47, 47, 3)
+    assert image.dtype == np.uint8
+
+    # The outer walls, the wall below (1, 1) and the inside of (0, 0).
+    assert (image[:2] == 0).all() and (image[:, -2:] == 0).all()
+    assert (image[30:32, 15:32] == 0).all()
+    assert (image[2:15, 2:15] == 255).all()
+
+    image = utilities.render_image(grid, solution_path)
+    assert (image[2:15, 2:15] == [165, 0, 38]).all()
+    assert (image[17:30, 17:30] == [0, 104, 55]).all()
+    assert (image[30:32, 15:32] == 0).all()
+
+
+def test_save_image(utilities, grid, solution_path, tmp_path):
+    file_path = tmp_path / "test_save_image.png"
+    utilities.save_image(grid, str(file_path), solution_path)
+
+    image = plt.imread(file_path)
+    assert np.array_equal(np.round(image * 255),
+                          utilities.render_image(grid, solution_path))
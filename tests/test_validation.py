@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from mazely import pack_grid
+from mazely.validation import validate_grid
+
+
+@pytest.mark.parametrize("packed", [False, True])
+def test_valid(grid, packed):
+    validate_grid(pack_grid(grid) if packed else grid, perfect=True)
+
+
+def test_mismatched_walls(grid):
+    grid = grid.copy()
+    grid[0, 1, 2] = True
+    with pytest.raises(ValueError, match=r"1 pairs .* east of \(0, 1\)"):
+        validate_grid(grid)
+    grid[0, 1, 2] = False
+    grid[1, 0, 1] = True
+    with pytest.raises(ValueError, match=r"south of \(1, 0\)"):
+        validate_grid(pack_grid(grid))
+
+
+def test_border(grid):
+    grid = grid.copy()
+    grid[2, 2, 1] = grid[1, 2, 2] = False
+    with pytest.raises(ValueError, match=r"2 walls .* south of \(2, 2\)"):
+        validate_grid(grid)
+
+
+def test_connected(grid):
+    grid = grid.copy()
+    grid[0, 1, 1] = grid[1, 1, 0] = True
+    with pytest.raises(ValueError, match="2 separate groups"):
+        validate_grid(grid)
+    validate_grid(grid, connected=False)
+
+
+def test_perfect(grid):
+    grid = grid.copy()
+    grid[1, 1, 2] = grid[1, 2, 3] = False
+    validate_grid(grid)
+    with pytest.raises(ValueError, match="1 loops"):
+        validate_grid(grid, perfect=True)
+
+
+def test_every_problem():
+    grid = np.zeros((2, 2, 4), dtype=bool)
+    grid[0, 0, 1] = True
+    with pytest.raises(ValueError) as error:
+        validate_grid(grid, perfect=True)
+    assert str(error.value) == (
+        "The walls between 1 pairs of neighboring cells do not match, such "
+        "as south of (0, 0). 8 walls on the border are missing, such as "
+        "north of (0, 0). The passages form 1 loops."
+    )
+
+
+def test_maze_validate(maze):
+    maze.validate(perfect=True)
+    maze.remove_wall((1, 1), (1, 2))
+    maze.validate()
+    with pytest.raises(ValueError, match="loops"):
+        maze.validate(perfect=True)
+    maze.add_wall((0, 0), (1, 0))
+    with pytest.raises(ValueError, match="2 separate groups"):
+        maze.validate()
+    maze.goal = {(3, 0)}
+    with pytest.raises(ValueError, match=r"Cell \(3, 0\) is out of range."):
+        maze.validate(connected=False)